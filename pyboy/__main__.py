@@ -74,6 +74,12 @@ parser.add_argument("-s", "--scale", default=defaults["scale"], type=int, help="
 parser.add_argument("--disable-renderer", action="store_true", help="Disables screen rendering for higher performance")
 parser.add_argument("--sound", action="store_true", help="Enable sound (beta)")
 parser.add_argument("--dmg", action="store_true", help="run emulator as DMG")
+parser.add_argument(
+    "--boot-cache",
+    type=str,
+    default=None,
+    help="Directory to cache the state after the boot-ROM in, to skip running it on later starts"
+)
 
 
 for arguments in parser_arguments():
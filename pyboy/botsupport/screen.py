@@ -77,6 +77,8 @@ class Screen:
         bytes:
             92160 bytes of screen data in a `bytes` object.
         """
+        # Frames skipped by `pyboy.PyBoy.set_frameskip` are rendered, when they are read
+        self.mb.render_skipped()
         return self.mb.renderer._screenbuffer_raw.tobytes()
 
     def raw_screen_buffer_dims(self):
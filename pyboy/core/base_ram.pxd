@@ -0,0 +1,28 @@
+#
+# License: See LICENSE.md file
+# GitHub: https://github.com/Baekalfen/PyBoy
+#
+
+import cython
+from libc.stdint cimport uint8_t, uint16_t
+from pyboy.utils cimport IntIOInterface
+
+cdef int WRAM_BANK_SIZE, IO_SIZE, HRAM_SIZE, NOT_USABLE_SIZE
+
+
+cdef class RAM:
+    cdef uint8_t[:] memory
+    cdef uint8_t[:, :] wram
+    cdef uint8_t[:] io
+    cdef uint8_t[:] hram
+    cdef uint8_t[:] interrupt
+    cdef uint8_t[:] not_usable
+    cdef int wram_size, wram_offset
+
+    cdef uint8_t read(self, uint16_t)
+    cdef void write(self, uint16_t, uint8_t)
+    cdef int active_wram_bank(self)
+    cdef void switch_wram_bank(self, uint8_t)
+
+    cdef void save_state(self, IntIOInterface)
+    cdef void load_state(self, IntIOInterface, int)
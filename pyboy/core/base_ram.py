@@ -1,123 +1,88 @@
 import array
 
+try:
+    from cython import compiled
+    cythonmode = compiled
+except ImportError:
+    cythonmode = False
+
+WRAM_BANK_SIZE = 4096
+IO_SIZE = 0x80 # FF00-FF7F
+HRAM_SIZE = 0x7F # FF80-FFFE
+NOT_USABLE_SIZE = 0x60 # FEA0-FEFF
+
 # This class should never be initialized.
 # use sub classes dmg_ram or cgb_ram
 class RAM:
-    def __init__(self, random=False):
+    def __init__(self, random=False, wram_banks=2):
         if random:
             raise Exception("Random RAM not implemented")
 
-        self.wram = []
-        for i in range(2): # 2 banks
-            self.wram.append(array.array("B", [0]*4096))
-        
-        self.io         = array.array("B", [0]*0x80) # FF00-FF80
-        self.hram       = array.array("B", [0]*0x7f) # FF80-FFFF
-        self.interrupt  = array.array("B", [0]*0x1 ) # FFFF-FFFF
-        self.not_usable = array.array("B", [0]*0x60)
+        # All of the internal RAM is kept in one buffer: The WRAM banks, the I/O registers, HRAM and the interrupt
+        # enable register (in the same order as 0xFF00-0xFFFF) and last the unusable area. The attributes below are
+        # views into it.
+        self.wram_size = wram_banks * WRAM_BANK_SIZE
+        memory = memoryview(array.array("B", [0] * (self.wram_size + IO_SIZE + HRAM_SIZE + 1 + NOT_USABLE_SIZE)))
+        self.memory = memory
+        if cythonmode:
+            self.wram = memory[:self.wram_size].cast("B", shape=(wram_banks, WRAM_BANK_SIZE))
+        else:
+            self.wram = [memory[i:i + WRAM_BANK_SIZE] for i in range(0, self.wram_size, WRAM_BANK_SIZE)]
+
+        offset = self.wram_size
+        self.io         = self.memory[offset:offset + IO_SIZE]
+        offset += IO_SIZE
+        self.hram       = self.memory[offset:offset + HRAM_SIZE]
+        offset += HRAM_SIZE
+        self.interrupt  = self.memory[offset:offset + 1]
+        offset += 1
+        self.not_usable = self.memory[offset:offset + NOT_USABLE_SIZE]
+
+        # Where the switchable bank at 0xD000 starts in 'memory'. It is only changed by writing SVBK on CGB.
+        self.wram_offset = WRAM_BANK_SIZE
 
-    #TODO: Finish read and write
-    def read(self, addr):    
-        if 0xC000 <= addr and addr < 0xE000:
-            return self.read_wram(addr)
-        elif 0xE000 <= addr and addr < 0xFE00:
-            # Redirect to actual ram
-            offset = 0x2000
-            return self.read_wram(addr-offset)
-        elif 0xFF00 <= addr and addr < 0xFF80:
-            offset = 0xFF00
-            return self.read_io(addr-offset)
-        elif 0xFEA0 <= addr and addr < 0xFF00:
-            offset = 0xFEA0
-            return self.not_usable[addr-offset]
-        elif 0xFF80 <= addr and addr < 0xFFFF:
-            offset = 0xFF80
-            return self.read_hram(addr-offset)
-        elif addr == 0xFFFF:
-            return self.read_interrupt()
+    def read(self, addr):
+        if 0xC000 <= addr < 0xFE00:
+            # 0xE000-0xFDFF is an echo of 0xC000-0xDDFF
+            addr &= 0x1FFF
+            if addr < WRAM_BANK_SIZE:
+                return self.memory[addr]
+            else:
+                return self.memory[self.wram_offset + addr - WRAM_BANK_SIZE]
+        elif 0xFF00 <= addr:
+            return self.memory[self.wram_size + addr - 0xFF00]
+        elif 0xFEA0 <= addr:
+            return self.not_usable[addr - 0xFEA0]
         else:
             raise Exception("Cannot read address {:x} from ram".format(addr))
-    
-    def read_wram(self, addr):
-        if 0xC000 <= addr and addr < 0xD000:
-            offset = 0xC000
-            return self.wram[0][addr-offset]
-        else:
-            offset = 0xD000
-            return self.wram[1][addr-offset] # only one bank in DMG
 
-    def read_io(self, addr):
-        return self.io[addr]
-    
-    def read_hram(self, addr):
-        return self.hram[addr]
-    
-    def read_interrupt(self):
-        return self.interrupt[0]
-    
     def write(self, addr, val):
-        if 0xC000 <= addr and addr < 0xE000:
-            #offset = 0xC000
-            self.write_wram(addr, val)
-        elif 0xE000 <= addr and addr < 0xFF00:
-            # Redirect to actual ram
-            offset = 0x2000
-            self.write_wram(addr-offset, val)
-        elif 0xFF00 <= addr and addr < 0xFF80:
-            offset = 0xFF00
-            self.write_io(addr-offset, val)
-        elif 0xFEA0 <= addr and addr < 0xFE00:
-            offset = 0xFEA0
-            self.not_usable[addr-offset] = val
-        elif 0xFF80 <= addr and addr < 0xFFFF:
-            offset = 0xFF80
-            self.write_hram(addr-offset, val)
-        elif addr == 0xFFFF:
-            self.write_interrupt(val)
+        if 0xC000 <= addr < 0xFE00:
+            addr &= 0x1FFF
+            if addr < WRAM_BANK_SIZE:
+                self.memory[addr] = val
+            else:
+                self.memory[self.wram_offset + addr - WRAM_BANK_SIZE] = val
+        elif 0xFF00 <= addr:
+            self.memory[self.wram_size + addr - 0xFF00] = val
+        elif 0xFEA0 <= addr:
+            self.not_usable[addr - 0xFEA0] = val
         else:
             raise Exception("Cannot write to %s in ram" % hex(addr))
-    
-    def write_wram(self, addr, val):
-        if 0xC000 <= addr and addr < 0xD000:
-            offset = 0xC000
-            self.wram[0][addr-offset] = val
-        else:
-            offset = 0xD000
-            self.wram[1][addr-offset] = val
-    
-    def write_io(self, addr, val):
-        self.io[addr] = val
 
-    def write_hram(self, addr, val):
-        self.hram[addr] = val
-    
-    def write_interrupt(self, val):
-        self.interrupt[0] = val
-    
+    def active_wram_bank(self):
+        return self.wram_offset // WRAM_BANK_SIZE
+
+    def switch_wram_bank(self, value):
+        pass # only one switchable bank in DMG
+
     ############################
     # State saving and loading #
     ############################
     def save_state(self, f):
-        # Save working ram
-        for bank in self.wram:
-            for byte in range(len(bank)):
-                f.write(bank[byte])
-        for byte in self.io:
-            f.write(byte)
-        for byte in self.hram:
-            f.write(byte)
-        for byte in self.interrupt:
-            f.write(byte)
-        
-    
+        # Working RAM, I/O, HRAM and the interrupt register follow each other in the buffer
+        f.write_buffer(self.memory[:self.wram_size + IO_SIZE + HRAM_SIZE + 1])
+
     def load_state(self, f, state_version): # Why state_version?
-        # Load working ram
-        for bank in self.wram:
-            for byte in range(len(bank)):
-                self.wram[byte] = f.read()
-        for byte in range(len(self.io)):
-            self.io[byte] = f.read()
-        for byte in range(len(self.hram)):
-            self.hram[byte] = f.read()
-        for byte in range(len(self.interrupt)):
-            self.interrupt[byte] = f.read()
\ No newline at end of file
+        f.read_buffer(self.memory[:self.wram_size + IO_SIZE + HRAM_SIZE + 1])
+        self.switch_wram_bank(self.io[0x70])
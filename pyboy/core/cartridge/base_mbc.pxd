@@ -3,6 +3,7 @@
 # GitHub: https://github.com/Baekalfen/PyBoy
 #
 
+import cython
 from pyboy.utils cimport IntIOInterface
 from pyboy.core.cartridge.rtc cimport RTC
 from libc.stdint cimport uint8_t, uint16_t, uint32_t
@@ -12,7 +13,7 @@ cdef class BaseMBC:
     cdef str gamename
     cdef uint8_t[:, :] rombanks
     # 16 is absoulte max. 8KB in each bank
-    cdef uint8_t[16][8 * 1024] rambanks
+    cdef uint8_t[:, :] rambanks
     cdef uint8_t carttype
     cdef bint battery
     cdef bint rtc_enabled
@@ -25,10 +26,18 @@ cdef class BaseMBC:
     cdef uint16_t rambank_selected
     cdef uint16_t rombank_selected
     cdef int is_cgb
+    # The banks currently visible, updated when a bank register is written
+    cdef int rombank0, rombank, rambank
+    cdef int rambank_read, rambank_write
+    cdef uint8_t[:] rombank0_view
+    cdef uint8_t[:] rombank_view
+    cdef uint8_t[:] rambank_view
 
     cdef void save_state(self, IntIOInterface)
     cdef void load_state(self, IntIOInterface, int)
+    @cython.locals(bank=int)
     cdef void save_ram(self, IntIOInterface)
+    @cython.locals(bank=int)
     cdef void load_ram(self, IntIOInterface)
     cdef void init_rambanks(self, uint8_t)
     cdef str getgamename(self, uint8_t[:,:])
@@ -36,7 +45,15 @@ cdef class BaseMBC:
     cdef uint8_t getitem(self, uint16_t)
     cdef void setitem(self, uint16_t, uint8_t)
     cdef void overrideitem(self, int, uint16_t, uint8_t)
+    cdef void update_banks(self)
+    cdef void select_banks(self)
+
+    cdef int active_rombank0(self)
+    cdef int active_rombank(self)
+    cdef int active_rambank_read(self)
+    cdef int active_rambank_write(self)
 
 
 cdef class ROMOnly(BaseMBC):
     cdef void setitem(self, uint16_t, uint8_t)
+    cdef void select_banks(self)
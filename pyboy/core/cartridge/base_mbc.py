@@ -13,6 +13,12 @@ from .rtc import RTC
 
 from pyboy.logger import logger
 
+try:
+    from cython import compiled
+    cythonmode = compiled
+except ImportError:
+    cythonmode = False
+
 
 class BaseMBC:
     def __init__(self, filename, rombanks, external_ram_count, carttype, sram, battery, rtc_enabled):
@@ -37,7 +43,7 @@ class BaseMBC:
         self.rambank_selected = 0
         self.rombank_selected = 1
 
-        self.is_cgb = self.getitem(0x0143) >> 7
+        self.is_cgb = rombanks[0][0x0143] >> 7
   
         if not os.path.exists(self.filename):
             logger.info("No RAM file found. Skipping.")
@@ -45,6 +51,8 @@ class BaseMBC:
             with open(self.filename, "rb") as f:
                 self.load_ram(IntIOWrapper(f))
 
+        self.update_banks()
+
     def stop(self):
         with open(self.filename, "wb") as f:
             self.save_ram(IntIOWrapper(f))
@@ -69,6 +77,7 @@ class BaseMBC:
         self.load_ram(f)
         if self.rtc_enabled:
             self.rtc.load_state(f, state_version)
+        self.update_banks()
 
     def save_ram(self, f):
         if not self.rambank_initialized:
@@ -76,8 +85,7 @@ class BaseMBC:
             return
 
         for bank in range(self.external_ram_count):
-            for byte in range(8 * 1024):
-                f.write(self.rambanks[bank][byte])
+            f.write_buffer(self.rambanks[bank])
 
         logger.debug("RAM saved.")
 
@@ -87,8 +95,7 @@ class BaseMBC:
             return
 
         for bank in range(self.external_ram_count):
-            for byte in range(8 * 1024):
-                self.rambanks[bank][byte] = f.read()
+            f.read_buffer(self.rambanks[bank])
 
         logger.debug("RAM loaded.")
 
@@ -100,7 +107,11 @@ class BaseMBC:
 
         # In real life the values in RAM are scrambled on initialization.
         # Allocating the maximum, as it is easier in Cython. And it's just 128KB...
-        self.rambanks = [array.array("B", [0] * (8*1024)) for _ in range(16)]
+        rambanks = array.array("B", [0] * (16*8*1024))
+        if cythonmode:
+            self.rambanks = memoryview(rambanks).cast("B", shape=(16, 8 * 1024))
+        else:
+            self.rambanks = [rambanks[i:i + 8*1024] for i in range(0, len(rambanks), 8*1024)]
 
     def getgamename(self, rombanks):
         return "".join([chr(x) for x in rombanks[0][0x0134:0x0142]]).rstrip("\0")
@@ -119,11 +130,14 @@ class BaseMBC:
             logger.error("Invalid override address: %s" % hex(address))
 
     def getitem(self, address):
-        if 0x0000 <= address < 0x4000:
-            return self.rombanks[0][address]
-        elif 0x4000 <= address < 0x8000:
-            return self.rombanks[self.rombank_selected % len(self.rombanks)][address - 0x4000]
+        if address < 0x4000:
+            return self.rombank0_view[address]
+        elif address < 0x8000:
+            return self.rombank_view[address - 0x4000]
         elif 0xA000 <= address < 0xC000:
+            if self.rambank_read != -1:
+                return self.rambank_view[address - 0xA000]
+
             if not self.rambank_initialized:
                 logger.error("RAM banks not initialized: %s" % hex(address))
 
@@ -133,10 +147,43 @@ class BaseMBC:
             if self.rtc_enabled and 0x08 <= self.rambank_selected <= 0x0C:
                 return self.rtc.getregister(self.rambank_selected)
             else:
-                return self.rambanks[self.rambank_selected % self.external_ram_count][address - 0xA000]
+                return self.rambank_view[address - 0xA000]
         else:
             logger.error("Reading address invalid: %s" % address)
 
+    def update_banks(self):
+        # Has to be called whenever a bank register is written. The visible banks are only worked out here, so a read
+        # is just an index into one of the views.
+        self.select_banks()
+        self.rombank0_view = self.rombanks[self.rombank0]
+        self.rombank_view = self.rombanks[self.rombank]
+        self.rambank_view = self.rambanks[self.rambank]
+
+    def select_banks(self):
+        self.rombank0 = 0
+        self.rombank = self.rombank_selected % self.external_rom_count
+        self.rambank = self.rambank_selected % self.external_ram_count
+        if not self.rambank_enabled or (self.rtc_enabled and 0x08 <= self.rambank_selected <= 0x0C):
+            self.rambank_read = -1
+        else:
+            self.rambank_read = self.rambank
+        self.rambank_write = -1
+
+    # The memory manager maps the cartridge directly into its page table. These report which banks are currently
+    # visible, so the table only has to be updated when a bank register is written. A RAM bank of -1 means, that
+    # the access has side effects (disabled RAM, RTC registers) and has to go through getitem/setitem.
+    def active_rombank0(self):
+        return self.rombank0
+
+    def active_rombank(self):
+        return self.rombank
+
+    def active_rambank_read(self):
+        return self.rambank_read
+
+    def active_rambank_write(self):
+        return self.rambank_write
+
     def __repr__(self):
         return "\n".join([
             "Cartridge:",
@@ -161,6 +208,7 @@ class ROMOnly(BaseMBC):
                 value = 1
             self.rombank_selected = (value & 0b1)
             logger.debug("Switching bank 0x%0.4x, 0x%0.2x" % (address, value))
+            self.update_banks()
         elif 0xA000 <= address < 0xC000:
             if self.rambanks is None:
                 from . import EXTERNAL_RAM_TABLE
@@ -170,6 +218,10 @@ class ROMOnly(BaseMBC):
                     "precaution" % (value, address, EXTERNAL_RAM_TABLE[0x02])
                 )
                 self.init_rambanks(EXTERNAL_RAM_TABLE[0x02])
-            self.rambanks[self.rambank_selected][address - 0xA000] = value
+            self.rambank_view[address - 0xA000] = value
         else:
             logger.warning("Unexpected write to 0x%0.4x, value: 0x%0.2x" % (address, value))
+
+    def select_banks(self):
+        BaseMBC.select_banks(self)
+        self.rambank_write = self.rambank
@@ -4,7 +4,7 @@
 #
 
 import logging
-from array import array
+import mmap
 
 from .base_mbc import ROMOnly
 from .mbc1 import MBC1
@@ -53,8 +53,10 @@ def validate_checksum(rombanks):
 
 
 def load_romfile(filename):
+    # The ROM is mapped instead of read, so every instance running the same ROM shares its pages. The mapping is
+    # copy-on-write: override_memory_value only makes a private copy of the page it changes, and never touches the file.
     with open(filename, "rb") as romfile:
-        romdata = array("B", romfile.read())
+        romdata = mmap.mmap(romfile.fileno(), 0, access=mmap.ACCESS_COPY)
 
     logger.debug(f"Loading ROM file: {len(romdata)} bytes")
     banksize = 16 * 1024
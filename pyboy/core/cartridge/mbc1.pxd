@@ -9,5 +9,6 @@ from .base_mbc cimport BaseMBC
 
 cdef class MBC1(BaseMBC):
     cdef void setitem(self, uint16_t, uint8_t)
+    cdef void select_banks(self)
     cdef uint8_t bank_select_register1
     cdef uint8_t bank_select_register2
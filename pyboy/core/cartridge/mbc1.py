@@ -12,13 +12,15 @@ logger = logging.getLogger(__name__)
 
 class MBC1(BaseMBC):
     def __init__(self, *args, **kwargs):
-        super().__init__(*args, **kwargs)
+        # Set before the base class selects the initial banks
         self.bank_select_register1 = 1
         self.bank_select_register2 = 0
+        super().__init__(*args, **kwargs)
 
     def setitem(self, address, value):
         if 0x0000 <= address < 0x2000:
             self.rambank_enabled = (value & 0b00001111) == 0b1010
+            self.update_banks()
         elif 0x2000 <= address < 0x4000:
             value &= 0b00011111
             # The register cannot contain zero (0b00000) and will be initialized as 0b00001
@@ -26,10 +28,13 @@ class MBC1(BaseMBC):
             if value == 0:
                 value = 1
             self.bank_select_register1 = value
+            self.update_banks()
         elif 0x4000 <= address < 0x6000:
             self.bank_select_register2 = value & 0b11
+            self.update_banks()
         elif 0x6000 <= address < 0x8000:
             self.memorymodel = value & 0b1
+            self.update_banks()
         elif 0xA000 <= address < 0xC000:
             if self.rambanks is None:
                 logger.warning(
@@ -40,36 +45,26 @@ class MBC1(BaseMBC):
                 self.init_rambanks(self.external_ram_count)
 
             if self.rambank_enabled:
-                self.rambank_selected = self.bank_select_register2 if self.memorymodel == 1 else 0
-                self.rambanks[self.rambank_selected % self.external_ram_count][address - 0xA000] = value
+                self.rambank_view[address - 0xA000] = value
         else:
             logger.error("Invalid writing address: %s" % hex(address))
 
-    def getitem(self, address):
-        if 0x0000 <= address < 0x4000:
-            if self.memorymodel == 1:
-                self.rombank_selected = (self.bank_select_register2 << 5) % self.external_rom_count
-            else:
-                self.rombank_selected = 0
-            return self.rombanks[self.rombank_selected][address]
-        elif 0x4000 <= address < 0x8000:
-            self.rombank_selected = \
-                    (self.bank_select_register2 << 5) % self.external_rom_count | self.bank_select_register1
-            return self.rombanks[self.rombank_selected % len(self.rombanks)][address - 0x4000]
-        elif 0xA000 <= address < 0xC000:
-            if not self.rambank_initialized:
-                logger.error("RAM banks not initialized: %s" % hex(address))
-
-            if not self.rambank_enabled:
-                return 0xFF
-
-            if self.memorymodel == 1:
-                self.rambank_selected = self.bank_select_register2
-            else:
-                self.rambank_selected = 0
-            return self.rambanks[self.rambank_selected % self.external_ram_count][address - 0xA000]
+    def select_banks(self):
+        if self.memorymodel == 1:
+            self.rombank0 = (self.bank_select_register2 << 5) % self.external_rom_count
+            self.rambank = self.bank_select_register2 % self.external_ram_count
+        else:
+            self.rombank0 = 0
+            self.rambank = 0
+        self.rombank = ((self.bank_select_register2 << 5) % self.external_rom_count
+                        | self.bank_select_register1) % self.external_rom_count
+        self.rombank_selected = (self.bank_select_register2 << 5) | self.bank_select_register1
+        self.rambank_selected = self.rambank
+        if self.rambank_enabled:
+            self.rambank_read = self.rambank
         else:
-            logger.error("Reading address invalid: %s" % address)
+            self.rambank_read = -1
+        self.rambank_write = self.rambank_read
 
     def save_state(self, f):
         # Cython doesn't like super()
@@ -87,3 +82,4 @@ class MBC1(BaseMBC):
             self.bank_select_register1 = self.rombank_selected & 0b00011111
             self.bank_select_register2 = (self.rombank_selected & 0b01100000) >> 5
             self.rambank_selected = self.bank_select_register2
+        self.update_banks()
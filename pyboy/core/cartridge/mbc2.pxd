@@ -8,4 +8,6 @@ from .base_mbc cimport BaseMBC
 
 
 cdef class MBC2(BaseMBC):
+    cdef uint8_t getitem(self, uint16_t)
     cdef void setitem(self, uint16_t, uint8_t)
+    cdef void select_banks(self)
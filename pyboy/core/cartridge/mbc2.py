@@ -20,6 +20,7 @@ class MBC2(BaseMBC):
                 if value == 0:
                     value = 1
                 self.rombank_selected = value
+            self.update_banks()
         elif 0xA000 <= address < 0xC000:
             if self.rambanks is None:
                 logger.warning(
@@ -35,11 +36,7 @@ class MBC2(BaseMBC):
             logger.error("Unexpected write to 0x%0.4x, value: 0x%0.2x" % (address, value))
 
     def getitem(self, address):
-        if 0x0000 <= address < 0x4000:
-            return self.rombanks[0][address]
-        elif 0x4000 <= address < 0x8000:
-            return self.rombanks[self.rombank_selected % len(self.rombanks)][address - 0x4000]
-        elif 0xA000 <= address < 0xC000:
+        if 0xA000 <= address < 0xC000:
             if not self.rambank_initialized:
                 logger.error("RAM banks not initialized: %s" % hex(address))
 
@@ -47,6 +44,12 @@ class MBC2(BaseMBC):
                 return 0xFF
 
             else:
-                return self.rambanks[0][address % 512] | 0b11110000
+                return self.rambank_view[address % 512] | 0b11110000
         else:
-            logger.error("Reading address invalid: %s" % address)
+            # Cython doesn't like super()
+            return BaseMBC.getitem(self, address)
+
+    def select_banks(self):
+        BaseMBC.select_banks(self)
+        # The 4-bit RAM is mirrored and has its upper bits forced high on read
+        self.rambank_read = -1
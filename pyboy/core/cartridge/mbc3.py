@@ -23,13 +23,16 @@ class MBC3(BaseMBC):
                 # disables RAM."
                 self.rambank_enabled = False
                 logger.warning("Unexpected command for MBC3: Address: 0x%0.4x, Value: 0x%0.2x" % (address, value))
+            self.update_banks()
         elif 0x2000 <= address < 0x4000:
             value &= 0b01111111
             if value == 0:
                 value = 1
             self.rombank_selected = value
+            self.update_banks()
         elif 0x4000 <= address < 0x6000:
             self.rambank_selected = value
+            self.update_banks()
         elif 0x6000 <= address < 0x8000:
             if self.rtc_enabled:
                 self.rtc.writecommand(value)
@@ -47,3 +50,8 @@ class MBC3(BaseMBC):
                     logger.error("Invalid RAM bank selected: 0x%0.2x" % self.rambank_selected)
         else:
             logger.error("Invalid writing address: 0x%0.4x" % address)
+
+    def select_banks(self):
+        BaseMBC.select_banks(self)
+        if self.rambank_enabled and self.rambank_selected <= 0x03:
+            self.rambank_write = self.rambank_selected
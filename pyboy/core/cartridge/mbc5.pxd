@@ -9,3 +9,4 @@ from .base_mbc cimport BaseMBC
 
 cdef class MBC5(BaseMBC):
     cdef void setitem(self, uint16_t, uint8_t)
+    cdef void select_banks(self)
@@ -0,0 +1,75 @@
+#
+# License: See LICENSE.md file
+# GitHub: https://github.com/Baekalfen/PyBoy
+#
+
+import cython
+from libc.stdint cimport uint8_t, uint16_t, uint32_t
+from pyboy.core cimport lcd
+from pyboy.utils cimport IntIOInterface
+
+cdef int PALETTE_MEM_MAX_INDEX, NUM_PALETTES, NUM_COLORS
+
+
+cdef class cgbLCD(lcd.LCD):
+    cdef uint8_t[:] VRAM1
+    cdef uint32_t[:] sprite_palette_mem
+    cdef uint32_t[:] bg_palette_mem
+
+    cdef VBKregister vbk
+    cdef PaletteIndexRegister bcps
+    cdef PaletteColorRegister bcpd
+    cdef PaletteIndexRegister ocps
+    cdef PaletteColorRegister ocpd
+
+    cdef void setVRAM(self, uint16_t, uint8_t)
+    cdef void mark_tile(self, uint16_t)
+    @cython.locals(i_off=int)
+    cdef uint8_t getVRAM(self, uint16_t, bint offset=*)
+    @cython.locals(i_off=int)
+    cdef uint8_t getVRAMbank(self, uint16_t, int, bint offset=*)
+
+    @cython.locals(n=int)
+    cdef void save_state(self, IntIOInterface)
+    @cython.locals(n=int)
+    cdef void load_state(self, IntIOInterface, int)
+
+
+cdef class VBKregister:
+    cdef int active_bank
+
+    @cython.locals(bank=int)
+    cdef void set(self, uint8_t)
+    cdef uint8_t get(self)
+    cdef void _switch_bank(self, int)
+
+
+cdef class PaletteIndexRegister:
+    # Kept as int, as auto-increment can carry past 8 bits before wrapping the index
+    cdef int value
+    cdef int auto_inc
+    cdef int index
+    cdef int hl
+
+    cdef void set(self, int)
+    cdef int get(self)
+    cdef int getindex(self)
+    cdef int gethl(self)
+    cdef void _inc_index(self)
+    @cython.locals(new_val=int)
+    cdef void shouldincrement(self)
+
+
+cdef class PaletteColorRegister:
+    cdef uint32_t[:] palette_mem
+    cdef PaletteIndexRegister index_reg
+
+    @cython.locals(hl=int, i_val=uint32_t)
+    cdef void set(self, uint8_t)
+    cdef uint32_t get(self)
+    @cython.locals(i=int, color=uint32_t, cgb_col=uint32_t)
+    cdef uint32_t getcolor(self, int, int)
+    @cython.locals(mask=uint32_t)
+    cdef uint32_t _cgbcolor(self, uint32_t)
+    @cython.locals(color_mask=uint32_t, red=uint32_t, green=uint32_t, blue=uint32_t, final_color=uint32_t)
+    cdef uint32_t _convert15bitcol(self, uint32_t)
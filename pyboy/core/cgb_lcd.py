@@ -35,6 +35,13 @@ class cgbLCD(lcd.LCD):
             if i < 0x9800:
                 self.renderer.tiles_changed1.add(i & 0xFFF0)
 
+    def mark_tile(self, i):
+        if i < 0x9800:
+            if self.vbk.active_bank == 0:
+                self.renderer.tiles_changed0.add(i & 0xFFF0)
+            else:
+                self.renderer.tiles_changed1.add(i & 0xFFF0)
+
     def getVRAM(self, i, offset = True):
         i_off = 0x8000 if offset else 0x0
         if self.vbk.active_bank == 0:
@@ -49,6 +56,35 @@ class cgbLCD(lcd.LCD):
         else:
             return self.VRAM1[i - i_off]
 
+    def save_state(self, f):
+        lcd.LCD.save_state(self, f)
+        f.write_buffer(self.VRAM1)
+        # Each color is 2 bytes
+        for n in range(NUM_PALETTES * NUM_COLORS):
+            f.write_16bit(self.bg_palette_mem[n])
+        for n in range(NUM_PALETTES * NUM_COLORS):
+            f.write_16bit(self.sprite_palette_mem[n])
+
+        f.write(self.vbk.active_bank)
+        # The index registers only depend on the lower 8 bits, even after auto-incrementing past them
+        f.write(self.bcps.value & 0xFF)
+        f.write(self.ocps.value & 0xFF)
+
+    def load_state(self, f, state_version):
+        lcd.LCD.load_state(self, f, state_version)
+        if state_version < 6:
+            # Older states didn't include the CGB registers
+            return
+        f.read_buffer(self.VRAM1)
+        for n in range(NUM_PALETTES * NUM_COLORS):
+            self.bg_palette_mem[n] = f.read_16bit()
+        for n in range(NUM_PALETTES * NUM_COLORS):
+            self.sprite_palette_mem[n] = f.read_16bit()
+
+        self.vbk.set(f.read())
+        self.bcps.set(f.read())
+        self.ocps.set(f.read())
+
 class VBKregister:
     def __init__(self, value=0):
         self.active_bank = value
@@ -155,7 +191,3 @@ class PaletteColorRegister:
         
         final_color = (red << 16) | (green << 8) | blue
         return final_color
-
-
-
-#load save functions
\ No newline at end of file
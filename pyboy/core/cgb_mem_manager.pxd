@@ -0,0 +1,41 @@
+#
+# License: See LICENSE.md file
+# GitHub: https://github.com/Baekalfen/PyBoy
+#
+
+import cython
+from libc.stdint cimport uint8_t, uint16_t
+from pyboy.core cimport mem_manager
+from pyboy.core.cgb_lcd cimport cgbLCD
+from pyboy.utils cimport IntIOInterface
+
+cdef int IO_KEY1, IO_VBK, IO_BCPS, IO_BCPD, IO_OCPS, IO_OCPD, IO_SVBK, IO_HDMA, IO_HDMA5
+cdef list CGB_IO
+
+cdef class CgbMemoryManager(mem_manager.MemoryManager):
+    cdef int hdma1, hdma2, hdma3, hdma4, hdma5
+    cdef bint transfer_active
+    cdef int curr_src, curr_dst
+    cdef uint8_t key1
+
+    @cython.locals(cgblcd=cgbLCD)
+    cdef list make_vrampages(self)
+    @cython.locals(cgblcd=cgbLCD)
+    cdef void map_vram(self)
+    @cython.locals(cgblcd=cgbLCD)
+    cdef uint8_t get_cgb_io(self, uint8_t, uint16_t)
+    @cython.locals(cgblcd=cgbLCD)
+    cdef void set_cgb_io(self, uint8_t, uint16_t, uint8_t)
+
+    cdef void set_key1(self, uint8_t)
+    cdef uint8_t get_key1(self)
+    @cython.locals(bit0=uint8_t)
+    cdef void switch_speed(self)
+    @cython.locals(bytes_to_transfer=int, src=int, dst=int, transfer_type=int)
+    cdef void set_hdma5(self, uint8_t)
+    @cython.locals(src=int, dst=int)
+    cdef void do_potential_transfer(self)
+    cdef uint8_t get_hdma(self, uint16_t)
+    cdef void set_hdma(self, uint16_t, uint8_t)
+    cdef void save_state(self, IntIOInterface)
+    cdef void load_state(self, IntIOInterface, int)
@@ -1,8 +1,26 @@
 from . import mem_manager
 
+# Handlers of the CGB registers, following the ones of MemoryManager
+IO_KEY1, IO_VBK, IO_BCPS, IO_BCPD, IO_OCPS, IO_OCPD, IO_SVBK, IO_HDMA, IO_HDMA5 = range(0x20, 0x29)
+
+CGB_IO = [
+    (0xFF4D, IO_KEY1, IO_KEY1),
+    (0xFF4F, IO_VBK, IO_VBK),
+    (0xFF51, IO_HDMA, IO_HDMA),
+    (0xFF52, IO_HDMA, IO_HDMA),
+    (0xFF53, IO_HDMA, IO_HDMA),
+    (0xFF54, IO_HDMA, IO_HDMA),
+    (0xFF55, IO_HDMA, IO_HDMA5),
+    (0xFF68, IO_BCPS, IO_BCPS),
+    (0xFF69, IO_BCPD, IO_BCPD),
+    (0xFF6A, IO_OCPS, IO_OCPS),
+    (0xFF6B, IO_OCPD, IO_OCPD),
+    (0xFF70, IO_SVBK, IO_SVBK),
+]
+
 class CgbMemoryManager(mem_manager.MemoryManager):
     def __init__(self, mb, bootrom, cartridge, lcd, timer, sound, ram, renderer):
-        super().__init__(mb, bootrom, cartridge, lcd, timer, sound, ram, renderer)
+        mem_manager.MemoryManager.__init__(self, mb, bootrom, cartridge, lcd, timer, sound, ram, renderer)
 
         self.hdma1 = 0
         self.hdma2 = 0
@@ -15,131 +33,63 @@ class CgbMemoryManager(mem_manager.MemoryManager):
         self.curr_dst = 0
 
         self.key1 = 0
-        self.is_double_speed = False
+
+        self.map_io(CGB_IO)
+
+    def make_vrampages(self):
+        cgblcd = self.lcd
+        return [mem_manager.make_pages(cgblcd.VRAM0), mem_manager.make_pages(cgblcd.VRAM1)]
+
+    def map_vram(self):
+        cgblcd = self.lcd
+        self.map_vrampages(cgblcd.vbk.active_bank)
     
-    def get_io(self, addr):
-        #print("%3s %6s" % ("get", hex(addr)))
-        if addr == 0xFF04:
-            return self.timer.DIV
-        elif addr == 0xFF05:
-            return self.timer.TIMA
-        elif addr == 0xFF06:
-            return self.timer.TMA
-        elif addr == 0xFF07:
-            return self.timer.TAC
-        elif 0xFF10 <= addr < 0xFF40:
-            if self.mb.sound_enabled:
-                return self.sound.get(addr - 0xFF10)
-            else:
-                return 0
-        elif addr == 0xFF40:
-            return self.lcd.LCDC.value
-        elif addr == 0xFF42:
-            return self.lcd.SCY
-        elif addr == 0xFF43:
-            return self.lcd.SCX
-        elif addr == 0xFF47:
-            return self.lcd.BGP.value
-        elif addr == 0xFF48:
-            return self.lcd.OBP0.value
-        elif addr == 0xFF49:
-            return self.lcd.OBP1.value
-        elif addr == 0xFF4A:
-            return self.lcd.WY
-        elif addr == 0xFF4B:
-            return self.lcd.WX
-        # CGB registers
-        elif addr == 0xFF4D:
+    def get_cgb_io(self, handler, addr):
+        cgblcd = self.lcd
+        if handler == IO_KEY1:
             return self.get_key1()
-        elif addr == 0xFF4F:
-            return self.lcd.vbk.get()
-        elif addr == 0xFF68:
-            return self.lcd.bcps.get() | 0x40
-        elif addr == 0xFF69:
-            return self.lcd.bcpd.get() 
-        elif addr == 0xFF6A:
-            return self.lcd.ocps.get() | 0x40
-        elif addr == 0xFF6B:
-            return self.lcd.ocpd.get()
-        elif addr == 0xFF70:
-            return self.ram.read(addr)
-        elif 0xFF51 <= addr <= 0xFF55:
+        elif handler == IO_VBK:
+            return cgblcd.vbk.get()
+        elif handler == IO_BCPS:
+            return cgblcd.bcps.get() | 0x40
+        elif handler == IO_BCPD:
+            return cgblcd.bcpd.get()
+        elif handler == IO_OCPS:
+            return cgblcd.ocps.get() | 0x40
+        elif handler == IO_OCPD:
+            return cgblcd.ocpd.get()
+        elif handler == IO_HDMA:
             return self.get_hdma(addr)
         else:
-            return self.ram.read(addr)
-
-    def set_io(self, addr, value):
-        #print("%3s %6s %3s" % ("set", hex(addr), hex(value)))
-        if addr == 0xFF00:
-            self.ram.write(addr, self.mb.interaction.pull(value))
-        elif addr == 0xFF01:
-            self.mb.serialbuffer += chr(value)
-            self.ram.write(addr, value)
-        elif addr == 0xFF04:
-            self.timer.DIV = 0
-        elif addr == 0xFF05:
-            self.timer.TIMA = value
-        elif addr == 0xFF06:
-            self.timer.TMA = value
-        elif addr == 0xFF07:
-            self.timer.TAC = value & 0b111
-        elif 0xFF10 <= addr < 0xFF40:
-            if self.mb.sound_enabled:
-                self.sound.set(addr - 0xFF10, value)
-        elif addr == 0xFF40:
-            self.lcd.LCDC.set(value)
-        elif addr == 0xFF42:
-            self.lcd.SCY = value
-        elif addr == 0xFF43:
-            self.lcd.SCX = value
-        elif addr == 0xFF46:
-            self.transfer_DMA(value)
-        elif addr == 0xFF47:
-            if self.mb.cartridge.is_cgb:
-                self.lcd.BGP.set(value)
-            else:
-                self.renderer.clearcache |= self.lcd.BGP.set(value)
-        elif addr == 0xFF48:
-            if self.mb.cartridge.is_cgb:
-                self.lcd.OBP0.set(value)
-            else:
-                self.renderer.clearcache |= self.lcd.OBP0.set(value)
-        elif addr == 0xFF49:
-            if self.mb.cartridge.is_cgb:
-                self.lcd.OBP1.set(value)
-            else:
-                self.renderer.clearcache |= self.lcd.OBP1.set(value)
-
-        elif addr == 0xFF4A:
-            self.lcd.WY = value
-        elif addr == 0xFF4B:
-            self.lcd.WX = value
-        elif addr == 0xFF50 and self.mb.bootrom_enabled and (value == 0x1 or value == 0x11):
-            self.mb.bootrom_enabled = False
-            self.ram.write(addr, value)
-        # CGB registers
-        elif addr == 0xFF4D:
+            return self.ram.io[addr - 0xFF00]
+
+    def set_cgb_io(self, handler, addr, value):
+        cgblcd = self.lcd
+        if handler == IO_KEY1:
             self.set_key1(value)
-        elif addr == 0xFF4F:
-            self.lcd.vbk.set(value)
-        elif addr == 0xFF68:
-            self.lcd.bcps.set(value)
-        elif addr == 0xFF69:
-            self.lcd.bcpd.set(value)
-            self.renderer.clearcache = True 
-        elif addr == 0xFF6A:
-            self.lcd.ocps.set(value)
-        elif addr == 0xFF6B:
-            self.lcd.ocpd.set(value)        
-            self.renderer.clearcache = True 
-        elif addr == 0xFF70:
-            self.ram.write(addr, value)
-        elif 0xFF51 <= addr <= 0xFF54:
+        elif handler == IO_VBK:
+            cgblcd.vbk.set(value)
+            self.map_vram()
+        elif handler == IO_BCPS:
+            cgblcd.bcps.set(value)
+        elif handler == IO_BCPD:
+            cgblcd.bcpd.set(value)
+            self.renderer.palettes_changed = True
+        elif handler == IO_OCPS:
+            cgblcd.ocps.set(value)
+        elif handler == IO_OCPD:
+            cgblcd.ocpd.set(value)
+            self.renderer.palettes_changed = True
+        elif handler == IO_SVBK:
+            self.ram.io[addr - 0xFF00] = value
+            self.ram.switch_wram_bank(value)
+            self.map_wram()
+        elif handler == IO_HDMA:
             self.set_hdma(addr, value)
-        elif addr == 0xFF55:
+        elif handler == IO_HDMA5:
             self.set_hdma5(value)
         else:
-            self.ram.write(addr, value)
+            self.ram.io[addr - 0xFF00] = value
 
     def set_key1(self, value):
         self.key1 = value & 0xFF
@@ -174,8 +124,7 @@ class CgbMemoryManager(mem_manager.MemoryManager):
             transfer_type = value >> 7
             if transfer_type == 0:
                 # General purpose DMA transfer
-                for i in range(bytes_to_transfer):
-                    self.setitem(dst + i, self.getitem(src + i))
+                self.transfer_VRAM(dst, src, bytes_to_transfer)
                 self.hdma5 = 0xFF
                 self.hdma4 = 0xFF
                 self.hdma3 = 0xFF
@@ -195,8 +144,7 @@ class CgbMemoryManager(mem_manager.MemoryManager):
             src = self.curr_src & 0xFFF0
             dst = (self.curr_dst & 0x1FF0) | 0x8000
 
-            for i in range(0x10):
-                self.setitem(dst + i, self.getitem(src + i))
+            self.transfer_VRAM(dst, src, 0x10)
 
             self.curr_dst += 0x10
             self.curr_src += 0x10
@@ -236,3 +184,30 @@ class CgbMemoryManager(mem_manager.MemoryManager):
             self.hdma3 = value
         elif reg == 0xFF54:
             self.hdma4 = value
+
+    def save_state(self, f):
+        f.write(self.key1)
+        f.write(self.is_double_speed)
+
+        # The HDMA source and destination are kept as 16-bit values while a transfer is running
+        f.write_16bit(self.hdma1)
+        f.write_16bit(self.hdma2)
+        f.write_16bit(self.hdma3)
+        f.write_16bit(self.hdma4)
+        f.write(self.hdma5)
+        f.write(self.transfer_active)
+        f.write_16bit(self.curr_src)
+        f.write_16bit(self.curr_dst)
+
+    def load_state(self, f, state_version):
+        self.key1 = f.read()
+        self.is_double_speed = f.read()
+
+        self.hdma1 = f.read_16bit()
+        self.hdma2 = f.read_16bit()
+        self.hdma3 = f.read_16bit()
+        self.hdma4 = f.read_16bit()
+        self.hdma5 = f.read()
+        self.transfer_active = f.read()
+        self.curr_src = f.read_16bit()
+        self.curr_dst = f.read_16bit()
@@ -0,0 +1,13 @@
+#
+# License: See LICENSE.md file
+# GitHub: https://github.com/Baekalfen/PyBoy
+#
+
+import cython
+from libc.stdint cimport uint8_t, uint16_t
+from pyboy.core cimport base_ram
+
+
+cdef class CgbRam(base_ram.RAM):
+    @cython.locals(bank=int)
+    cdef void switch_wram_bank(self, uint8_t)
@@ -0,0 +1,96 @@
+#
+# License: See LICENSE.md file
+# GitHub: https://github.com/Baekalfen/PyBoy
+#
+
+import cython
+from cpython.array cimport array
+from libc.stdint cimport uint8_t, uint16_t, uint32_t
+from pyboy.core.lcd cimport LCD
+from pyboy.core.cgb_lcd cimport cgbLCD
+from pyboy.core cimport renderer
+
+cdef int ROWS, COLS
+
+
+cdef class CGBRenderer(renderer.Renderer):
+    cdef array _col_index0_raw, _col_index1_raw
+    cdef uint8_t[:,:] _col_index0, _col_index1
+
+    cdef uint8_t[144][160] _col_i
+    cdef uint8_t[144][160] _bg_priority
+
+    @cython.locals(
+        cgblcd=cgbLCD,
+        y=int,
+        x=int,
+        wmap=int,
+        background_offset=int,
+        bx=int,
+        by=int,
+        wx=int,
+        wy=int,
+        tile_data_select=int,
+        bgmap_select=int,
+        wmap_select=int,
+        window_enable=int,
+        index=int,
+        wt=int,
+        bt=int,
+        offset=int,
+        attributes=uint8_t,
+        palette=int,
+        vbank=int,
+        horiflip=int,
+        vertflip=int,
+        bgpriority=int,
+        xx=int,
+        yy=int,
+        col=uint8_t,
+    )
+    cpdef void render_screen(self, LCD)
+
+    @cython.locals(
+        y=int,
+        x=int,
+        spriteheight=int,
+        i=int,
+        n=int,
+        tileindex=int,
+        attributes=int,
+        xflip=bint,
+        yflip=bint,
+        OAMbgpriority=bint,
+        spritecache=uint8_t[:,:],
+        palette=int,
+        dx=int,
+        yy=int,
+        xx=int,
+        pixel=uint32_t,
+        use_priority_flags=bint,
+        bgmappriority=bint,
+        col=int,
+    )
+    cdef void render_sprites(self, LCD, uint32_t[:,:], bint)
+
+    @cython.locals(cgblcd=cgbLCD)
+    cdef void update_cache(self, LCD)
+
+    @cython.locals(cgblcd=cgbLCD, p=int, colorcode=int)
+    cdef void update_palettes(self, LCD)
+
+    @cython.locals(
+        col_index=uint8_t[:,:],
+        t=int,
+        k=int,
+        y=int,
+        x=int,
+        byte1=int,
+        byte2=int,
+    )
+    cdef void update_tiles(self, cgbLCD, set, int)
+
+    @cython.locals(x=int)
+    cdef void clear_cache(self)
+
+    cdef uint32_t convert_to_rgba(self, uint32_t)
@@ -1,6 +1,6 @@
-from pyboy.utils import color_code
 from array import array
-from ctypes import c_void_p
+
+from . import numpy_renderer, renderer
 
 ROWS, COLS = 144, 160
 
@@ -10,108 +10,48 @@ try:
 except ImportError:
     cythonmode = False
 
-class CGBRenderer:
+class CGBRenderer(renderer.Renderer):
     def __init__(self):
-        self.alphamask = 0xFF
-        
-        self.color_format = "RGBA"
-
-        self.buffer_dims = (ROWS, COLS)
-
-        self.clearcache = False
-        self.tiles_changed0 = set([])
-        self.tiles_changed1 = set([])
+        # The DMG palette is only used for blanking the screen, which is white on CGB as well
+        renderer.Renderer.__init__(self, (0xFFFFFF, 0x999999, 0x555555, 0x000000))
 
         tiles_bank = 384
-        
-        # Init buffers as white
-        # *4 because palettes are 4 colors?
-        # 1 tile-/spritecache for each bank
-        self._screenbuffer_raw = array("B", [0xFF] * (ROWS*COLS*4))
-        self._tilecache0_raw = array("B", [0xFF] * (tiles_bank*8*8*4))
-        self._tilecache1_raw = array("B", [0xFF] * (tiles_bank*8*8*4))
-        self._spritecache0_raw = array("B", [0xFF] * (tiles_bank*8*8*4))
-        self._spritecache1_raw = array("B", [0xFF] * (tiles_bank*8*8*4))
-        self._col_index0_raw = array("B", [0xFF] * (tiles_bank*8*8*4))
-        self._col_index1_raw = array("B", [0xFF] * (tiles_bank*8*8*4))
+        palettes = 8
+
+        # The tiles of each bank are cached as color codes, which are shared by the background, window and sprites. The
+        # palette is applied, when the screen is rendered, so writing to the palettes doesn't invalidate the caches.
+        self._col_index0_raw = array("B", [0] * (tiles_bank*8*8))
+        self._col_index1_raw = array("B", [0] * (tiles_bank*8*8))
 
         if cythonmode:
-            self._screenbuffer = memoryview(self._screenbuffer_raw).cast("I", shape=(ROWS, COLS))
-            self._tilecache = memoryview(self._tilecache_raw).cast("I", shape=(tiles_bank * 8, 8))
-            self._spritecache0 = memoryview(self._spritecache0_raw).cast("I", shape=(tiles_bank * 8, 8))
-            self._spritecache1 = memoryview(self._spritecache1_raw).cast("I", shape=(tiles_bank * 8, 8))
+            shape = (tiles_bank * 8, 8)
+            self._col_index0 = memoryview(self._col_index0_raw).cast("B", shape=shape)
+            self._col_index1 = memoryview(self._col_index1_raw).cast("B", shape=shape)
         else:
-            v = memoryview(self._screenbuffer_raw).cast("I")
-            self._screenbuffer = [v[i:i + COLS] for i in range(0, COLS * ROWS, COLS)]
-            v = memoryview(self._tilecache0_raw).cast("I")
-            v = array("I", self._tilecache0_raw.tolist())
-            self.tc0 = [v[i:i + 8] for i in range(0, tiles_bank * 8 * 8, 8)]
-            v = memoryview(self._tilecache1_raw).cast("I")
-            v = array("I", self._tilecache1_raw.tolist())
-            self.tc1 = [v[i:i + 8] for i in range(0, tiles_bank * 8 * 8, 8)]
-            v = memoryview(self._spritecache0_raw).cast("I")
-            v = array("I", self._spritecache0_raw.tolist())
-            self.sc0 = [v[i:i + 8] for i in range(0, tiles_bank * 8 * 8, 8)]
-            v = memoryview(self._spritecache1_raw).cast("I")
-            v = array("I", self._spritecache1_raw.tolist())
-            self.sc1 = [v[i:i + 8] for i in range(0, tiles_bank * 8 * 8, 8)]
-            v = memoryview(self._col_index0_raw).cast("I")
-            v = array("I", self._col_index0_raw.tolist())
-            self._col_index0 = [v[i:i + 8] for i in range(0, tiles_bank * 8 * 8, 8)]
-            v = memoryview(self._col_index1_raw).cast("I")
-            v = array("I", self._col_index1_raw.tolist())
-            self._col_index1 = [v[i:i + 8] for i in range(0, tiles_bank * 8 * 8, 8)]
-            self._screenbuffer_ptr = c_void_p(self._screenbuffer_raw.buffer_info()[0])
-
-            # create the 3d lists to hold palettes, 8 palettes
-            self._tilecache0 = []
-            self._tilecache1 = []
-            self._spritecache0 = []
-            self._spritecache1 = []
-
-            from copy import deepcopy
-            for i in range(8):
-                self._tilecache0.append(deepcopy(self.tc0))
-                self._tilecache1.append(deepcopy(self.tc1))
-                self._spritecache0.append(deepcopy(self.sc0))
-                self._spritecache1.append(deepcopy(self.sc1))
-
-        self._scanlineparameters = [[0, 0, 0, 0, 0, 0, 0, 0, 0] for _ in range(ROWS)]
-        
-        self._backgroundmapattributes = [0, 0, 0, 0, 0]
+            size = tiles_bank * 8 * 8
+            v = memoryview(self._col_index0_raw)
+            self._col_index0 = [v[i:i + 8] for i in range(0, size, 8)]
+            v = memoryview(self._col_index1_raw)
+            self._col_index1 = [v[i:i + 8] for i in range(0, size, 8)]
+
+        # RGBA colors of the 4 color codes in each of the 8 palettes. They are only converted, when the palettes change.
+        self._bg_rgba = array("I", [0] * (palettes*4))
+        self._obj_rgba = array("I", [0] * (palettes*4))
+
         self._col_i = [[0] * COLS for _ in range(ROWS)]
         self._bg_priority = [[0] * COLS for _ in range(ROWS)]
 
-    def scanline(self, y, lcd):
-        bx, by = lcd.getviewport()
-        wx, wy = lcd.getwindowpos()
-        self._scanlineparameters[y][0] = bx
-        self._scanlineparameters[y][1] = by
-        self._scanlineparameters[y][2] = wx
-        self._scanlineparameters[y][3] = wy
-        self._scanlineparameters[y][4] = lcd.LCDC.tiledata_select
-        self._scanlineparameters[y][5] = lcd.LCDC.backgroundmap_select
-        self._scanlineparameters[y][6] = lcd.LCDC.windowmap_select
-        self._scanlineparameters[y][7] = lcd.LCDC.window_enable
-        self._scanlineparameters[y][8] = lcd.LCDC.background_enable
-
-
-    def getbackgroundmapattributes(self, lcd, i):
-        tile_num = lcd.getVRAMbank(i, 1, False)
-        palette = tile_num & 0b111  
-        vbank = (tile_num >> 3) & 1
-        horiflip = (tile_num >> 5) & 1
-        vertflip = (tile_num >> 6) & 1
-        bgpriority = (tile_num >> 7) & 1 
-
-        self._backgroundmapattributes[0] = palette
-        self._backgroundmapattributes[1] = vbank
-        self._backgroundmapattributes[2] = horiflip
-        self._backgroundmapattributes[3] = vertflip
-        self._backgroundmapattributes[4] = bgpriority
+        if not cythonmode and numpy_renderer.numpy_enabled:
+            self.numpy_backend = numpy_renderer.NumpyCGBRenderer(self, tiles_bank)
 
     def render_screen(self, lcd):
+        # The CGB renderer is always paired with a cgbLCD
+        cgblcd = lcd
         self.update_cache(lcd)
+        if self.numpy_backend is not None:
+            self.numpy_backend.render_screen(lcd)
+            return
+
         # All VRAM addresses are offset by 0x8000
         # Following addresses are 0x9800 and 0x9C00
 
@@ -127,13 +67,15 @@ class CGBRenderer:
                 # WINDOW
                 if window_enable and wy <= y and wx <= x:
                     index = wmap + (y-wy) // 8 * 32 % 0x400 + (x-wx) // 8 % 32
-                    wt = lcd.getVRAMbank(index, 0, False)
+                    wt = cgblcd.VRAM0[index]
                     
-                    #cgb specific map attributes
-                    self.getbackgroundmapattributes(lcd, index)
-                    palette, vbank, horiflip, vertflip, bgpriority = self._backgroundmapattributes
-                    tilecache = (self._tilecache1 if vbank else self._tilecache0)
-                    col_index = (self._col_index1 if vbank else self._col_index0)
+                    # CGB specific map attributes, stored at the same index in VRAM bank 1
+                    attributes = cgblcd.VRAM1[index]
+                    palette = attributes & 0b111
+                    vbank = (attributes >> 3) & 1
+                    horiflip = (attributes >> 5) & 1
+                    vertflip = (attributes >> 6) & 1
+                    bgpriority = (attributes >> 7) & 1
                     xx = (7 - ((x-wx) % 8)) if horiflip else ((x-wx) % 8)
                     
                     # If using signed tile indices, modify index
@@ -143,20 +85,27 @@ class CGBRenderer:
                         wt = (wt ^ 0x80) + 128
                     
                     yy = (8*wt + (7 -(y-wy) % 8)) if vertflip else (8*wt + (y-wy) % 8)
-                    self._screenbuffer[y][x] = tilecache[palette][yy][xx]
-                    self._col_i[y][x] = col_index[yy][xx]
+                    # Index the caches directly, as binding a memoryview to a local is costly per pixel
+                    if vbank:
+                        col = self._col_index1[yy][xx]
+                    else:
+                        col = self._col_index0[yy][xx]
+                    self._screenbuffer[y][x] = self._bg_rgba[palette*4 + col]
+                    self._col_i[y][x] = col
                     self._bg_priority[y][x] = bgpriority
 
                 # BACKGROUND
                 else:
                     index = background_offset + (y+by) // 8 * 32 % 0x400 + (x+bx) // 8 % 32
-                    bt = lcd.getVRAMbank(index, 0, False)
+                    bt = cgblcd.VRAM0[index]
 
-                    #cgb specific map attributes
-                    self.getbackgroundmapattributes(lcd, index)
-                    palette, vbank, horiflip, vertflip, bgpriority = self._backgroundmapattributes
-                    tilecache = (self._tilecache1 if vbank else self._tilecache0)
-                    col_index = (self._col_index1 if vbank else self._col_index0)
+                    # CGB specific map attributes, stored at the same index in VRAM bank 1
+                    attributes = cgblcd.VRAM1[index]
+                    palette = attributes & 0b111
+                    vbank = (attributes >> 3) & 1
+                    horiflip = (attributes >> 5) & 1
+                    vertflip = (attributes >> 6) & 1
+                    bgpriority = (attributes >> 7) & 1
 
                     xx = (7 - ((x+offset) % 8)) if horiflip else ((x+offset) % 8)
 
@@ -167,99 +116,100 @@ class CGBRenderer:
                         bt = (bt ^ 0x80) + 128
 
                     yy = (8*bt + (7-(y+by) % 8)) if vertflip else (8*bt + (y+by) % 8)
-                    self._screenbuffer[y][x] = tilecache[palette][yy][xx]
-                    self._col_i[y][x] = col_index[yy][xx]
+                    if vbank:
+                        col = self._col_index1[yy][xx]
+                    else:
+                        col = self._col_index0[yy][xx]
+                    self._screenbuffer[y][x] = self._bg_rgba[palette*4 + col]
+                    self._col_i[y][x] = col
                     self._bg_priority[y][x] = bgpriority                    
         
         if lcd.LCDC.sprite_enable:
-            self.render_sprites(lcd, self._screenbuffer)
+            self.render_sprites(lcd, self._screenbuffer, False)
 
-    def render_sprites(self, lcd, buffer, ignore_priority = False):
+    def render_sprites(self, lcd, buffer, ignore_priority):
         # Render sprites
-        # - Doesn't restrict 10 sprites per scan line
+        # - Only the first 10 sprites in OAM are shown on each scan line
         # - Prioritizes sprite in inverted order
         spriteheight = 16 if lcd.LCDC.sprite_height else 8
-        
-        # CGB priotizes sprites located first in OAM
-        for n in range(0x9C, -0x04, -4):
-            y = lcd.OAM[n] - 16 # Documentation states the y coordinate needs to be subtracted by 16
-            x = lcd.OAM[n + 1] - 8 # Documentation states the x coordinate needs to be subtracted by 8
-            tileindex = lcd.OAM[n + 2]
-            attributes = lcd.OAM[n + 3]
-            xflip = attributes & 0b00100000
-            yflip = attributes & 0b01000000
-            OAMbgpriority = (attributes & 0b10000000)
-
-            # bit 3 selects tile vram-bank
-            spritecache = (self._spritecache1 if attributes & 0b1000 else self._spritecache0)
-            # bits 0-2 selects palette number
-            palette = attributes & 0b111
-
-            for dy in range(spriteheight):
-                yy = spriteheight - dy - 1 if yflip else dy
-                if 0 <= y < ROWS:
-                    for dx in range(8):
-                        xx = 7 - dx if xflip else dx
-                        pixel = spritecache[palette][8*tileindex + yy][xx]
-                        if 0 <= x < COLS:
-                            use_priority_flags = self._scanlineparameters[y][8]
-                            if use_priority_flags:
-                                bgmappriority = self._bg_priority[y][x]        
-                                col = self._col_i[y][x]
-                                if bgmappriority:
-                                    if not col == 0:
-                                        pixel &= ~self.alphamask
-                                elif OAMbgpriority:
-                                    if not col == 0:
-                                        pixel &= ~self.alphamask                       
-                            if pixel & self.alphamask:
-                                        buffer[y][x] = pixel
-                        x += 1
-                    x -= 8
-                y += 1
-
-    def update_cache(self, lcd):        
+        self.scan_sprites(lcd, spriteheight)
+
+        for y in range(ROWS):
+            use_priority_flags = self._scanlineparameters[y][8]
+
+            # CGB priotizes sprites located first in OAM
+            for i in range(self._sprite_count[y] - 1, -1, -1):
+                n = self._sprites[y][i]
+                x = lcd.OAM[n + 1] - 8 # Documentation states the x coordinate needs to be subtracted by 8
+                if x <= -8 or x >= COLS:
+                    continue
+                tileindex = lcd.OAM[n + 2]
+                attributes = lcd.OAM[n + 3]
+                xflip = attributes & 0b00100000
+                yflip = attributes & 0b01000000
+                OAMbgpriority = (attributes & 0b10000000)
+
+                # bit 3 selects tile vram-bank
+                spritecache = (self._col_index1 if attributes & 0b1000 else self._col_index0)
+                # bits 0-2 selects palette number
+                palette = attributes & 0b111
+
+                yy = y - (lcd.OAM[n] - 16)
+                if yflip:
+                    yy = spriteheight - yy - 1
+
+                # Only the part of the sprite on the screen is drawn
+                for dx in range(max(-x, 0), min(8, COLS - x)):
+                    xx = 7 - dx if xflip else dx
+                    # Color code 0 is transparent in the sprite palettes
+                    pixel = self._obj_rgba[palette*4 + spritecache[8*tileindex + yy][xx]]
+                    if use_priority_flags:
+                        bgmappriority = self._bg_priority[y][x + dx]
+                        col = self._col_i[y][x + dx]
+                        if bgmappriority:
+                            if not col == 0:
+                                pixel &= ~self.alphamask
+                        elif OAMbgpriority:
+                            if not col == 0:
+                                pixel &= ~self.alphamask
+                    if pixel & self.alphamask:
+                        buffer[y][x + dx] = pixel
+
+    def update_cache(self, lcd):
+        cgblcd = lcd
+        if self.palettes_changed or self.clearcache:
+            self.update_palettes(lcd)
         if self.clearcache:
             self.clear_cache()
-        self.update_tiles(lcd, self.tiles_changed0, 0)
-        self.update_tiles(lcd, self.tiles_changed1, 1)
+        self.update_tiles(cgblcd, self.tiles_changed0, 0)
+        self.update_tiles(cgblcd, self.tiles_changed1, 1)
 
         self.tiles_changed0.clear()
         self.tiles_changed1.clear()
 
+    def update_palettes(self, lcd):
+        cgblcd = lcd
+        for p in range(8):
+            for colorcode in range(4):
+                self._bg_rgba[p*4 + colorcode] = self.convert_to_rgba(cgblcd.bcpd.getcolor(p, colorcode))
+                self._obj_rgba[p*4 + colorcode] = self.convert_to_rgba(cgblcd.ocpd.getcolor(p, colorcode))
+            # first color transparent for sprites
+            self._obj_rgba[p * 4] &= ~self.alphamask
+        self.palettes_changed = False
+
     def update_tiles(self, lcd, tiles_changed, bank):
+        col_index = self._col_index1 if bank else self._col_index0
+
         for t in tiles_changed:
             for k in range(0, 16, 2): # 2 bytes for each line
-                byte1 = lcd.getVRAMbank(t + k, bank)
-                byte2 = lcd.getVRAMbank(t + k + 1, bank)
-                
+                byte1 = lcd.getVRAMbank(t + k, bank) * 8
+                byte2 = lcd.getVRAMbank(t + k + 1, bank) * 8
+
                 y = (t+k-0x8000) // 2
 
                 for x in range(8):
                     #index into the palette for the current pixel
-                    colorcode = color_code(byte1, byte2, 7 - x)
-                    
-                    if bank:
-                        self._col_index1[y][x] = colorcode
-                    else:
-                        self._col_index0[y][x] = colorcode
-
-                    # update for the 8 palettes
-                    for p in range(8): 
-                        if bank:
-                            self._tilecache1[p][y][x] = self.convert_to_rgba(lcd.bcpd.getcolor(p, colorcode))
-                            self._spritecache1[p][y][x] = self.convert_to_rgba(lcd.ocpd.getcolor(p, colorcode))
-
-                        else:
-                            self._tilecache0[p][y][x] = self.convert_to_rgba(lcd.bcpd.getcolor(p, colorcode))
-                            self._spritecache0[p][y][x] = self.convert_to_rgba(lcd.ocpd.getcolor(p, colorcode))
-                        
-                        # first color transparent for sprites
-                        if colorcode == 0:
-                            if bank: 
-                                self._spritecache1[p][y][x] &= ~self.alphamask
-                            else:
-                                self._spritecache0[p][y][x] &= ~self.alphamask           
+                    col_index[y][x] = self._color_code_low[byte1 + x] | self._color_code_high[byte2 + x]
 
     def clear_cache(self):
         self.tiles_changed0.clear()  
@@ -269,35 +219,6 @@ class CGBRenderer:
             self.tiles_changed1.add(x)
         self.clearcache = False
 
-
-    def blank_screen(self):
-        # If the screen is off, fill it with a color.
-        color = 0xFFFFFFFF
-        for y in range(ROWS):
-            for x in range(COLS):
-                self._screenbuffer[y][x] = color
-
     # converts a 24 bit RGB color to 32 bit RGBA
     def convert_to_rgba(self, color):
         return (color << 8) | self.alphamask
-
-    def save_state(self, f):
-        for y in range(ROWS):
-            f.write(self._scanlineparameters[y][0])
-            f.write(self._scanlineparameters[y][1])
-            # We store (WX - 7). We add 7 and mask 8 bits to make it easier to serialize
-            f.write((self._scanlineparameters[y][2] + 7) & 0xFF)
-            f.write(self._scanlineparameters[y][3])
-            f.write(self._scanlineparameters[y][4])
-
-    def load_state(self, f, state_version):
-        for y in range(ROWS):
-            self._scanlineparameters[y][0] = f.read()
-            self._scanlineparameters[y][1] = f.read()
-            # Restore (WX - 7) as described above
-            self._scanlineparameters[y][2] = (f.read() - 7) & 0xFF
-            self._scanlineparameters[y][3] = f.read()
-            if state_version > 3:
-                self._scanlineparameters[y][4] = f.read()
-
-            
@@ -14,35 +14,32 @@ from pyboy.utils cimport IntIOInterface
 import cython
 
 
-cdef uint16_t IF_ADDRESS, IE_ADDRESS
 cdef short FLAGC, FLAGH, FLAGN, FLAGZ
 cdef short VBLANK, LCDC, TIMER, SERIAL, HIGHTOLOW
+cdef uint8_t[512] BLOCK_END
 
 
 
 cdef class CPU:
 
     cdef bint interrupt_master_enable, break_allow, break_on, halted, stopped, profiling
+    cdef uint8_t interrupts_flag_register, interrupts_enabled_register
     cdef uint64_t old_pc, break_next
 
     cdef object debug_callstack
     cdef int[512] hitrate
 
-    @cython.locals(intr_flag_enabled=cython.bint, intr_flag=cython.bint)
-    cdef bint test_interrupt(self, uint8_t, uint8_t, int16_t)
-
-    @cython.locals(
-        ie_v=cython.uchar,
-        if_v=cython.uchar,
-        v=cython.uchar,
-        intr_flag=cython.bint,
-        intr_flag_enabled=cython.bint,
-        flag=cython.short,
-        vector=cython.ushort)
+    cdef bint test_interrupt(self, uint8_t, int16_t)
+
+    @cython.locals(pending=uint8_t)
     cdef int check_interrupts(self)
 
-    @cython.locals(opcode=cython.ushort)
+    @cython.locals(code=int, entry=uint32_t, opcode=cython.ushort)
     cdef char fetch_and_execute(self, uint64_t)
+    @cython.locals(opcode=uint16_t, oplen=int, v=int, a=int, b=int)
+    cdef uint32_t decode(self, uint16_t)
+    @cython.locals(first=uint32_t, entry=uint32_t, end=int, oplen=int, base=int)
+    cdef uint32_t decode_block(self, int, int)
     cdef int tick(self)
     cdef void save_state(self, IntIOInterface)
     cdef void load_state(self, IntIOInterface, int)
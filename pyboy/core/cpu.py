@@ -10,8 +10,15 @@ from . import opcodes
 
 FLAGC, FLAGH, FLAGN, FLAGZ = range(4, 8)
 VBLANK, LCDC, TIMER, SERIAL, HIGHTOLOW = range(5)
-IF_ADDRESS = 0xFF0F
-IE_ADDRESS = 0xFFFF
+
+# Jumps, calls, returns, HALT and STOP end a block of straight-line code. The bytes following them might be data, so
+# they are only decoded once execution actually gets there.
+BLOCK_END = [
+    1 if opcode in (
+        0x10, 0x18, 0x20, 0x28, 0x30, 0x38, 0x76, 0xC0, 0xC2, 0xC3, 0xC4, 0xC7, 0xC8, 0xC9, 0xCA, 0xCC, 0xCD, 0xCF,
+        0xD0, 0xD2, 0xD4, 0xD7, 0xD8, 0xD9, 0xDA, 0xDC, 0xDF, 0xE7, 0xE9, 0xEF, 0xF7, 0xFF
+    ) else 0 for opcode in range(512)
+]
 
 logger = logging.getLogger(__name__)
 
@@ -41,7 +48,7 @@ class CPU:
 
     # Interrupt flags
     def set_interruptflag(self, flag):
-        self.mb.setitem(IF_ADDRESS, self.mb.getitem(IF_ADDRESS) | (1 << flag))
+        self.interrupts_flag_register |= (1 << flag)
 
     def test_ramregisterflag(self, address, flag):
         v = self.mb.getitem(address)
@@ -50,14 +57,11 @@ class CPU:
     def clear_ramregisterflag(self, address, flag):
         self.mb.setitem(address, (self.mb.getitem(address) & (0xFF - (1 << flag))))
 
-    def test_interrupt(self, if_v, ie_v, flag):
-        intr_flag_enabled = (ie_v & (1 << flag))
-        intr_flag = (if_v & (1 << flag))
-
-        if intr_flag_enabled and intr_flag:
+    def test_interrupt(self, pending, flag):
+        if pending & (1 << flag):
 
             # Clear interrupt flag
-            self.mb.setitem(0xFF0F, self.mb.getitem(0xFF0F) & (0xFF - (1 << flag)))
+            self.interrupts_flag_register &= (0xFF - (1 << flag))
 
             self.interrupt_master_enable = False
             if self.halted:
@@ -79,26 +83,25 @@ class CPU:
         if not self.interrupt_master_enable:
             return False
 
-        # 0xFF0F (IF_address) - Bit 0-4 Requested interrupts
-        if_v = self.mb.getitem(IF_ADDRESS)
-        # 0xFFFF (IE_address) - Bit 0-4 Enabling interrupt vectors
-        ie_v = self.mb.getitem(IE_ADDRESS)
+        # 0xFF0F (IF) - Bit 0-4 Requested interrupts
+        # 0xFFFF (IE) - Bit 0-4 Enabling interrupt vectors
+        pending = self.interrupts_flag_register & self.interrupts_enabled_register & 0b11111
 
         # Better to make a long check, than run through 5 if statements
-        if ((if_v & 0b11111) & (ie_v & 0b11111)) != 0:
-            if self.test_interrupt(if_v, ie_v, VBLANK):
+        if pending != 0:
+            if self.test_interrupt(pending, VBLANK):
                 self.PC = 0x0040
                 return True
-            elif self.test_interrupt(if_v, ie_v, LCDC):
+            elif self.test_interrupt(pending, LCDC):
                 self.PC = 0x0048
                 return True
-            elif self.test_interrupt(if_v, ie_v, TIMER):
+            elif self.test_interrupt(pending, TIMER):
                 self.PC = 0x0050
                 return True
-            elif self.test_interrupt(if_v, ie_v, SERIAL):
+            elif self.test_interrupt(pending, SERIAL):
                 self.PC = 0x0058
                 return True
-            elif self.test_interrupt(if_v, ie_v, HIGHTOLOW):
+            elif self.test_interrupt(pending, HIGHTOLOW):
                 self.PC = 0x0060
                 return True
         return False
@@ -135,6 +138,9 @@ class CPU:
         self.mb = mb
 
         self.interrupt_master_enable = False
+        # IF and IE are mapped at 0xFF0F and 0xFFFF, but kept here, as they are checked before every instruction
+        self.interrupts_flag_register = 0
+        self.interrupts_enabled_register = 0
 
         self.break_allow = True
         self.break_on = False
@@ -173,17 +179,66 @@ class CPU:
         )
 
     def fetch_and_execute(self, pc):
-        opcode = self.mb.getitem(pc)
-        if opcode == 0xCB: # Extension code
-            pc += 1
-            opcode = self.mb.getitem(pc)
-            opcode += 0x100 # Internally shifting look-up table
+        # Instructions are decoded once into an entry holding the opcode, the immediate value and the length:
+        # (length << 25) | (immediate << 9) | opcode. Only the banks, that can hold code, are cached.
+        code = self.mb.mem_manager.decode_pages[pc >> 8]
+        if code == -1:
+            entry = self.decode(pc)
+        else:
+            if code >> 16 != self.mb.mem_manager.code_bank:
+                self.mb.mem_manager.select_code(code >> 16)
+            entry = self.mb.mem_manager.code_cache[(code & 0xFFFF) + (pc & 0xFF)]
+            if entry == 0:
+                entry = self.decode_block(code, pc)
+        opcode = entry & 0x1FF
 
         # Profiling
         if self.profiling:
             self.hitrate[opcode] += 1
 
-        return opcodes.execute_opcode(self, opcode)
+        return opcodes.execute_opcode(self, opcode, (entry >> 9) & 0xFFFF)
+
+    def decode(self, pc):
+        opcode = self.mb.getitem(pc)
+        if opcode == 0xCB: # Extension code
+            opcode = self.mb.getitem((pc+1) & 0xFFFF)
+            opcode += 0x100 # Internally shifting look-up table
+
+        oplen = opcodes.opcode_length(opcode)
+        v = 0
+        if oplen == 2:
+            # 8-bit immediate
+            v = self.mb.getitem((pc+1) & 0xFFFF)
+        elif oplen == 3:
+            # 16-bit immediate
+            # Flips order of values due to big-endian
+            a = self.mb.getitem((pc+2) & 0xFFFF)
+            b = self.mb.getitem((pc+1) & 0xFFFF)
+            v = (a << 8) + b
+        return (oplen << 25) | (v << 9) | opcode
+
+    def decode_block(self, code, pc):
+        # Decode the straight-line code from pc to the end of the block or page into the bank selected by
+        # fetch_and_execute, and return the first entry
+        if code >> 16 >= self.mb.mem_manager.vram_code:
+            self.mb.mem_manager.ram_code_pages.add(code)
+        base = code & 0xFFFF
+        first = entry = self.decode(pc)
+        end = (pc & 0xFF00) + 0x100
+        while True:
+            oplen = entry >> 25
+            if oplen == 0 or pc + oplen > end:
+                # Undefined opcodes have no length, and instructions crossing into the next page might be switched or
+                # written without this page knowing. Neither are cached.
+                break
+            self.mb.mem_manager.code_cache[base + (pc & 0xFF)] = entry
+            if BLOCK_END[entry & 0x1FF]:
+                break
+            pc += oplen
+            if pc == end or self.mb.mem_manager.code_cache[base + (pc & 0xFF)] != 0:
+                break
+            entry = self.decode(pc)
+        return first
 
     def tick(self):
         # "The interrupt will be acknowledged during opcode fetch
@@ -36,17 +36,19 @@ class LCD:
             self.renderer.tiles_changed0.add(i & 0xFFF0)
         
         self.VRAM0[i - 0x8000] = value
+
+    def mark_tile(self, i):
+        # For bulk writes to VRAM, which have to tell the renderer about the changed tile themselves
+        if i < 0x9800:
+            self.renderer.tiles_changed0.add(i & 0xFFF0)
     
     def getVRAM(self, i, offset = True):
         i_off = 0x8000 if offset else 0x0
         return self.VRAM0[i - i_off]
 
     def save_state(self, f):
-        for n in range(VBANK_SIZE):
-            f.write(self.VRAM0[n])
-
-        for n in range(OBJECT_ATTRIBUTE_MEMORY):
-            f.write(self.OAM[n])
+        f.write_buffer(self.VRAM0)
+        f.write_buffer(self.OAM)
 
         f.write(self.LCDC.value)
         f.write(self.BGP.value)
@@ -59,11 +61,8 @@ class LCD:
         f.write(self.WX)
 
     def load_state(self, f, state_version):
-        for n in range(VBANK_SIZE):
-            self.VRAM0[n] = f.read()
-
-        for n in range(OBJECT_ATTRIBUTE_MEMORY):
-            self.OAM[n] = f.read()
+        f.read_buffer(self.VRAM0)
+        f.read_buffer(self.OAM)
 
         self.LCDC.set(f.read())
         self.BGP.set(f.read())
@@ -3,54 +3,95 @@
 # GitHub: https://github.com/Baekalfen/PyBoy
 #
 
-from libc.stdint cimport uint8_t, uint16_t, uint32_t, uint64_t
+from libc.stdint cimport uint8_t, uint16_t, uint32_t, int64_t, uint64_t
 
 import cython
 cimport pyboy.core.cpu
 cimport pyboy.core.timer
 cimport pyboy.core.cartridge.base_mbc
-from pyboy.utils cimport IntIOInterface
+from pyboy.utils cimport IntIOInterface, Snapshot
 cimport pyboy.core.bootrom
-cimport pyboy.core.ram
+cimport pyboy.core.base_ram
 cimport pyboy.core.lcd
+cimport pyboy.core.renderer
+cimport pyboy.core.mem_manager
 cimport pyboy.core.interaction
 cimport pyboy.core.sound
 from pyboy.utils cimport WindowEvent
 
 
-cdef uint16_t STAT, LY, LYC
+cdef uint16_t SB, SC, IFLAG, STAT, LY, LYC
 cdef short VBLANK, LCDC, TIMER, SERIAL, HIGHTOLOW
+cdef uint64_t NEVER, PPU_OFFSET_BIAS
 
 
 
 cdef class Motherboard:
     cdef pyboy.core.interaction.Interaction interaction
     cdef pyboy.core.bootrom.BootROM bootrom
-    cdef pyboy.core.ram.RAM ram
+    cdef pyboy.core.base_ram.RAM ram
     cdef pyboy.core.lcd.LCD lcd
-    cdef pyboy.core.lcd.Renderer renderer
+    cdef pyboy.core.renderer.Renderer renderer
     cdef pyboy.core.cpu.CPU cpu
     cdef pyboy.core.timer.Timer timer
     cdef bint sound_enabled
     cdef pyboy.core.sound.Sound sound
     cdef pyboy.core.cartridge.base_mbc.BaseMBC cartridge
+    cdef pyboy.core.mem_manager.MemoryManager mem_manager
+    cdef bint is_cgb
     cdef bint bootrom_enabled
     cdef bint disable_renderer
+    cdef int frameskip, skipped_frames
+    cdef bint lazy_rendering, render_pending
     cdef str serialbuffer
-    cdef int cycles_remaining
+
+    cdef uint64_t cycles, next_event, ppu_next, timer_next, serial_next, timer_cycles, sound_cycles
+    cdef bint frame_done, lcd_frame, double_speed
+    cdef int ppu_mode, ppu_line
+    cdef int loop_start, loop_end, loop_sp
+    cdef uint64_t loop_state, loop_cycles
+    cdef bint loop_ime, loop_dirty
+    cdef Snapshot last_snapshot
 
     cdef void buttonevent(self, WindowEvent)
     cdef void stop(self, bint)
+    @cython.locals(stat=uint8_t)
     cdef void set_STAT_mode(self, int)
     cdef void check_LYC(self, int)
-    @cython.locals(cycles=cython.int)
-    cdef void calculate_cycles(self, int)
+    cdef void schedule(self, uint64_t)
+    cdef void sync_timer(self)
+    cdef void schedule_timer(self)
+    cdef void sync_sound(self)
+    cdef void schedule_serial(self, uint8_t)
+    cdef void add_ppu_period(self, int)
+    cdef void start_frame(self)
+    cdef void ppu_step(self)
+    cdef void render_frame(self)
+    cdef void render_skipped(self)
+    cdef void serial_step(self)
+    cdef void process_events(self)
+    @cython.locals(cycles=cython.int, pc=int)
+    cdef void run_cpu(self)
+    @cython.locals(state=uint64_t, period=uint64_t)
+    cdef void check_idle_loop(self, int)
     cdef void tickframe(self)
+    @cython.locals(disable_renderer=bint, n=int)
+    cdef void tickframes(self, int, bint)
+    cdef void end_frame(self)
+    @cython.locals(stop=uint64_t, last_value=int, serial_length=int, check_instructions=bint, condition=str, ly=int, instruction_cycles=int)
+    cdef str run_until(self, int, int, int, int, int64_t, int, bint, bint)
+    cdef int rombank(self, int)
 
     cdef uint8_t getitem(self, uint16_t)
     cdef void setitem(self, uint16_t, uint8_t)
 
-    @cython.locals(offset=cython.int, dst=cython.int, n=cython.int)
-    cdef void transfer_DMA(self, uint8_t)
     cdef void save_state(self, IntIOInterface)
     cdef void load_state(self, IntIOInterface)
+    cdef void read_state(self, IntIOInterface)
+    cdef Snapshot snapshot(self)
+    cdef void restore(self, Snapshot)
+    cdef void save_frame(self, IntIOInterface)
+    cdef void load_frame(self, IntIOInterface)
+    cdef void save_boot_state(self, IntIOInterface)
+    @cython.locals(cartridge_state=Snapshot)
+    cdef void load_boot_state(self, IntIOInterface)
@@ -5,17 +5,24 @@
 
 import logging
 
-from pyboy.utils import STATE_VERSION
+from pyboy.utils import STATE_VERSION, Snapshot
 
 from . import bootrom, cartridge, cpu, interaction, lcd, base_ram, sound, timer, cgb_lcd, cgb_ram, renderer, cgb_renderer, mem_manager, cgb_mem_manager
 
 logger = logging.getLogger(__name__)
 
 VBLANK, LCDC, TIMER, SERIAL, HIGHTOLOW = range(5)
-STAT, _, _, LY, LYC = range(0xFF41, 0xFF46)
+# Offsets of the registers in the I/O memory at 0xFF00
+SB, SC, IFLAG = 0x01, 0x02, 0x0F
+STAT, _, _, LY, LYC = range(0x41, 0x46)
+
+# Cycle stamp of an event, which isn't scheduled
+NEVER = 0x7FFFFFFFFFFFFFFF
+# Added to the distance to the next PPU event in snapshots, as the event can be both ahead and behind the clock
+PPU_OFFSET_BIAS = 0x100000000
 
 class Motherboard:
-    def __init__(self, gamerom_file, bootrom_file, color_palette, disable_renderer, sound_enabled, dmg, profiling=False):
+    def __init__(self, gamerom_file, bootrom_file, color_palette, disable_renderer, sound_sink, dmg, profiling=False):
         if bootrom_file is not None:
             logger.info("Boot-ROM file provided")
 
@@ -27,10 +34,12 @@ class Motherboard:
         self.bootrom = bootrom.BootROM(bootrom_file, dmg)
         self.cpu = cpu.CPU(self, profiling)
 
-        self.sound_enabled = sound_enabled
-        self.sound = sound.Sound()
+        # Without a sink, the sound controller isn't emulated at all
+        self.sound_enabled = sound_sink is not None
+        self.sound = sound.Sound(sound_sink) if self.sound_enabled else None
 
         self.is_cgb = not dmg
+        self.bootrom_enabled = True
         
         if dmg:
             logger.info("Started as Game Boy")
@@ -61,10 +70,42 @@ class Motherboard:
 
 
         self.disable_renderer = disable_renderer
+        # Rendering of skipped frames is postponed until the screen is read, if ever
+        self.frameskip = 0
+        self.lazy_rendering = False
+        self.skipped_frames = 0
+        self.render_pending = False
 
-        self.bootrom_enabled = True
         self.serialbuffer = ""
-        self.cycles_remaining = 0
+
+        # Every component is scheduled against the number of cycles since power on. The CPU runs uninterrupted
+        # until 'next_event', which is the earliest of the PPU, timer and serial events.
+        self.cycles = 0
+        self.next_event = 0
+        self.ppu_next = 0
+        self.timer_next = NEVER
+        self.serial_next = NEVER
+        # The timer and sound only catch up with the clock, when they are accessed
+        self.timer_cycles = 0
+        self.sound_cycles = 0
+
+        # A frame is only started, when the last one is done. It can be left unfinished by 'run_until'.
+        self.frame_done = True
+        self.lcd_frame = False
+        self.ppu_mode = 0
+        self.ppu_line = 0
+        self.double_speed = False
+
+        # The last backward jump, to recognize loops polling for an event. See 'check_idle_loop'.
+        self.loop_start = -1
+        self.loop_end = -1
+        self.loop_state = 0
+        self.loop_sp = 0
+        self.loop_ime = False
+        self.loop_cycles = 0
+        self.loop_dirty = True
+
+        self.last_snapshot = None
 
     def getserial(self):
         b = self.serialbuffer
@@ -92,13 +133,26 @@ class Motherboard:
         else:
             pass
         self.renderer.save_state(f)
+        # IF and IE are held by the CPU, but saved with the RAM
+        self.ram.io[IFLAG] = self.cpu.interrupts_flag_register
+        self.ram.interrupt[0] = self.cpu.interrupts_enabled_register
         self.ram.save_state(f)
+        self.sync_timer()
         self.timer.save_state(f)
         self.cartridge.save_state(f)
+        self.mem_manager.save_state(f)
         f.flush()
         logger.debug("State saved.")
 
     def load_state(self, f):
+        self.read_state(f)
+
+        # TODO: Move out of MB
+        self.renderer.clearcache = True
+        self.renderer.render_screen(self.lcd)
+        self.render_pending = False
+
+    def read_state(self, f):
         logger.debug("Loading state...")
         state_version = f.read()
         if state_version >= 2:
@@ -111,20 +165,93 @@ class Motherboard:
             self.bootrom_enabled = state_version
         self.cpu.load_state(f, state_version)
         self.lcd.load_state(f, state_version)
-        if state_version >= 6:
+        if state_version >= 6 and self.sound_enabled:
             self.sound.load_state(f, state_version)
         if state_version >= 2:
             self.renderer.load_state(f, state_version)
         self.ram.load_state(f, state_version)
+        self.cpu.interrupts_flag_register = self.ram.io[IFLAG]
+        self.cpu.interrupts_enabled_register = self.ram.interrupt[0]
         if state_version >= 5:
             self.timer.load_state(f, state_version)
         self.cartridge.load_state(f, state_version)
+        if state_version >= 6:
+            self.mem_manager.load_state(f, state_version)
+        # Saved states continue from the start of a frame
+        self.frame_done = True
+        self.mem_manager.map_all()
+        self.mem_manager.clear_decode_cache()
+        self.timer_cycles = self.cycles
+        self.sound_cycles = self.cycles
+        self.schedule_timer()
+        self.schedule_serial(self.ram.io[SC])
         f.flush()
         logger.debug("State loaded.")
 
-        # TODO: Move out of MB
+    def snapshot(self):
+        # Memory is mostly the same as in the last snapshot taken or restored, so their pages are shared
+        snapshot = Snapshot(self.last_snapshot)
+        self.save_state(snapshot)
+        # Not part of a saved state, but needed to continue exactly as from where the snapshot was taken
+        snapshot.write_64bit(self.ppu_next + PPU_OFFSET_BIAS - self.cycles)
+        self.save_frame(snapshot)
+        # Don't keep the whole line of snapshots alive
+        snapshot.parent = None
+        self.last_snapshot = snapshot
+        return snapshot
+
+    def restore(self, snapshot):
+        snapshot.seek(0)
+        self.read_state(snapshot)
+        self.ppu_next = self.cycles + snapshot.read_64bit() - PPU_OFFSET_BIAS
+        self.load_frame(snapshot)
+        self.last_snapshot = snapshot
+
+    def save_frame(self, f):
+        # Where the PPU is in the current frame
+        f.write(self.frame_done)
+        f.write(self.lcd_frame)
+        f.write(self.ppu_mode)
+        f.write(self.ppu_line)
+        f.write(self.double_speed)
+        f.write(self.render_pending)
+        f.write_buffer(self.renderer._screenbuffer_raw)
+
+    def load_frame(self, f):
+        self.frame_done = f.read()
+        self.lcd_frame = f.read()
+        self.ppu_mode = f.read()
+        self.ppu_line = f.read()
+        self.double_speed = f.read()
+        self.render_pending = f.read()
+        # The screen is copied back as it was. The tile caches don't match the VRAM anymore, and are rebuilt on the
+        # next frame.
+        f.read_buffer(self.renderer._screenbuffer_raw)
         self.renderer.clearcache = True
-        self.renderer.render_screen(self.lcd)
+
+    def save_boot_state(self, f):
+        # The boot ROM hands over to the cartridge in the middle of a frame. Unlike a saved state, the clock and the
+        # position in the frame are kept, so the game starts exactly as after running the boot ROM.
+        f.write_64bit(self.cycles)
+        self.save_state(f)
+        f.write_64bit(self.ppu_next)
+        self.save_frame(f)
+
+    def load_boot_state(self, f):
+        # The boot ROM doesn't touch the cartridge, which keeps its own state. This is the RAM loaded from the battery
+        # file and the RTC.
+        cartridge_state = Snapshot()
+        self.cartridge.save_state(cartridge_state)
+
+        self.cycles = f.read_64bit()
+        self.read_state(f)
+        self.ppu_next = f.read_64bit()
+        self.load_frame(f)
+
+        cartridge_state.seek(0)
+        self.cartridge.load_state(cartridge_state, STATE_VERSION)
+        self.mem_manager.map_all()
+        self.mem_manager.clear_decode_cache()
 
     ###################################################################
     # Coordinator
@@ -132,123 +259,298 @@ class Motherboard:
 
     # TODO: Move out of MB
     def set_STAT_mode(self, mode):
-        self.setitem(STAT, self.getitem(STAT) & 0b11111100) # Clearing 2 LSB
-        self.setitem(STAT, self.getitem(STAT) | mode) # Apply mode to LSB
+        stat = (self.ram.io[STAT] & 0b11111100) | mode # Apply mode to the 2 LSB
+        self.ram.io[STAT] = stat
 
         # Mode "3" is not interruptable
-        if self.cpu.test_ramregisterflag(STAT, mode + 3) and mode != 3:
+        if stat & (1 << (mode + 3)) and mode != 3:
             self.cpu.set_interruptflag(LCDC)
 
     # TODO: Move out of MB
     def check_LYC(self, y):
-        #print("%s" % format(self.getitem(STAT), '#010b'))
-        self.setitem(LY, y)
-        if self.getitem(LYC) == y:
-            self.setitem(STAT, self.getitem(STAT) | 0b100) # Sets the LYC flag
-            if self.getitem(STAT) & 0b01000000:
+        self.ram.io[LY] = y
+        if self.ram.io[LYC] == y:
+            self.ram.io[STAT] |= 0b100 # Sets the LYC flag
+            if self.ram.io[STAT] & 0b01000000:
                 self.cpu.set_interruptflag(LCDC)
         else:
-            self.setitem(STAT, self.getitem(STAT) & 0b11111011)
+            self.ram.io[STAT] &= 0b11111011
+
+    def schedule(self, cycles):
+        if cycles < self.next_event:
+            self.next_event = cycles
+
+    def sync_timer(self):
+        if self.timer.tick(self.cycles - self.timer_cycles):
+            self.cpu.set_interruptflag(TIMER)
+        self.timer_cycles = self.cycles
+        self.loop_dirty = True
+
+    def schedule_timer(self):
+        # Has to be called after anything, which changes when TIMA overflows
+        if self.timer.TAC & 0b100:
+            self.timer_next = self.cycles + self.timer.cyclestointerrupt()
+            self.schedule(self.timer_next)
+        else:
+            self.timer_next = NEVER
+
+    def sync_sound(self):
+        self.sound.clock += self.cycles - self.sound_cycles
+        self.sound_cycles = self.cycles
+        self.loop_dirty = True
+
+    def schedule_serial(self, value):
+        # Transfers using the internal clock complete after 8 bits. With no link partner, only 1's are received.
+        if value & 0x81 == 0x81:
+            # 8192 Hz, or 32 times faster when selected on CGB
+            self.serial_next = self.cycles + (128 if self.is_cgb and value & 0b10 else 4096)
+            self.schedule(self.serial_next)
+        else:
+            self.serial_next = NEVER
 
-    def calculate_cycles(self, cycles_period):
-        self.cycles_remaining += cycles_period
+    def add_ppu_period(self, dots):
+        self.ppu_next += dots
 
         # TODO: Temporary hdma transfer
-        if self.is_cgb:
-            mode = self.getitem(STAT) & 0b11
-            if mode == 0:
-                self.mem_manager.do_potential_transfer()
-                self.cycles_remaining -= 8 # TODO: adjust for double speed
+        if self.is_cgb and self.ram.io[STAT] & 0b11 == 0:
+            self.mem_manager.do_potential_transfer()
+            self.ppu_next -= 8 # TODO: adjust for double speed
         ##############################
 
-        while self.cycles_remaining > 0:
+        self.schedule(self.ppu_next)
+
+    def start_frame(self):
+        self.frame_done = False
+        self.lcd_frame = self.lcd.LCDC.lcd_enable
+        self.ppu_line = 0
+        if self.lcd_frame:
+            self.ppu_mode = 2
+            self.ppu_step()
+        else:
+            # https://www.reddit.com/r/EmuDev/comments/6r6gf3
+            # TODO: What happens if LCD gets turned on/off mid-cycle?
+            self.renderer.blank_screen()
+            self.render_pending = False
+            # TODO: Move out of MB
+            self.set_STAT_mode(0)
+            self.ram.io[LY] = 0
+            self.add_ppu_period(456)
+        self.next_event = min(self.ppu_next, self.timer_next, self.serial_next)
+
+    def ppu_step(self):
+        # Performs the PPU transition, which was scheduled at 'ppu_next', and schedules the next one
+        if not self.lcd_frame:
+            # The LCD is off for 154 lines
+            self.ppu_line += 1
+            if self.ppu_line == 154:
+                self.frame_done = True
+            else:
+                self.add_ppu_period(456)
+        elif self.ppu_mode == 2:
+            # Start of one of the 144 lines on screen
+            self.check_LYC(self.ppu_line)
+            # The speed is only checked at the start of each line on screen
+            self.double_speed = self.is_cgb and self.mem_manager.is_double_speed
+
+            # TODO: Move out of MB
+            self.set_STAT_mode(2)
+            self.ppu_mode = 3
+            self.add_ppu_period(160 if self.double_speed else 80)
+        elif self.ppu_mode == 3:
+            self.set_STAT_mode(3)
+            self.ppu_mode = 0
+            self.add_ppu_period(340 if self.double_speed else 170)
+        elif self.ppu_mode == 0:
+            self.renderer.scanline(self.ppu_line, self.lcd)
+            self.set_STAT_mode(0)
+            self.ppu_line += 1
+            self.ppu_mode = 2 if self.ppu_line < 144 else 1
+            self.add_ppu_period(412 if self.double_speed else 206)
+        elif self.ppu_line == 154:
+            self.frame_done = True
+        else:
+            if self.ppu_line == 144:
+                self.cpu.set_interruptflag(VBLANK)
+                if not self.disable_renderer:
+                    self.render_frame()
+
+            # Wait for next frame
+            self.check_LYC(self.ppu_line)
+            self.set_STAT_mode(1)
+            self.ppu_line += 1
+            self.add_ppu_period(912 if self.double_speed else 456)
+
+    def render_frame(self):
+        if self.lazy_rendering or self.skipped_frames < self.frameskip:
+            if not self.lazy_rendering:
+                self.skipped_frames += 1
+            self.render_pending = True
+        else:
+            self.skipped_frames = 0
+            self.render_pending = False
+            self.renderer.render_screen(self.lcd)
+
+    def render_skipped(self):
+        # Renders the last frame, if it was skipped. The scanline parameters are stored during the frame, but the tiles
+        # and sprites are read from VRAM and OAM as they are now.
+        if self.render_pending:
+            self.render_pending = False
+            self.renderer.render_screen(self.lcd)
+
+    def serial_step(self):
+        self.serial_next = NEVER
+        self.ram.io[SB] = 0xFF
+        self.ram.io[SC] &= 0x7F
+        self.cpu.set_interruptflag(SERIAL)
+
+    def process_events(self):
+        if self.cycles >= self.timer_next:
+            self.sync_timer()
+            self.schedule_timer()
+        if self.cycles >= self.serial_next:
+            self.serial_step()
+        if self.cycles >= self.ppu_next:
+            self.ppu_step()
+        self.next_event = min(self.ppu_next, self.timer_next, self.serial_next)
+
+    def run_cpu(self):
+        # Nothing but the CPU happens until the next event
+        self.loop_start = -1
+        while self.cycles < self.next_event:
+            pc = self.cpu.PC
             cycles = self.cpu.tick()
 
             # TODO: Benchmark whether 'if' and 'try/except' is better
             if cycles == -1: # CPU has HALTED
-                # Fast-forward to next interrupt:
-                # VBLANK and LCDC are covered by just returning.
-                # Timer has to be determined.
-                # As we are halted, we are guaranteed, that our state
-                # cannot be altered by other factors than time.
-                # For HiToLo interrupt it is indistinguishable whether
-                # it gets triggered mid-frame or by next frame
-                # Serial is not implemented, so this isn't a concern
-                cycles = min(self.timer.cyclestointerrupt(), self.cycles_remaining)
-
-                # Profiling 
+                # Fast-forward to the next event, as only an event can raise an interrupt. As we are halted, we are
+                # guaranteed, that our state cannot be altered by other factors than time.
+                # For HiToLo interrupt it is indistinguishable whether it gets triggered mid-frame or by next frame
+                cycles = self.next_event - self.cycles
+
+                # Profiling
                 if self.cpu.profiling:
                     self.cpu.hitrate[0x76] += cycles // 4
 
-            if self.sound_enabled:
-                self.sound.clock += cycles
-            self.cycles_remaining -= cycles
-
-            if self.timer.tick(cycles):
-                self.cpu.set_interruptflag(TIMER)
+            self.cycles += cycles
+            if self.cpu.PC < pc:
+                self.check_idle_loop(pc)
+
+    def check_idle_loop(self, end):
+        # Called after a backward jump from 'end'. Many games wait for an event by polling LY, STAT, IF or a variable
+        # set by an interrupt in a tight loop. If an iteration from the last jump to this one didn't write to memory
+        # or look at the timer or sound, and left the CPU as it found it, the next iterations will do exactly the
+        # same until an event changes the memory. We skip ahead by a whole number of iterations, like when halted.
+        state = self.cpu.A
+        state = (state << 8) | self.cpu.F
+        state = (state << 8) | self.cpu.B
+        state = (state << 8) | self.cpu.C
+        state = (state << 8) | self.cpu.D
+        state = (state << 8) | self.cpu.E
+        state = (state << 16) | self.cpu.HL
+        if (
+            self.cycles < self.next_event and not self.loop_dirty and self.cpu.PC == self.loop_start
+            and end == self.loop_end and state == self.loop_state and self.cpu.SP == self.loop_sp
+            and self.cpu.interrupt_master_enable == self.loop_ime
+        ):
+            period = self.cycles - self.loop_cycles
+            self.cycles += (self.next_event - self.cycles) // period * period
+
+        self.loop_start = self.cpu.PC
+        self.loop_end = end
+        self.loop_state = state
+        self.loop_sp = self.cpu.SP
+        self.loop_ime = self.cpu.interrupt_master_enable
+        self.loop_cycles = self.cycles
+        self.loop_dirty = False
 
     def tickframe(self):
-        lcdenabled = self.lcd.LCDC.lcd_enable
-        if lcdenabled:
-
-            # TODO: the 19, 41 and 49._ticks should correct for longer instructions
-            # Iterate the 144 lines on screen
-            for y in range(144):
-                self.check_LYC(y)
-
-                mode0_dots = 206
-                mode1_dots = 456
-                mode2_dots = 80
-                mode3_dots = 170
-
-                if self.is_cgb:
-                    if self.mem_manager.is_double_speed:
-                        mode0_dots *= 2
-                        mode1_dots *= 2
-                        mode2_dots *= 2
-                        mode3_dots *= 2
-
-                # Mode 2
-                # TODO: Move out of MB
-                self.set_STAT_mode(2)
-                self.calculate_cycles(mode2_dots)
-
-                # Mode 3
-                # TODO: Move out of MB
-                self.set_STAT_mode(3)
-                self.calculate_cycles(mode3_dots)
-                self.renderer.scanline(y, self.lcd)
-
-                # Mode 0
-                # TODO: Move out of MB
-                self.set_STAT_mode(0)
-                self.calculate_cycles(mode0_dots)
-                
-                
-            self.cpu.set_interruptflag(VBLANK)
-            if not self.disable_renderer:
-                self.renderer.render_screen(self.lcd)
-
-            # Wait for next frame
-            for y in range(144, 154):
-                self.check_LYC(y)
-
-                # Mode 1
-                self.set_STAT_mode(1)
-                self.calculate_cycles(mode1_dots)
-        else:
-            # https://www.reddit.com/r/EmuDev/comments/6r6gf3
-            # TODO: What happens if LCD gets turned on/off mid-cycle?
-            self.renderer.blank_screen()
-            # TODO: Move out of MB
-            self.set_STAT_mode(0)
-            self.setitem(LY, 0)
-
-            for y in range(154):
-                self.calculate_cycles(456)
+        if self.frame_done:
+            self.start_frame()
+        while not self.frame_done:
+            self.run_cpu()
+            self.process_events()
+        self.end_frame()
+
+    def end_frame(self):
+        # Keep the timer close to the clock, in case it is changed from outside the emulation
+        self.sync_timer()
         if self.sound_enabled:
+            self.sync_sound()
             self.sound.sync()
 
+    def run_until(self, pc, bank, address, value, cycles, scanline, vblank, serial):
+        # Runs like 'tickframe', until one of the conditions is met, and returns which one. Conditions of -1 or False
+        # aren't checked. PC and memory are checked after every instruction, and the rest at the events of the PPU.
+        stop = self.cycles + cycles if cycles >= 0 else NEVER
+        last_value = self.getitem(address) if address >= 0 else 0
+        serial_length = len(self.serialbuffer)
+        check_instructions = pc >= 0 or address >= 0 or serial
+
+        condition = ""
+        while condition == "":
+            if self.frame_done:
+                # LY is reset to 0 at the start of the frame, outside of the events
+                ly = self.ram.io[LY]
+                self.start_frame()
+                if self.ram.io[LY] != ly and self.ram.io[LY] == scanline:
+                    condition = "scanline"
+                    break
+            if stop < self.next_event:
+                self.next_event = stop
+
+            if not check_instructions:
+                self.run_cpu()
+            while check_instructions and self.cycles < self.next_event:
+                instruction_cycles = self.cpu.tick()
+                if instruction_cycles == -1: # CPU has HALTED
+                    instruction_cycles = self.next_event - self.cycles
+                self.cycles += instruction_cycles
+
+                if pc >= 0 and self.cpu.PC == pc and (bank < 0 or self.rombank(pc) == bank):
+                    condition = "pc"
+                elif address >= 0 and self.getitem(address) != last_value:
+                    last_value = self.getitem(address)
+                    if value < 0 or last_value == value:
+                        condition = "address"
+                elif serial and len(self.serialbuffer) != serial_length:
+                    condition = "serial"
+                if condition != "":
+                    break
+
+            if self.cycles >= self.next_event:
+                ly = self.ram.io[LY]
+                self.process_events()
+                if condition == "" and self.ram.io[LY] != ly:
+                    if self.ram.io[LY] == scanline:
+                        condition = "scanline"
+                    elif vblank and self.ram.io[LY] == 144:
+                        condition = "vblank"
+            if condition == "" and self.cycles >= stop:
+                condition = "cycles"
+            if self.frame_done:
+                self.end_frame()
+
+        self.next_event = min(self.ppu_next, self.timer_next, self.serial_next)
+        return condition
+
+    def rombank(self, pc):
+        # The ROM bank mapped at the address, or -1 outside of ROM
+        if pc < 0x4000:
+            return self.cartridge.active_rombank0()
+        elif pc < 0x8000:
+            return self.cartridge.active_rombank()
+        return -1
+
+    def tickframes(self, frames, render_last_only):
+        # The frames in between aren't shown, so only the last one has to be rendered
+        disable_renderer = self.disable_renderer
+        if render_last_only:
+            self.disable_renderer = True
+        for n in range(frames - 1):
+            self.tickframe()
+        self.disable_renderer = disable_renderer
+        self.tickframe()
+
     ###################################################################
     # MemoryManager
     #
@@ -256,4 +558,5 @@ class Motherboard:
         return self.mem_manager.getitem(i)
 
     def setitem(self, i, value):
+        self.loop_dirty = True
         self.mem_manager.setitem(i, value)
@@ -0,0 +1,87 @@
+#
+# License: See LICENSE.md file
+# GitHub: https://github.com/Baekalfen/PyBoy
+#
+
+import cython
+from libc.stdint cimport uint8_t, uint16_t, uint32_t
+cimport pyboy.core.mb
+from pyboy.core.bootrom cimport BootROM
+from pyboy.core.cartridge.base_mbc cimport BaseMBC
+from pyboy.core.lcd cimport LCD
+from pyboy.core.timer cimport Timer
+from pyboy.core.sound cimport Sound
+from pyboy.core.base_ram cimport RAM
+from pyboy.core.renderer cimport Renderer
+from pyboy.utils cimport IntIOInterface
+
+cdef int PAGE_SIZE, PAGES, UNCACHED
+cdef list UNMAPPED_RAMBANK
+cdef int IO_RAM, IO_JOYPAD, IO_SB, IO_SC, IO_DIV, IO_TIMA, IO_TMA, IO_TAC, IO_IF, IO_SOUND, IO_LCDC, IO_SCY, IO_SCX
+cdef int IO_DMA, IO_BGP, IO_OBP0, IO_OBP1, IO_WY, IO_WX, IO_BOOTROM
+cdef list DMG_IO
+
+
+cdef class MemoryManager:
+    cdef pyboy.core.mb.Motherboard mb
+    cdef BootROM bootrom
+    cdef BaseMBC cartridge
+    cdef LCD lcd
+    cdef Timer timer
+    cdef Sound sound
+    cdef RAM ram
+    cdef Renderer renderer
+
+    cdef list read_pages, write_pages
+    cdef object bootrompage, oampage
+    cdef list rompages, rampages, vrampages, wrampages
+    cdef bint is_double_speed
+    cdef uint8_t[:] io_read, io_write
+
+    cdef int rom_code, boot_code, vram_code, sram_code, wram_code
+    cdef list decode_sizes, decode_cache
+    cdef int[256] decode_pages
+    cdef int code_bank, write_bank
+    cdef uint32_t[:] code_cache, write_cache
+    cdef set ram_code_pages
+
+    cdef void map_all(self)
+    cdef void map_cartridge(self)
+    cdef list make_vrampages(self)
+    cdef void map_vram(self)
+    @cython.locals(pages=list)
+    cdef void map_vrampages(self, int)
+    @cython.locals(bank0=list, bankn=list, pages=list)
+    cdef void map_wram(self)
+    cdef list get_rompages(self, int)
+    cdef list get_rampages(self, int)
+    @cython.locals(addr=int, read=int, write=int)
+    cdef void map_io(self, list)
+    @cython.locals(n=int)
+    cdef void map_code(self, int, int, int)
+
+    cdef void select_code(self, int)
+    @cython.locals(n=int)
+    cdef void invalidate_code(self, int, int)
+    cdef void invalidate_rom(self, int, uint16_t)
+    @cython.locals(code=int, n=int, cache=uint32_t[:])
+    cdef void clear_decode_cache(self)
+
+    cdef uint8_t getitem(self, uint16_t)
+    @cython.locals(handler=uint8_t)
+    cdef uint8_t get_io(self, uint16_t)
+    @cython.locals(code=int)
+    cdef void setitem(self, uint16_t, uint8_t)
+    @cython.locals(handler=uint8_t)
+    cdef void set_io(self, uint16_t, uint8_t)
+    cdef uint8_t get_cgb_io(self, uint8_t, uint16_t)
+    cdef void set_cgb_io(self, uint8_t, uint16_t, uint8_t)
+    @cython.locals(offset=int, dst=int, n=int, page=object)
+    cdef void transfer_DMA(self, uint8_t)
+    @cython.locals(n=int, i=int, code=int, source=object)
+    cdef void transfer_VRAM(self, int, int, int)
+    cdef void switch_speed(self)
+    cdef void do_potential_transfer(self)
+    cdef void save_state(self, IntIOInterface)
+    cdef void load_state(self, IntIOInterface, int)
+    cdef bint is_in_ram(self, uint16_t)
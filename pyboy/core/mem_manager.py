@@ -1,4 +1,44 @@
+from array import array
 
+PAGE_SIZE = 0x100
+PAGES = 0x100
+UNMAPPED_RAMBANK = [None] * 0x20
+UNCACHED = -1
+
+# Handlers of the I/O registers (0xFF00-0xFF7F). The ones of the CGB are numbered from 0x20 in CgbMemoryManager.
+(
+    IO_RAM, IO_JOYPAD, IO_SB, IO_SC, IO_DIV, IO_TIMA, IO_TMA, IO_TAC, IO_IF, IO_SOUND, IO_LCDC, IO_SCY, IO_SCX, IO_DMA,
+    IO_BGP, IO_OBP0, IO_OBP1, IO_WY, IO_WX, IO_BOOTROM
+) = range(20)
+
+# Address, read handler and write handler of the registers with side effects, or which are kept outside of the I/O
+# RAM. All other registers are read and written directly in the I/O RAM.
+DMG_IO = [
+    (0xFF00, IO_RAM, IO_JOYPAD),
+    (0xFF01, IO_RAM, IO_SB),
+    (0xFF02, IO_RAM, IO_SC),
+    (0xFF04, IO_DIV, IO_DIV),
+    (0xFF05, IO_TIMA, IO_TIMA),
+    (0xFF06, IO_TMA, IO_TMA),
+    (0xFF07, IO_TAC, IO_TAC),
+    (0xFF0F, IO_IF, IO_IF),
+] + [(addr, IO_SOUND, IO_SOUND) for addr in range(0xFF10, 0xFF40)] + [
+    (0xFF40, IO_LCDC, IO_LCDC),
+    (0xFF42, IO_SCY, IO_SCY),
+    (0xFF43, IO_SCX, IO_SCX),
+    (0xFF46, IO_RAM, IO_DMA),
+    (0xFF47, IO_BGP, IO_BGP),
+    (0xFF48, IO_OBP0, IO_OBP0),
+    (0xFF49, IO_OBP1, IO_OBP1),
+    (0xFF4A, IO_WY, IO_WY),
+    (0xFF4B, IO_WX, IO_WX),
+    (0xFF50, IO_RAM, IO_BOOTROM),
+]
+
+
+def make_pages(buf):
+    view = memoryview(buf)
+    return [view[n:n + PAGE_SIZE] for n in range(0, len(view), PAGE_SIZE)]
 
 
 class MemoryManager:
@@ -12,8 +52,170 @@ class MemoryManager:
         self.ram       = ram
         self.renderer  = renderer
 
+        # The address space is split into 256 pages of 256 bytes. Each entry is a view into the buffer currently
+        # mapped at that page, or None, if the page has side effects and has to go through the address checks below.
+        self.read_pages  = [None] * PAGES
+        self.write_pages = [None] * PAGES
+
+        self.bootrompage = make_pages(self.bootrom.bootrom)[0]
+        self.rompages    = [None] * len(self.cartridge.rombanks)
+        self.rampages    = [None] * len(self.cartridge.rambanks)
+        self.vrampages   = self.make_vrampages()
+        self.oampage     = make_pages(self.lcd.OAM)[0]
+        self.wrampages   = [make_pages(self.ram.wram[bank]) for bank in range(len(self.ram.wram))]
+
+        # Only the CGB can switch to double speed
+        self.is_double_speed = False
+
+        # Each I/O register has a handler for reads and one for writes. See get_io and set_io.
+        self.io_read  = array("B", [IO_RAM]) * 0x80
+        self.io_write = array("B", [IO_RAM]) * 0x80
+        self.map_io(DMG_IO)
+
+        # Decoded instructions are cached for every bank, that code can run from. Each bank gets its own array in
+        # decode_cache, which is only allocated, when code first runs from the bank. Each page in decode_pages holds
+        # the number of its bank shifted up by 16, plus the offset of the page in the bank. See CPU.fetch_and_execute.
+        self.rom_code  = 0
+        self.boot_code = self.rom_code + len(self.cartridge.rombanks)
+        self.vram_code = self.boot_code + 1
+        self.sram_code = self.vram_code + len(self.vrampages)
+        self.wram_code = self.sram_code + len(self.cartridge.rambanks)
+        self.decode_sizes = (
+            [0x4000] * len(self.cartridge.rombanks) + [PAGE_SIZE] + [0x2000] * len(self.vrampages) +
+            [0x2000] * len(self.cartridge.rambanks) + [0x1000] * len(self.wrampages)
+        )
+        self.decode_cache = [None] * len(self.decode_sizes)
+        self.decode_pages = [UNCACHED for _ in range(PAGES)]
+        # The bank, which the CPU runs from, and the one last written to, are kept at hand
+        self.code_bank = UNCACHED
+        self.code_cache = None
+        self.write_bank = UNCACHED
+        self.write_cache = None
+        # Pages holding code from RAM
+        self.ram_code_pages = set()
+
+        self.map_all()
+
+    ##############################################################
+    # Page table
+    #
+    def map_all(self):
+        self.map_cartridge()
+        self.map_vram()
+        self.map_wram()
+
+    def map_cartridge(self):
+        # ROM is never written directly, as writes go to the MBC registers
+        self.read_pages[0x00:0x40] = self.get_rompages(self.cartridge.active_rombank0())
+        self.map_code(0x00, 0x40, self.rom_code + self.cartridge.active_rombank0())
+        if self.mb.bootrom_enabled:
+            self.read_pages[0x00] = self.bootrompage
+            self.map_code(0x00, 0x01, self.boot_code)
+        self.read_pages[0x40:0x80] = self.get_rompages(self.cartridge.active_rombank())
+        self.map_code(0x40, 0x40, self.rom_code + self.cartridge.active_rombank())
+        self.read_pages[0xA0:0xC0] = self.get_rampages(self.cartridge.active_rambank_read())
+        self.write_pages[0xA0:0xC0] = self.get_rampages(self.cartridge.active_rambank_write())
+        if self.cartridge.active_rambank_read() == -1:
+            self.map_code(0xA0, 0x20, UNCACHED)
+        else:
+            self.map_code(0xA0, 0x20, self.sram_code + self.cartridge.active_rambank_read())
+
+    def make_vrampages(self):
+        return [make_pages(self.lcd.VRAM0)]
+
+    def map_vram(self):
+        self.map_vrampages(0)
+
+    def map_vrampages(self, bank):
+        pages = self.vrampages[bank]
+        self.read_pages[0x80:0xA0] = pages
+        # Writes to tile data (0x8000-0x97FF) have to notify the renderer. Only the tile maps are written directly.
+        self.write_pages[0x98:0xA0] = pages[0x18:]
+        self.map_code(0x80, 0x20, self.vram_code + bank)
+
+    def map_wram(self):
+        bank0 = self.wrampages[0]
+        bankn = self.wrampages[self.ram.active_wram_bank()]
+        for pages in (self.read_pages, self.write_pages):
+            pages[0xC0:0xD0] = bank0
+            pages[0xD0:0xE0] = bankn
+            # Echo of 0xC000-0xDDFF
+            pages[0xE0:0xF0] = bank0
+            pages[0xF0:0xFE] = bankn[:0x0E]
+        self.map_code(0xC0, 0x10, self.wram_code)
+        self.map_code(0xD0, 0x10, self.wram_code + self.ram.active_wram_bank())
+        # The echo shares the decoded code as well, so a write to either address invalidates both
+        self.map_code(0xE0, 0x10, self.wram_code)
+        self.map_code(0xF0, 0x0E, self.wram_code + self.ram.active_wram_bank())
+
+    def map_io(self, registers):
+        for addr, read, write in registers:
+            self.io_read[addr - 0xFF00] = read
+            self.io_write[addr - 0xFF00] = write
+
+    def map_code(self, first, count, bank):
+        for n in range(count):
+            self.decode_pages[first + n] = UNCACHED if bank == UNCACHED else (bank << 16) | (n * PAGE_SIZE)
+
+    def get_rompages(self, bank):
+        if self.rompages[bank] is None:
+            self.rompages[bank] = make_pages(self.cartridge.rombanks[bank])
+        return self.rompages[bank]
+
+    def get_rampages(self, bank):
+        if bank == -1:
+            return UNMAPPED_RAMBANK
+        if self.rampages[bank] is None:
+            self.rampages[bank] = make_pages(self.cartridge.rambanks[bank])
+        return self.rampages[bank]
+
+    ##############################################################
+    # Decode cache
+    #
+    def select_code(self, bank):
+        # Called, when the CPU runs from another bank than the last instruction
+        if self.decode_cache[bank] is None:
+            self.decode_cache[bank] = array("I", [0]) * self.decode_sizes[bank]
+        self.code_bank = bank
+        self.code_cache = self.decode_cache[bank]
+
+    def invalidate_code(self, code, offset):
+        # Nothing to clear in a bank, which code has never run from
+        if code >> 16 != self.write_bank:
+            if self.decode_cache[code >> 16] is None:
+                return
+            self.write_bank = code >> 16
+            self.write_cache = self.decode_cache[code >> 16]
+
+        # An instruction is up to 3 bytes long. Clear the ones starting at, or up to 2 bytes before, the written byte,
+        # if they cover it. Instructions crossing a page boundary are never cached, so the search stops at the page.
+        offset += code & 0xFFFF
+        for n in range(3):
+            if (offset & 0xFF) < n:
+                break
+            if (self.write_cache[offset - n] >> 25) > n:
+                self.write_cache[offset - n] = 0
+
+    def invalidate_rom(self, bank, addr):
+        self.invalidate_code(((self.rom_code + bank) << 16) | (addr & 0x3F00), addr & 0xFF)
+
+    def clear_decode_cache(self):
+        # ROM and the boot ROM can't change without invalidating the code, so only the pages of code from RAM are
+        # cleared
+        for code in self.ram_code_pages:
+            cache = self.decode_cache[code >> 16]
+            for n in range(PAGE_SIZE):
+                cache[(code & 0xFFFF) + n] = 0
+        self.ram_code_pages.clear()
+
+    ##############################################################
+    # Memory access
+    #
     def getitem(self, addr):
-        if 0x0000 <= addr < 0x4000:
+        page = self.read_pages[addr >> 8]
+        if page is not None:
+            return page[addr & 0xFF]
+        elif 0x0000 <= addr < 0x4000:
             if addr <= 0xFF and self.mb.bootrom_enabled:
                 return self.bootrom.getitem(addr)
             else:
@@ -33,50 +235,66 @@ class MemoryManager:
         elif 0xFF00 <= addr < 0xFF80:
             return self.get_io(addr)
         elif addr == 0xFFFF:
-            return self.ram.read(addr)              # TODO: Eiter move this call to other ram read and/or implement interrupt register class
+            return self.mb.cpu.interrupts_enabled_register
         else:
             raise IndexError("Memory violation. Read: %s" % hex(addr))
             
 
     def get_io(self, addr):
-        if addr == 0xFF04:
+        handler = self.io_read[addr - 0xFF00]
+        if handler == IO_RAM:
+            return self.ram.io[addr - 0xFF00]
+        elif handler == IO_IF:
+            return self.mb.cpu.interrupts_flag_register
+        elif handler == IO_LCDC:
+            return self.lcd.LCDC.value
+        elif handler == IO_SCY:
+            return self.lcd.SCY
+        elif handler == IO_SCX:
+            return self.lcd.SCX
+        elif handler == IO_WY:
+            return self.lcd.WY
+        elif handler == IO_WX:
+            return self.lcd.WX
+        elif handler == IO_BGP:
+            return self.lcd.BGP.value
+        elif handler == IO_OBP0:
+            return self.lcd.OBP0.value
+        elif handler == IO_OBP1:
+            return self.lcd.OBP1.value
+        elif handler == IO_DIV:
+            self.mb.sync_timer()
             return self.timer.DIV
-        elif addr == 0xFF05:
+        elif handler == IO_TIMA:
+            self.mb.sync_timer()
             return self.timer.TIMA
-        elif addr == 0xFF06:
+        elif handler == IO_TMA:
             return self.timer.TMA
-        elif addr == 0xFF07:
+        elif handler == IO_TAC:
             return self.timer.TAC
-        elif 0xFF10 <= addr < 0xFF40:
+        elif handler == IO_SOUND:
             if self.mb.sound_enabled:
+                self.mb.sync_sound()
                 return self.sound.get(addr - 0xFF10)
             else:
                 return 0
-        elif addr == 0xFF40:
-            return self.lcd.LCDC.value
-        elif addr == 0xFF42:
-            return self.lcd.SCY
-        elif addr == 0xFF43:
-            return self.lcd.SCX
-        elif addr == 0xFF47:
-            return self.lcd.BGP.value
-        elif addr == 0xFF48:
-            return self.lcd.OBP0.value
-        elif addr == 0xFF49:
-            return self.lcd.OBP1.value
-        elif addr == 0xFF4A:
-            return self.lcd.WY
-        elif addr == 0xFF4B:
-            return self.lcd.WX
         else:
-            return self.ram.read(addr)
-            # TODO: Should we throw exception here instead?
+            return self.get_cgb_io(handler, addr)
 
 
     def setitem(self, addr, value):
         assert 0 <= value < 0x100, "Memory write error! Can't write %s to %s" % (hex(value), hex(addr))
-        if 0x0000 <= addr < 0x8000:
+        # Writes to ROM go to the MBC, and never change code
+        if addr >= 0x8000:
+            code = self.decode_pages[addr >> 8]
+            if code != UNCACHED:
+                self.invalidate_code(code, addr & 0xFF)
+        page = self.write_pages[addr >> 8]
+        if page is not None:
+            page[addr & 0xFF] = value
+        elif 0x0000 <= addr < 0x8000:
             self.cartridge.setitem(addr, value)
+            self.map_cartridge()
         elif 0x8000 <= addr < 0xA000:
             self.lcd.setVRAM(addr, value)
         elif 0xA000 <= addr < 0xC000:
@@ -87,61 +305,123 @@ class MemoryManager:
             self.lcd.OAM[addr - 0xFE00] = value     # TODO: encapsulation?
         elif 0xFEA0 <= addr < 0xFF00:
             self.ram.write(addr, value)
-        elif 0xFF00 <= 0xFF80:
+        elif 0xFF00 <= addr < 0xFF80:
             self.set_io(addr, value)
         elif addr == 0xFFFF:
-            self.ram.write(addr, value)
+            self.mb.cpu.interrupts_enabled_register = value
         
 
     def set_io(self, addr, value):
-        if addr == 0xFF00:
-            self.ram.write(addr, self.mb.interaction.pull(value))
-        elif addr == 0xFF01:
-            self.mb.serialbuffer += chr(value)
-            self.ram.write(addr, value)
-        elif addr == 0xFF04:
+        handler = self.io_write[addr - 0xFF00]
+        if handler == IO_RAM:
+            self.ram.io[addr - 0xFF00] = value
+        elif handler == IO_IF:
+            self.mb.cpu.interrupts_flag_register = value
+        elif handler == IO_JOYPAD:
+            self.ram.io[addr - 0xFF00] = self.mb.interaction.pull(value)
+        elif handler == IO_LCDC:
+            self.lcd.LCDC.set(value)
+        elif handler == IO_SCY:
+            self.lcd.SCY = value
+        elif handler == IO_SCX:
+            self.lcd.SCX = value
+        elif handler == IO_WY:
+            self.lcd.WY = value
+        elif handler == IO_WX:
+            self.lcd.WX = value
+        elif handler == IO_BGP:
+            self.renderer.palettes_changed |= self.lcd.BGP.set(value)
+        elif handler == IO_OBP0:
+            self.renderer.palettes_changed |= self.lcd.OBP0.set(value)
+        elif handler == IO_OBP1:
+            self.renderer.palettes_changed |= self.lcd.OBP1.set(value)
+        elif handler == IO_DMA:
+            self.transfer_DMA(value)
+        elif handler == IO_DIV:
+            self.mb.sync_timer()
             self.timer.DIV = 0
-        elif addr == 0xFF05:
+        elif handler == IO_TIMA:
+            self.mb.sync_timer()
             self.timer.TIMA = value
-        elif addr == 0xFF06:
+            self.mb.schedule_timer()
+        elif handler == IO_TMA:
+            # Only used when TIMA overflows, which is always an event
             self.timer.TMA = value
-        elif addr == 0xFF07:
+        elif handler == IO_TAC:
+            self.mb.sync_timer()
             self.timer.TAC = value & 0b111
-        elif 0xFF10 <= addr < 0xFF40:
+            self.mb.schedule_timer()
+        elif handler == IO_SOUND:
             if self.mb.sound_enabled:
+                self.mb.sync_sound()
                 self.sound.set(addr - 0xFF10, value)
-        elif addr == 0xFF40:
-            self.lcd.LCDC.set(value)
-        elif addr == 0xFF42:
-            self.lcd.SCY = value
-        elif addr == 0xFF43:
-            self.lcd.SCX = value
-        elif addr == 0xFF46:
-            self.transfer_DMA(value)
-        elif addr == 0xFF47:
-            self.renderer.clearcache |= self.lcd.BGP.set(value)
-        elif addr == 0xFF48:
-            self.renderer.clearcache |= self.lcd.OBP0.set(value)
-        elif addr == 0xFF49:
-            self.renderer.clearcache |= self.lcd.OBP1.set(value)
-        elif addr == 0xFF4A:
-            self.lcd.WY = value
-        elif addr == 0xFF4B:
-            self.lcd.WX = value
-        elif addr == 0xFF50 and self.mb.bootrom_enabled and (value == 0x1 or value == 0x11):
-            self.mb.bootrom_enabled = False
-            self.ram.write(addr, value)
+        elif handler == IO_SB:
+            self.mb.serialbuffer += chr(value)
+            self.ram.io[addr - 0xFF00] = value
+        elif handler == IO_SC:
+            self.ram.io[addr - 0xFF00] = value
+            self.mb.schedule_serial(value)
+        elif handler == IO_BOOTROM:
+            self.ram.io[addr - 0xFF00] = value
+            if self.mb.bootrom_enabled and (value == 0x1 or value == 0x11):
+                self.mb.bootrom_enabled = False
+                self.map_cartridge()
         else:
-            self.ram.write(addr, value)
-            # TODO: exception?
+            self.set_cgb_io(handler, addr, value)
+
+    # The CGB registers are handled by CgbMemoryManager, and never mapped on the DMG
+    def get_cgb_io(self, handler, addr):
+        return self.ram.io[addr - 0xFF00]
+
+    def set_cgb_io(self, handler, addr, value):
+        self.ram.io[addr - 0xFF00] = value
 
     def transfer_DMA(self, src):
         # http://problemkaputt.de/pandocs.htm#lcdoamdmatransfers
         # TODO: Add timing delay of 160µs and disallow access to RAM!
-        dst = 0xFE00
-        offset = src * 0x100
-        for n in range(0xA0):
-            self.setitem(dst + n, self.getitem(n + offset))
+        page = self.read_pages[src]
+        if page is not None:
+            self.oampage[:0xA0] = page[:0xA0]
+        else:
+            dst = 0xFE00
+            offset = src * 0x100
+            for n in range(0xA0):
+                self.setitem(dst + n, self.getitem(n + offset))
+
+    def transfer_VRAM(self, dst, src, length):
+        # Copies blocks of 16 bytes to VRAM for the HDMA. The blocks never cross a page, so whole pages are copied at
+        # once, when the source is mapped to a buffer. The renderer is told about each tile only once.
+        while length > 0:
+            src &= 0xFFFF
+            n = min(length, PAGE_SIZE - (src & 0xFF), PAGE_SIZE - (dst & 0xFF))
+            source = self.read_pages[src >> 8]
+            if source is None or dst >= 0xA000:
+                for i in range(n):
+                    self.setitem(dst + i, self.getitem(src + i))
+            else:
+                code = self.decode_pages[dst >> 8]
+                if code in self.ram_code_pages:
+                    for i in range(n):
+                        self.invalidate_code(code, (dst & 0xFF) + i)
+                self.read_pages[dst >> 8][dst & 0xFF:(dst & 0xFF) + n] = source[src & 0xFF:(src & 0xFF) + n]
+                for i in range(0, n, 16):
+                    self.lcd.mark_tile(dst + i)
+            dst += n
+            src += n
+            length -= n
+
+    # Speed switching and HDMA are CGB features. The DMG ignores them.
+    def switch_speed(self):
+        pass
+
+    def do_potential_transfer(self):
+        pass
+
+    def save_state(self, f):
+        pass
+
+    def load_state(self, f, state_version):
+        pass
 
     # Helper function to make getitem/setitem cleaner
     def is_in_ram(self, addr):
@@ -0,0 +1,191 @@
+#
+# License: See LICENSE.md file
+# GitHub: https://github.com/Baekalfen/PyBoy
+#
+"""
+Renders the screen with NumPy, when PyBoy isn't compiled with Cython. Instead of looping over every pixel, the tile
+map and tile caches are gathered for the whole screen at once, using the parameters stored for each scanline. The
+result is pixel for pixel the same as `Renderer.render_screen`.
+"""
+
+import platform
+
+try:
+    import numpy as np
+    # NumPy is slower than the plain loops, when they are compiled by PyPy's JIT
+    numpy_enabled = platform.python_implementation() == "CPython"
+except ImportError:
+    numpy_enabled = False
+
+ROWS, COLS = 144, 160
+
+
+def frame_parameters(renderer):
+    params = np.array(renderer._scanlineparameters, dtype=np.int64)
+    # One column per scanline parameter, shaped to broadcast against the rows of the screen
+    return [params[:, n, None] for n in range(9)]
+
+
+def tile_rows(vram, mapoffset, tile_data_select, col, row):
+    # Looks up the tiles in the tile map at the given pixel coordinates, and returns their rows in the tile cache
+    tile = vram[mapoffset + row // 8 * 32 % 0x400 + col // 8 % 32].astype(np.int64)
+    # If using signed tile indices, modify index
+    tile = np.where(tile_data_select, tile, (tile ^ 0x80) + 128)
+    return 8*tile + row % 8
+
+
+def sprite_lines(lcd, spriteheight):
+    # Like Renderer.scan_sprites, only the first 10 sprites in OAM are shown on each scanline
+    y = np.frombuffer(lcd.OAM, dtype=np.uint8)[0::4].astype(np.int64) - 16
+    rows = np.arange(ROWS)[:, None]
+    on_line = (y <= rows) & (rows < y + spriteheight)
+    return on_line & (np.cumsum(on_line, axis=1) <= 10)
+
+
+class NumpyRenderer:
+    def __init__(self, renderer, tiles):
+        self.renderer = renderer
+        self.screen = np.frombuffer(renderer._screenbuffer_raw, dtype=np.uint32).reshape(ROWS, COLS)
+        self.tilecache = np.frombuffer(renderer._tilecache_raw, dtype=np.uint8).reshape(tiles * 8, 8)
+        self.bg_rgba = np.frombuffer(renderer._bg_rgba, dtype=np.uint32)
+        self.obj_rgba = np.frombuffer(renderer._obj_rgba, dtype=np.uint32)
+        self.y = np.arange(ROWS)[:, None]
+        self.x = np.arange(COLS)[None, :]
+
+    def render_screen(self, lcd):
+        y, x = self.y, self.x
+        # A DMG cartridge on a CGB reads the tile maps from the selected VRAM bank, like cgbLCD.getVRAM
+        bank = lcd.VRAM1 if hasattr(lcd, "vbk") and lcd.vbk.active_bank else lcd.VRAM0
+        vram = np.frombuffer(bank, dtype=np.uint8)
+        bx, by, wx, wy, tile_data_select, bgmap_select, wmap_select, _, bg_enable = frame_parameters(self.renderer)
+
+        bgmap = np.where(bgmap_select == 0, 0x1800, 0x1C00)
+        background = self.bg_rgba[self.tilecache[tile_rows(vram, bgmap, tile_data_select, x + bx, y + by), (x+bx) % 8]]
+        self.screen[:] = np.where(bg_enable != 0, background, self.renderer.color_palette[0])
+
+        # Whether the window is shown, and its tile data, are decided by the registers as they are now
+        if lcd.LCDC.window_enable:
+            window = (wy <= y) & (wx <= x)
+            wmap = np.where(wmap_select == 0, 0x1800, 0x1C00)
+            wt = tile_rows(vram, wmap, lcd.LCDC.tiledata_select, x - wx, y - wy)
+            self.screen[window] = self.bg_rgba[self.tilecache[wt, (x-wx) % 8][window]]
+
+        if lcd.LCDC.sprite_enable:
+            self.render_sprites(lcd)
+
+    def render_sprites(self, lcd):
+        spriteheight = 16 if lcd.LCDC.sprite_height else 8
+        bgpkey = self.renderer.color_palette[lcd.BGP.getcolor(0)]
+        alphamask = self.renderer.alphamask
+        shown = sprite_lines(lcd, spriteheight)
+
+        # Later sprites are drawn on top, as in Renderer.render_sprites
+        for n in range(0x00, 0xA0, 4):
+            y = lcd.OAM[n] - 16
+            x = lcd.OAM[n + 1] - 8
+            if y + spriteheight <= 0 or y >= ROWS or x + 8 <= 0 or x >= COLS:
+                continue
+            tileindex = lcd.OAM[n + 2]
+            attributes = lcd.OAM[n + 3]
+            palette = 4 if attributes & 0b10000 else 0
+
+            # Color code 0 is transparent in the sprite palettes
+            sprite = self.obj_rgba[palette + self.tilecache[8 * tileindex:8*tileindex + spriteheight]]
+            if attributes & 0b01000000:
+                sprite = sprite[::-1]
+            if attributes & 0b00100000:
+                sprite = sprite[:, ::-1]
+
+            # Clip the sprite to the screen
+            top, left = max(-y, 0), max(-x, 0)
+            sprite = sprite[top:min(spriteheight, ROWS - y), left:min(8, COLS - x)]
+            target = self.screen[y + top:y + top + sprite.shape[0], x + left:x + left + sprite.shape[1]]
+
+            mask = ((sprite & alphamask) != 0) & shown[y + top:y + top + sprite.shape[0], n // 4, None]
+            if attributes & 0b10000000:
+                # Behind the background, unless the background has color 0
+                mask &= target == bgpkey
+            target[mask] = sprite[mask]
+
+
+class NumpyCGBRenderer(NumpyRenderer):
+    def __init__(self, renderer, tiles):
+        NumpyRenderer.__init__(self, renderer, tiles)
+        self.col_index0 = np.frombuffer(renderer._col_index0_raw, dtype=np.uint8).reshape(tiles * 8, 8)
+        self.col_index1 = np.frombuffer(renderer._col_index1_raw, dtype=np.uint8).reshape(tiles * 8, 8)
+        self.col_i = np.zeros((ROWS, COLS), dtype=np.uint8)
+        self.bg_priority = np.zeros((ROWS, COLS), dtype=bool)
+        self.use_priority_flags = np.zeros((ROWS, 1), dtype=bool)
+
+    def render_screen(self, lcd):
+        y, x = self.y, self.x
+        vram0 = np.frombuffer(lcd.VRAM0, dtype=np.uint8)
+        vram1 = np.frombuffer(lcd.VRAM1, dtype=np.uint8)
+        bx, by, wx, wy, tile_data_select, bgmap_select, wmap_select, window_enable, bg_enable = frame_parameters(
+            self.renderer
+        )
+
+        # Every pixel is either window or background, so the tile map coordinates are picked first
+        window = (window_enable != 0) & (wy <= y) & (wx <= x)
+        col = np.where(window, x - wx, x + bx)
+        row = np.where(window, y - wy, y + by)
+        mapoffset = np.where(np.where(window, wmap_select, bgmap_select) == 0, 0x1800, 0x1C00)
+        index = mapoffset + row // 8 * 32 % 0x400 + col // 8 % 32
+
+        # CGB specific map attributes, stored at the same index in VRAM bank 1
+        attributes = vram1[index]
+        palette = attributes & 0b111
+        vbank = (attributes >> 3) & 1 != 0
+        horiflip = (attributes >> 5) & 1 != 0
+        vertflip = (attributes >> 6) & 1 != 0
+
+        tile = vram0[index].astype(np.int64)
+        tile = np.where(tile_data_select, tile, (tile ^ 0x80) + 128)
+        xx = np.where(horiflip, 7 - col % 8, col % 8)
+        yy = 8*tile + np.where(vertflip, 7 - row % 8, row % 8)
+
+        self.col_i[:] = np.where(vbank, self.col_index1[yy, xx], self.col_index0[yy, xx])
+        self.screen[:] = self.bg_rgba[palette*4 + self.col_i]
+        self.bg_priority[:] = (attributes >> 7) & 1 != 0
+        self.use_priority_flags[:] = bg_enable != 0
+
+        if lcd.LCDC.sprite_enable:
+            self.render_sprites(lcd)
+
+    def render_sprites(self, lcd):
+        spriteheight = 16 if lcd.LCDC.sprite_height else 8
+        alphamask = self.renderer.alphamask
+        shown = sprite_lines(lcd, spriteheight)
+
+        # CGB prioritizes sprites located first in OAM, so they are drawn last
+        for n in range(0x9C, -0x04, -4):
+            y = lcd.OAM[n] - 16
+            x = lcd.OAM[n + 1] - 8
+            if y + spriteheight <= 0 or y >= ROWS or x + 8 <= 0 or x >= COLS:
+                continue
+            tileindex = lcd.OAM[n + 2]
+            attributes = lcd.OAM[n + 3]
+            spritecache = self.col_index1 if attributes & 0b1000 else self.col_index0
+
+            # Color code 0 is transparent in the sprite palettes
+            sprite = self.obj_rgba[(attributes & 0b111) * 4 + spritecache[8 * tileindex:8*tileindex + spriteheight]]
+            if attributes & 0b01000000:
+                sprite = sprite[::-1]
+            if attributes & 0b00100000:
+                sprite = sprite[:, ::-1]
+
+            # Clip the sprite to the screen
+            top, left = max(-y, 0), max(-x, 0)
+            sprite = sprite[top:min(spriteheight, ROWS - y), left:min(8, COLS - x)]
+            rows = slice(y + top, y + top + sprite.shape[0])
+            cols = slice(x + left, x + left + sprite.shape[1])
+
+            # Behind the background, unless the background has color 0, when either the tile map or OAM says so
+            behind = self.bg_priority[rows, cols]
+            if attributes & 0b10000000:
+                behind = True
+            hidden = self.use_priority_flags[rows] & behind & (self.col_i[rows, cols] != 0)
+
+            mask = ((sprite & alphamask) != 0) & ~hidden & shown[rows, n // 4, None]
+            target = self.screen[rows, cols]
+            target[mask] = sprite[mask]
@@ -12,8 +12,7 @@ from libc.stdint cimport uint8_t, uint16_t, uint32_t
 cdef uint16_t FLAGC, FLAGH, FLAGN, FLAGZ
 cdef uint8_t[512] OPCODE_LENGTHS
 cdef uint16_t opcode_length(uint16_t)
-@cython.locals(v=cython.int, a=cython.int, b=cython.int, pc=cython.ushort)
-cdef int execute_opcode(cpu.CPU, uint16_t)
+cdef int execute_opcode(cpu.CPU, uint16_t, int)
 
 cdef uint8_t no_opcode(cpu.CPU) except -1
 @cython.locals(v=int, flag=uint8_t, t=int)
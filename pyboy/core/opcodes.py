@@ -5,6 +5,12 @@
 
 import array
 
+try:
+    from cython import compiled
+    cythonmode = compiled
+except ImportError:
+    cythonmode = False
+
 FLAGC, FLAGH, FLAGN, FLAGZ = range(4, 8)
 
 
@@ -5234,1054 +5240,1039 @@ def opcode_length(opcode):
     return OPCODE_LENGTHS[opcode]
 
 
-def execute_opcode(cpu, opcode):
-    oplen = opcode_length(opcode)
-    v = 0
-    pc = cpu.PC
-
-    if oplen > 1:
-        if oplen == 2:
-            # 8-bit immediate
-            v = cpu.mb.getitem(pc+1)
-        elif oplen == 3:
-            # 16-bit immediate
-            # Flips order of values due to big-endian
-            a = cpu.mb.getitem(pc+2)
-            b = cpu.mb.getitem(pc+1)
-            v = (a << 8) + b
-        return opcodeDict[opcode](cpu, v)
-    else:
-        return opcodeDict[opcode](cpu)
-
-    # if opcode in writeOpCodes:
-    #     return opcodeList[opcode](cpu, v)
-    # else:
-    #     return opcodeList[opcode](cpu)
-
-    # if opcode == 0x00:
-    #     return NOP_00(cpu)
-    # elif opcode == 0x01:
-    #     return LD_01(cpu, v)
-    # elif opcode == 0x02:
-    #     return LD_02(cpu)
-    # elif opcode == 0x03:
-    #     return INC_03(cpu)
-    # elif opcode == 0x04:
-    #     return INC_04(cpu)
-    # elif opcode == 0x05:
-    #     return DEC_05(cpu)
-    # elif opcode == 0x06:
-    #     return LD_06(cpu, v)
-    # elif opcode == 0x07:
-    #     return RLCA_07(cpu)
-    # elif opcode == 0x08:
-    #     return LD_08(cpu, v)
-    # elif opcode == 0x09:
-    #     return ADD_09(cpu)
-    # elif opcode == 0x0A:
-    #     return LD_0A(cpu)
-    # elif opcode == 0x0B:
-    #     return DEC_0B(cpu)
-    # elif opcode == 0x0C:
-    #     return INC_0C(cpu)
-    # elif opcode == 0x0D:
-    #     return DEC_0D(cpu)
-    # elif opcode == 0x0E:
-    #     return LD_0E(cpu, v)
-    # elif opcode == 0x0F:
-    #     return RRCA_0F(cpu)
-    # elif opcode == 0x10:
-    #     return STOP_10(cpu, v)
-    # elif opcode == 0x11:
-    #     return LD_11(cpu, v)
-    # elif opcode == 0x12:
-    #     return LD_12(cpu)
-    # elif opcode == 0x13:
-    #     return INC_13(cpu)
-    # elif opcode == 0x14:
-    #     return INC_14(cpu)
-    # elif opcode == 0x15:
-    #     return DEC_15(cpu)
-    # elif opcode == 0x16:
-    #     return LD_16(cpu, v)
-    # elif opcode == 0x17:
-    #     return RLA_17(cpu)
-    # elif opcode == 0x18:
-    #     return JR_18(cpu, v)
-    # elif opcode == 0x19:
-    #     return ADD_19(cpu)
-    # elif opcode == 0x1A:
-    #     return LD_1A(cpu)
-    # elif opcode == 0x1B:
-    #     return DEC_1B(cpu)
-    # elif opcode == 0x1C:
-    #     return INC_1C(cpu)
-    # elif opcode == 0x1D:
-    #     return DEC_1D(cpu)
-    # elif opcode == 0x1E:
-    #     return LD_1E(cpu, v)
-    # elif opcode == 0x1F:
-    #     return RRA_1F(cpu)
-    # elif opcode == 0x20:
-    #     return JR_20(cpu, v)
-    # elif opcode == 0x21:
-    #     return LD_21(cpu, v)
-    # elif opcode == 0x22:
-    #     return LD_22(cpu)
-    # elif opcode == 0x23:
-    #     return INC_23(cpu)
-    # elif opcode == 0x24:
-    #     return INC_24(cpu)
-    # elif opcode == 0x25:
-    #     return DEC_25(cpu)
-    # elif opcode == 0x26:
-    #     return LD_26(cpu, v)
-    # elif opcode == 0x27:
-    #     return DAA_27(cpu)
-    # elif opcode == 0x28:
-    #     return JR_28(cpu, v)
-    # elif opcode == 0x29:
-    #     return ADD_29(cpu)
-    # elif opcode == 0x2A:
-    #     return LD_2A(cpu)
-    # elif opcode == 0x2B:
-    #     return DEC_2B(cpu)
-    # elif opcode == 0x2C:
-    #     return INC_2C(cpu)
-    # elif opcode == 0x2D:
-    #     return DEC_2D(cpu)
-    # elif opcode == 0x2E:
-    #     return LD_2E(cpu, v)
-    # elif opcode == 0x2F:
-    #     return CPL_2F(cpu)
-    # elif opcode == 0x30:
-    #     return JR_30(cpu, v)
-    # elif opcode == 0x31:
-    #     return LD_31(cpu, v)
-    # elif opcode == 0x32:
-    #     return LD_32(cpu)
-    # elif opcode == 0x33:
-    #     return INC_33(cpu)
-    # elif opcode == 0x34:
-    #     return INC_34(cpu)
-    # elif opcode == 0x35:
-    #     return DEC_35(cpu)
-    # elif opcode == 0x36:
-    #     return LD_36(cpu, v)
-    # elif opcode == 0x37:
-    #     return SCF_37(cpu)
-    # elif opcode == 0x38:
-    #     return JR_38(cpu, v)
-    # elif opcode == 0x39:
-    #     return ADD_39(cpu)
-    # elif opcode == 0x3A:
-    #     return LD_3A(cpu)
-    # elif opcode == 0x3B:
-    #     return DEC_3B(cpu)
-    # elif opcode == 0x3C:
-    #     return INC_3C(cpu)
-    # elif opcode == 0x3D:
-    #     return DEC_3D(cpu)
-    # elif opcode == 0x3E:
-    #     return LD_3E(cpu, v)
-    # elif opcode == 0x3F:
-    #     return CCF_3F(cpu)
-    # elif opcode == 0x40:
-    #     return LD_40(cpu)
-    # elif opcode == 0x41:
-    #     return LD_41(cpu)
-    # elif opcode == 0x42:
-    #     return LD_42(cpu)
-    # elif opcode == 0x43:
-    #     return LD_43(cpu)
-    # elif opcode == 0x44:
-    #     return LD_44(cpu)
-    # elif opcode == 0x45:
-    #     return LD_45(cpu)
-    # elif opcode == 0x46:
-    #     return LD_46(cpu)
-    # elif opcode == 0x47:
-    #     return LD_47(cpu)
-    # elif opcode == 0x48:
-    #     return LD_48(cpu)
-    # elif opcode == 0x49:
-    #     return LD_49(cpu)
-    # elif opcode == 0x4A:
-    #     return LD_4A(cpu)
-    # elif opcode == 0x4B:
-    #     return LD_4B(cpu)
-    # elif opcode == 0x4C:
-    #     return LD_4C(cpu)
-    # elif opcode == 0x4D:
-    #     return LD_4D(cpu)
-    # elif opcode == 0x4E:
-    #     return LD_4E(cpu)
-    # elif opcode == 0x4F:
-    #     return LD_4F(cpu)
-    # elif opcode == 0x50:
-    #     return LD_50(cpu)
-    # elif opcode == 0x51:
-    #     return LD_51(cpu)
-    # elif opcode == 0x52:
-    #     return LD_52(cpu)
-    # elif opcode == 0x53:
-    #     return LD_53(cpu)
-    # elif opcode == 0x54:
-    #     return LD_54(cpu)
-    # elif opcode == 0x55:
-    #     return LD_55(cpu)
-    # elif opcode == 0x56:
-    #     return LD_56(cpu)
-    # elif opcode == 0x57:
-    #     return LD_57(cpu)
-    # elif opcode == 0x58:
-    #     return LD_58(cpu)
-    # elif opcode == 0x59:
-    #     return LD_59(cpu)
-    # elif opcode == 0x5A:
-    #     return LD_5A(cpu)
-    # elif opcode == 0x5B:
-    #     return LD_5B(cpu)
-    # elif opcode == 0x5C:
-    #     return LD_5C(cpu)
-    # elif opcode == 0x5D:
-    #     return LD_5D(cpu)
-    # elif opcode == 0x5E:
-    #     return LD_5E(cpu)
-    # elif opcode == 0x5F:
-    #     return LD_5F(cpu)
-    # elif opcode == 0x60:
-    #     return LD_60(cpu)
-    # elif opcode == 0x61:
-    #     return LD_61(cpu)
-    # elif opcode == 0x62:
-    #     return LD_62(cpu)
-    # elif opcode == 0x63:
-    #     return LD_63(cpu)
-    # elif opcode == 0x64:
-    #     return LD_64(cpu)
-    # elif opcode == 0x65:
-    #     return LD_65(cpu)
-    # elif opcode == 0x66:
-    #     return LD_66(cpu)
-    # elif opcode == 0x67:
-    #     return LD_67(cpu)
-    # elif opcode == 0x68:
-    #     return LD_68(cpu)
-    # elif opcode == 0x69:
-    #     return LD_69(cpu)
-    # elif opcode == 0x6A:
-    #     return LD_6A(cpu)
-    # elif opcode == 0x6B:
-    #     return LD_6B(cpu)
-    # elif opcode == 0x6C:
-    #     return LD_6C(cpu)
-    # elif opcode == 0x6D:
-    #     return LD_6D(cpu)
-    # elif opcode == 0x6E:
-    #     return LD_6E(cpu)
-    # elif opcode == 0x6F:
-    #     return LD_6F(cpu)
-    # elif opcode == 0x70:
-    #     return LD_70(cpu)
-    # elif opcode == 0x71:
-    #     return LD_71(cpu)
-    # elif opcode == 0x72:
-    #     return LD_72(cpu)
-    # elif opcode == 0x73:
-    #     return LD_73(cpu)
-    # elif opcode == 0x74:
-    #     return LD_74(cpu)
-    # elif opcode == 0x75:
-    #     return LD_75(cpu)
-    # elif opcode == 0x76:
-    #     return HALT_76(cpu)
-    # elif opcode == 0x77:
-    #     return LD_77(cpu)
-    # elif opcode == 0x78:
-    #     return LD_78(cpu)
-    # elif opcode == 0x79:
-    #     return LD_79(cpu)
-    # elif opcode == 0x7A:
-    #     return LD_7A(cpu)
-    # elif opcode == 0x7B:
-    #     return LD_7B(cpu)
-    # elif opcode == 0x7C:
-    #     return LD_7C(cpu)
-    # elif opcode == 0x7D:
-    #     return LD_7D(cpu)
-    # elif opcode == 0x7E:
-    #     return LD_7E(cpu)
-    # elif opcode == 0x7F:
-    #     return LD_7F(cpu)
-    # elif opcode == 0x80:
-    #     return ADD_80(cpu)
-    # elif opcode == 0x81:
-    #     return ADD_81(cpu)
-    # elif opcode == 0x82:
-    #     return ADD_82(cpu)
-    # elif opcode == 0x83:
-    #     return ADD_83(cpu)
-    # elif opcode == 0x84:
-    #     return ADD_84(cpu)
-    # elif opcode == 0x85:
-    #     return ADD_85(cpu)
-    # elif opcode == 0x86:
-    #     return ADD_86(cpu)
-    # elif opcode == 0x87:
-    #     return ADD_87(cpu)
-    # elif opcode == 0x88:
-    #     return ADC_88(cpu)
-    # elif opcode == 0x89:
-    #     return ADC_89(cpu)
-    # elif opcode == 0x8A:
-    #     return ADC_8A(cpu)
-    # elif opcode == 0x8B:
-    #     return ADC_8B(cpu)
-    # elif opcode == 0x8C:
-    #     return ADC_8C(cpu)
-    # elif opcode == 0x8D:
-    #     return ADC_8D(cpu)
-    # elif opcode == 0x8E:
-    #     return ADC_8E(cpu)
-    # elif opcode == 0x8F:
-    #     return ADC_8F(cpu)
-    # elif opcode == 0x90:
-    #     return SUB_90(cpu)
-    # elif opcode == 0x91:
-    #     return SUB_91(cpu)
-    # elif opcode == 0x92:
-    #     return SUB_92(cpu)
-    # elif opcode == 0x93:
-    #     return SUB_93(cpu)
-    # elif opcode == 0x94:
-    #     return SUB_94(cpu)
-    # elif opcode == 0x95:
-    #     return SUB_95(cpu)
-    # elif opcode == 0x96:
-    #     return SUB_96(cpu)
-    # elif opcode == 0x97:
-    #     return SUB_97(cpu)
-    # elif opcode == 0x98:
-    #     return SBC_98(cpu)
-    # elif opcode == 0x99:
-    #     return SBC_99(cpu)
-    # elif opcode == 0x9A:
-    #     return SBC_9A(cpu)
-    # elif opcode == 0x9B:
-    #     return SBC_9B(cpu)
-    # elif opcode == 0x9C:
-    #     return SBC_9C(cpu)
-    # elif opcode == 0x9D:
-    #     return SBC_9D(cpu)
-    # elif opcode == 0x9E:
-    #     return SBC_9E(cpu)
-    # elif opcode == 0x9F:
-    #     return SBC_9F(cpu)
-    # elif opcode == 0xA0:
-    #     return AND_A0(cpu)
-    # elif opcode == 0xA1:
-    #     return AND_A1(cpu)
-    # elif opcode == 0xA2:
-    #     return AND_A2(cpu)
-    # elif opcode == 0xA3:
-    #     return AND_A3(cpu)
-    # elif opcode == 0xA4:
-    #     return AND_A4(cpu)
-    # elif opcode == 0xA5:
-    #     return AND_A5(cpu)
-    # elif opcode == 0xA6:
-    #     return AND_A6(cpu)
-    # elif opcode == 0xA7:
-    #     return AND_A7(cpu)
-    # elif opcode == 0xA8:
-    #     return XOR_A8(cpu)
-    # elif opcode == 0xA9:
-    #     return XOR_A9(cpu)
-    # elif opcode == 0xAA:
-    #     return XOR_AA(cpu)
-    # elif opcode == 0xAB:
-    #     return XOR_AB(cpu)
-    # elif opcode == 0xAC:
-    #     return XOR_AC(cpu)
-    # elif opcode == 0xAD:
-    #     return XOR_AD(cpu)
-    # elif opcode == 0xAE:
-    #     return XOR_AE(cpu)
-    # elif opcode == 0xAF:
-    #     return XOR_AF(cpu)
-    # elif opcode == 0xB0:
-    #     return OR_B0(cpu)
-    # elif opcode == 0xB1:
-    #     return OR_B1(cpu)
-    # elif opcode == 0xB2:
-    #     return OR_B2(cpu)
-    # elif opcode == 0xB3:
-    #     return OR_B3(cpu)
-    # elif opcode == 0xB4:
-    #     return OR_B4(cpu)
-    # elif opcode == 0xB5:
-    #     return OR_B5(cpu)
-    # elif opcode == 0xB6:
-    #     return OR_B6(cpu)
-    # elif opcode == 0xB7:
-    #     return OR_B7(cpu)
-    # elif opcode == 0xB8:
-    #     return CP_B8(cpu)
-    # elif opcode == 0xB9:
-    #     return CP_B9(cpu)
-    # elif opcode == 0xBA:
-    #     return CP_BA(cpu)
-    # elif opcode == 0xBB:
-    #     return CP_BB(cpu)
-    # elif opcode == 0xBC:
-    #     return CP_BC(cpu)
-    # elif opcode == 0xBD:
-    #     return CP_BD(cpu)
-    # elif opcode == 0xBE:
-    #     return CP_BE(cpu)
-    # elif opcode == 0xBF:
-    #     return CP_BF(cpu)
-    # elif opcode == 0xC0:
-    #     return RET_C0(cpu)
-    # elif opcode == 0xC1:
-    #     return POP_C1(cpu)
-    # elif opcode == 0xC2:
-    #     return JP_C2(cpu, v)
-    # elif opcode == 0xC3:
-    #     return JP_C3(cpu, v)
-    # elif opcode == 0xC4:
-    #     return CALL_C4(cpu, v)
-    # elif opcode == 0xC5:
-    #     return PUSH_C5(cpu)
-    # elif opcode == 0xC6:
-    #     return ADD_C6(cpu, v)
-    # elif opcode == 0xC7:
-    #     return RST_C7(cpu)
-    # elif opcode == 0xC8:
-    #     return RET_C8(cpu)
-    # elif opcode == 0xC9:
-    #     return RET_C9(cpu)
-    # elif opcode == 0xCA:
-    #     return JP_CA(cpu, v)
-    # elif opcode == 0xCB:
-    #     return PREFIX_CB(cpu)
-    # elif opcode == 0xCC:
-    #     return CALL_CC(cpu, v)
-    # elif opcode == 0xCD:
-    #     return CALL_CD(cpu, v)
-    # elif opcode == 0xCE:
-    #     return ADC_CE(cpu, v)
-    # elif opcode == 0xCF:
-    #     return RST_CF(cpu)
-    # elif opcode == 0xD0:
-    #     return RET_D0(cpu)
-    # elif opcode == 0xD1:
-    #     return POP_D1(cpu)
-    # elif opcode == 0xD2:
-    #     return JP_D2(cpu, v)
-    # elif opcode == 0xD3:
-    #     return no_opcode(cpu)
-    # elif opcode == 0xD4:
-    #     return CALL_D4(cpu, v)
-    # elif opcode == 0xD5:
-    #     return PUSH_D5(cpu)
-    # elif opcode == 0xD6:
-    #     return SUB_D6(cpu, v)
-    # elif opcode == 0xD7:
-    #     return RST_D7(cpu)
-    # elif opcode == 0xD8:
-    #     return RET_D8(cpu)
-    # elif opcode == 0xD9:
-    #     return RETI_D9(cpu)
-    # elif opcode == 0xDA:
-    #     return JP_DA(cpu, v)
-    # elif opcode == 0xDB:
-    #     return no_opcode(cpu)
-    # elif opcode == 0xDC:
-    #     return CALL_DC(cpu, v)
-    # elif opcode == 0xDD:
-    #     return no_opcode(cpu)
-    # elif opcode == 0xDE:
-    #     return SBC_DE(cpu, v)
-    # elif opcode == 0xDF:
-    #     return RST_DF(cpu)
-    # elif opcode == 0xE0:
-    #     return LDH_E0(cpu, v)
-    # elif opcode == 0xE1:
-    #     return POP_E1(cpu)
-    # elif opcode == 0xE2:
-    #     return LD_E2(cpu)
-    # elif opcode == 0xE3:
-    #     return no_opcode(cpu)
-    # elif opcode == 0xE4:
-    #     return no_opcode(cpu)
-    # elif opcode == 0xE5:
-    #     return PUSH_E5(cpu)
-    # elif opcode == 0xE6:
-    #     return AND_E6(cpu, v)
-    # elif opcode == 0xE7:
-    #     return RST_E7(cpu)
-    # elif opcode == 0xE8:
-    #     return ADD_E8(cpu, v)
-    # elif opcode == 0xE9:
-    #     return JP_E9(cpu)
-    # elif opcode == 0xEA:
-    #     return LD_EA(cpu, v)
-    # elif opcode == 0xEB:
-    #     return no_opcode(cpu)
-    # elif opcode == 0xEC:
-    #     return no_opcode(cpu)
-    # elif opcode == 0xED:
-    #     return no_opcode(cpu)
-    # elif opcode == 0xEE:
-    #     return XOR_EE(cpu, v)
-    # elif opcode == 0xEF:
-    #     return RST_EF(cpu)
-    # elif opcode == 0xF0:
-    #     return LDH_F0(cpu, v)
-    # elif opcode == 0xF1:
-    #     return POP_F1(cpu)
-    # elif opcode == 0xF2:
-    #     return LD_F2(cpu)
-    # elif opcode == 0xF3:
-    #     return DI_F3(cpu)
-    # elif opcode == 0xF4:
-    #     return no_opcode(cpu)
-    # elif opcode == 0xF5:
-    #     return PUSH_F5(cpu)
-    # elif opcode == 0xF6:
-    #     return OR_F6(cpu, v)
-    # elif opcode == 0xF7:
-    #     return RST_F7(cpu)
-    # elif opcode == 0xF8:
-    #     return LD_F8(cpu, v)
-    # elif opcode == 0xF9:
-    #     return LD_F9(cpu)
-    # elif opcode == 0xFA:
-    #     return LD_FA(cpu, v)
-    # elif opcode == 0xFB:
-    #     return EI_FB(cpu)
-    # elif opcode == 0xFC:
-    #     return no_opcode(cpu)
-    # elif opcode == 0xFD:
-    #     return no_opcode(cpu)
-    # elif opcode == 0xFE:
-    #     return CP_FE(cpu, v)
-    # elif opcode == 0xFF:
-    #     return RST_FF(cpu)
-    # elif opcode == 0x100:
-    #     return RLC_100(cpu)
-    # elif opcode == 0x101:
-    #     return RLC_101(cpu)
-    # elif opcode == 0x102:
-    #     return RLC_102(cpu)
-    # elif opcode == 0x103:
-    #     return RLC_103(cpu)
-    # elif opcode == 0x104:
-    #     return RLC_104(cpu)
-    # elif opcode == 0x105:
-    #     return RLC_105(cpu)
-    # elif opcode == 0x106:
-    #     return RLC_106(cpu)
-    # elif opcode == 0x107:
-    #     return RLC_107(cpu)
-    # elif opcode == 0x108:
-    #     return RRC_108(cpu)
-    # elif opcode == 0x109:
-    #     return RRC_109(cpu)
-    # elif opcode == 0x10A:
-    #     return RRC_10A(cpu)
-    # elif opcode == 0x10B:
-    #     return RRC_10B(cpu)
-    # elif opcode == 0x10C:
-    #     return RRC_10C(cpu)
-    # elif opcode == 0x10D:
-    #     return RRC_10D(cpu)
-    # elif opcode == 0x10E:
-    #     return RRC_10E(cpu)
-    # elif opcode == 0x10F:
-    #     return RRC_10F(cpu)
-    # elif opcode == 0x110:
-    #     return RL_110(cpu)
-    # elif opcode == 0x111:
-    #     return RL_111(cpu)
-    # elif opcode == 0x112:
-    #     return RL_112(cpu)
-    # elif opcode == 0x113:
-    #     return RL_113(cpu)
-    # elif opcode == 0x114:
-    #     return RL_114(cpu)
-    # elif opcode == 0x115:
-    #     return RL_115(cpu)
-    # elif opcode == 0x116:
-    #     return RL_116(cpu)
-    # elif opcode == 0x117:
-    #     return RL_117(cpu)
-    # elif opcode == 0x118:
-    #     return RR_118(cpu)
-    # elif opcode == 0x119:
-    #     return RR_119(cpu)
-    # elif opcode == 0x11A:
-    #     return RR_11A(cpu)
-    # elif opcode == 0x11B:
-    #     return RR_11B(cpu)
-    # elif opcode == 0x11C:
-    #     return RR_11C(cpu)
-    # elif opcode == 0x11D:
-    #     return RR_11D(cpu)
-    # elif opcode == 0x11E:
-    #     return RR_11E(cpu)
-    # elif opcode == 0x11F:
-    #     return RR_11F(cpu)
-    # elif opcode == 0x120:
-    #     return SLA_120(cpu)
-    # elif opcode == 0x121:
-    #     return SLA_121(cpu)
-    # elif opcode == 0x122:
-    #     return SLA_122(cpu)
-    # elif opcode == 0x123:
-    #     return SLA_123(cpu)
-    # elif opcode == 0x124:
-    #     return SLA_124(cpu)
-    # elif opcode == 0x125:
-    #     return SLA_125(cpu)
-    # elif opcode == 0x126:
-    #     return SLA_126(cpu)
-    # elif opcode == 0x127:
-    #     return SLA_127(cpu)
-    # elif opcode == 0x128:
-    #     return SRA_128(cpu)
-    # elif opcode == 0x129:
-    #     return SRA_129(cpu)
-    # elif opcode == 0x12A:
-    #     return SRA_12A(cpu)
-    # elif opcode == 0x12B:
-    #     return SRA_12B(cpu)
-    # elif opcode == 0x12C:
-    #     return SRA_12C(cpu)
-    # elif opcode == 0x12D:
-    #     return SRA_12D(cpu)
-    # elif opcode == 0x12E:
-    #     return SRA_12E(cpu)
-    # elif opcode == 0x12F:
-    #     return SRA_12F(cpu)
-    # elif opcode == 0x130:
-    #     return SWAP_130(cpu)
-    # elif opcode == 0x131:
-    #     return SWAP_131(cpu)
-    # elif opcode == 0x132:
-    #     return SWAP_132(cpu)
-    # elif opcode == 0x133:
-    #     return SWAP_133(cpu)
-    # elif opcode == 0x134:
-    #     return SWAP_134(cpu)
-    # elif opcode == 0x135:
-    #     return SWAP_135(cpu)
-    # elif opcode == 0x136:
-    #     return SWAP_136(cpu)
-    # elif opcode == 0x137:
-    #     return SWAP_137(cpu)
-    # elif opcode == 0x138:
-    #     return SRL_138(cpu)
-    # elif opcode == 0x139:
-    #     return SRL_139(cpu)
-    # elif opcode == 0x13A:
-    #     return SRL_13A(cpu)
-    # elif opcode == 0x13B:
-    #     return SRL_13B(cpu)
-    # elif opcode == 0x13C:
-    #     return SRL_13C(cpu)
-    # elif opcode == 0x13D:
-    #     return SRL_13D(cpu)
-    # elif opcode == 0x13E:
-    #     return SRL_13E(cpu)
-    # elif opcode == 0x13F:
-    #     return SRL_13F(cpu)
-    # elif opcode == 0x140:
-    #     return BIT_140(cpu)
-    # elif opcode == 0x141:
-    #     return BIT_141(cpu)
-    # elif opcode == 0x142:
-    #     return BIT_142(cpu)
-    # elif opcode == 0x143:
-    #     return BIT_143(cpu)
-    # elif opcode == 0x144:
-    #     return BIT_144(cpu)
-    # elif opcode == 0x145:
-    #     return BIT_145(cpu)
-    # elif opcode == 0x146:
-    #     return BIT_146(cpu)
-    # elif opcode == 0x147:
-    #     return BIT_147(cpu)
-    # elif opcode == 0x148:
-    #     return BIT_148(cpu)
-    # elif opcode == 0x149:
-    #     return BIT_149(cpu)
-    # elif opcode == 0x14A:
-    #     return BIT_14A(cpu)
-    # elif opcode == 0x14B:
-    #     return BIT_14B(cpu)
-    # elif opcode == 0x14C:
-    #     return BIT_14C(cpu)
-    # elif opcode == 0x14D:
-    #     return BIT_14D(cpu)
-    # elif opcode == 0x14E:
-    #     return BIT_14E(cpu)
-    # elif opcode == 0x14F:
-    #     return BIT_14F(cpu)
-    # elif opcode == 0x150:
-    #     return BIT_150(cpu)
-    # elif opcode == 0x151:
-    #     return BIT_151(cpu)
-    # elif opcode == 0x152:
-    #     return BIT_152(cpu)
-    # elif opcode == 0x153:
-    #     return BIT_153(cpu)
-    # elif opcode == 0x154:
-    #     return BIT_154(cpu)
-    # elif opcode == 0x155:
-    #     return BIT_155(cpu)
-    # elif opcode == 0x156:
-    #     return BIT_156(cpu)
-    # elif opcode == 0x157:
-    #     return BIT_157(cpu)
-    # elif opcode == 0x158:
-    #     return BIT_158(cpu)
-    # elif opcode == 0x159:
-    #     return BIT_159(cpu)
-    # elif opcode == 0x15A:
-    #     return BIT_15A(cpu)
-    # elif opcode == 0x15B:
-    #     return BIT_15B(cpu)
-    # elif opcode == 0x15C:
-    #     return BIT_15C(cpu)
-    # elif opcode == 0x15D:
-    #     return BIT_15D(cpu)
-    # elif opcode == 0x15E:
-    #     return BIT_15E(cpu)
-    # elif opcode == 0x15F:
-    #     return BIT_15F(cpu)
-    # elif opcode == 0x160:
-    #     return BIT_160(cpu)
-    # elif opcode == 0x161:
-    #     return BIT_161(cpu)
-    # elif opcode == 0x162:
-    #     return BIT_162(cpu)
-    # elif opcode == 0x163:
-    #     return BIT_163(cpu)
-    # elif opcode == 0x164:
-    #     return BIT_164(cpu)
-    # elif opcode == 0x165:
-    #     return BIT_165(cpu)
-    # elif opcode == 0x166:
-    #     return BIT_166(cpu)
-    # elif opcode == 0x167:
-    #     return BIT_167(cpu)
-    # elif opcode == 0x168:
-    #     return BIT_168(cpu)
-    # elif opcode == 0x169:
-    #     return BIT_169(cpu)
-    # elif opcode == 0x16A:
-    #     return BIT_16A(cpu)
-    # elif opcode == 0x16B:
-    #     return BIT_16B(cpu)
-    # elif opcode == 0x16C:
-    #     return BIT_16C(cpu)
-    # elif opcode == 0x16D:
-    #     return BIT_16D(cpu)
-    # elif opcode == 0x16E:
-    #     return BIT_16E(cpu)
-    # elif opcode == 0x16F:
-    #     return BIT_16F(cpu)
-    # elif opcode == 0x170:
-    #     return BIT_170(cpu)
-    # elif opcode == 0x171:
-    #     return BIT_171(cpu)
-    # elif opcode == 0x172:
-    #     return BIT_172(cpu)
-    # elif opcode == 0x173:
-    #     return BIT_173(cpu)
-    # elif opcode == 0x174:
-    #     return BIT_174(cpu)
-    # elif opcode == 0x175:
-    #     return BIT_175(cpu)
-    # elif opcode == 0x176:
-    #     return BIT_176(cpu)
-    # elif opcode == 0x177:
-    #     return BIT_177(cpu)
-    # elif opcode == 0x178:
-    #     return BIT_178(cpu)
-    # elif opcode == 0x179:
-    #     return BIT_179(cpu)
-    # elif opcode == 0x17A:
-    #     return BIT_17A(cpu)
-    # elif opcode == 0x17B:
-    #     return BIT_17B(cpu)
-    # elif opcode == 0x17C:
-    #     return BIT_17C(cpu)
-    # elif opcode == 0x17D:
-    #     return BIT_17D(cpu)
-    # elif opcode == 0x17E:
-    #     return BIT_17E(cpu)
-    # elif opcode == 0x17F:
-    #     return BIT_17F(cpu)
-    # elif opcode == 0x180:
-    #     return RES_180(cpu)
-    # elif opcode == 0x181:
-    #     return RES_181(cpu)
-    # elif opcode == 0x182:
-    #     return RES_182(cpu)
-    # elif opcode == 0x183:
-    #     return RES_183(cpu)
-    # elif opcode == 0x184:
-    #     return RES_184(cpu)
-    # elif opcode == 0x185:
-    #     return RES_185(cpu)
-    # elif opcode == 0x186:
-    #     return RES_186(cpu)
-    # elif opcode == 0x187:
-    #     return RES_187(cpu)
-    # elif opcode == 0x188:
-    #     return RES_188(cpu)
-    # elif opcode == 0x189:
-    #     return RES_189(cpu)
-    # elif opcode == 0x18A:
-    #     return RES_18A(cpu)
-    # elif opcode == 0x18B:
-    #     return RES_18B(cpu)
-    # elif opcode == 0x18C:
-    #     return RES_18C(cpu)
-    # elif opcode == 0x18D:
-    #     return RES_18D(cpu)
-    # elif opcode == 0x18E:
-    #     return RES_18E(cpu)
-    # elif opcode == 0x18F:
-    #     return RES_18F(cpu)
-    # elif opcode == 0x190:
-    #     return RES_190(cpu)
-    # elif opcode == 0x191:
-    #     return RES_191(cpu)
-    # elif opcode == 0x192:
-    #     return RES_192(cpu)
-    # elif opcode == 0x193:
-    #     return RES_193(cpu)
-    # elif opcode == 0x194:
-    #     return RES_194(cpu)
-    # elif opcode == 0x195:
-    #     return RES_195(cpu)
-    # elif opcode == 0x196:
-    #     return RES_196(cpu)
-    # elif opcode == 0x197:
-    #     return RES_197(cpu)
-    # elif opcode == 0x198:
-    #     return RES_198(cpu)
-    # elif opcode == 0x199:
-    #     return RES_199(cpu)
-    # elif opcode == 0x19A:
-    #     return RES_19A(cpu)
-    # elif opcode == 0x19B:
-    #     return RES_19B(cpu)
-    # elif opcode == 0x19C:
-    #     return RES_19C(cpu)
-    # elif opcode == 0x19D:
-    #     return RES_19D(cpu)
-    # elif opcode == 0x19E:
-    #     return RES_19E(cpu)
-    # elif opcode == 0x19F:
-    #     return RES_19F(cpu)
-    # elif opcode == 0x1A0:
-    #     return RES_1A0(cpu)
-    # elif opcode == 0x1A1:
-    #     return RES_1A1(cpu)
-    # elif opcode == 0x1A2:
-    #     return RES_1A2(cpu)
-    # elif opcode == 0x1A3:
-    #     return RES_1A3(cpu)
-    # elif opcode == 0x1A4:
-    #     return RES_1A4(cpu)
-    # elif opcode == 0x1A5:
-    #     return RES_1A5(cpu)
-    # elif opcode == 0x1A6:
-    #     return RES_1A6(cpu)
-    # elif opcode == 0x1A7:
-    #     return RES_1A7(cpu)
-    # elif opcode == 0x1A8:
-    #     return RES_1A8(cpu)
-    # elif opcode == 0x1A9:
-    #     return RES_1A9(cpu)
-    # elif opcode == 0x1AA:
-    #     return RES_1AA(cpu)
-    # elif opcode == 0x1AB:
-    #     return RES_1AB(cpu)
-    # elif opcode == 0x1AC:
-    #     return RES_1AC(cpu)
-    # elif opcode == 0x1AD:
-    #     return RES_1AD(cpu)
-    # elif opcode == 0x1AE:
-    #     return RES_1AE(cpu)
-    # elif opcode == 0x1AF:
-    #     return RES_1AF(cpu)
-    # elif opcode == 0x1B0:
-    #     return RES_1B0(cpu)
-    # elif opcode == 0x1B1:
-    #     return RES_1B1(cpu)
-    # elif opcode == 0x1B2:
-    #     return RES_1B2(cpu)
-    # elif opcode == 0x1B3:
-    #     return RES_1B3(cpu)
-    # elif opcode == 0x1B4:
-    #     return RES_1B4(cpu)
-    # elif opcode == 0x1B5:
-    #     return RES_1B5(cpu)
-    # elif opcode == 0x1B6:
-    #     return RES_1B6(cpu)
-    # elif opcode == 0x1B7:
-    #     return RES_1B7(cpu)
-    # elif opcode == 0x1B8:
-    #     return RES_1B8(cpu)
-    # elif opcode == 0x1B9:
-    #     return RES_1B9(cpu)
-    # elif opcode == 0x1BA:
-    #     return RES_1BA(cpu)
-    # elif opcode == 0x1BB:
-    #     return RES_1BB(cpu)
-    # elif opcode == 0x1BC:
-    #     return RES_1BC(cpu)
-    # elif opcode == 0x1BD:
-    #     return RES_1BD(cpu)
-    # elif opcode == 0x1BE:
-    #     return RES_1BE(cpu)
-    # elif opcode == 0x1BF:
-    #     return RES_1BF(cpu)
-    # elif opcode == 0x1C0:
-    #     return SET_1C0(cpu)
-    # elif opcode == 0x1C1:
-    #     return SET_1C1(cpu)
-    # elif opcode == 0x1C2:
-    #     return SET_1C2(cpu)
-    # elif opcode == 0x1C3:
-    #     return SET_1C3(cpu)
-    # elif opcode == 0x1C4:
-    #     return SET_1C4(cpu)
-    # elif opcode == 0x1C5:
-    #     return SET_1C5(cpu)
-    # elif opcode == 0x1C6:
-    #     return SET_1C6(cpu)
-    # elif opcode == 0x1C7:
-    #     return SET_1C7(cpu)
-    # elif opcode == 0x1C8:
-    #     return SET_1C8(cpu)
-    # elif opcode == 0x1C9:
-    #     return SET_1C9(cpu)
-    # elif opcode == 0x1CA:
-    #     return SET_1CA(cpu)
-    # elif opcode == 0x1CB:
-    #     return SET_1CB(cpu)
-    # elif opcode == 0x1CC:
-    #     return SET_1CC(cpu)
-    # elif opcode == 0x1CD:
-    #     return SET_1CD(cpu)
-    # elif opcode == 0x1CE:
-    #     return SET_1CE(cpu)
-    # elif opcode == 0x1CF:
-    #     return SET_1CF(cpu)
-    # elif opcode == 0x1D0:
-    #     return SET_1D0(cpu)
-    # elif opcode == 0x1D1:
-    #     return SET_1D1(cpu)
-    # elif opcode == 0x1D2:
-    #     return SET_1D2(cpu)
-    # elif opcode == 0x1D3:
-    #     return SET_1D3(cpu)
-    # elif opcode == 0x1D4:
-    #     return SET_1D4(cpu)
-    # elif opcode == 0x1D5:
-    #     return SET_1D5(cpu)
-    # elif opcode == 0x1D6:
-    #     return SET_1D6(cpu)
-    # elif opcode == 0x1D7:
-    #     return SET_1D7(cpu)
-    # elif opcode == 0x1D8:
-    #     return SET_1D8(cpu)
-    # elif opcode == 0x1D9:
-    #     return SET_1D9(cpu)
-    # elif opcode == 0x1DA:
-    #     return SET_1DA(cpu)
-    # elif opcode == 0x1DB:
-    #     return SET_1DB(cpu)
-    # elif opcode == 0x1DC:
-    #     return SET_1DC(cpu)
-    # elif opcode == 0x1DD:
-    #     return SET_1DD(cpu)
-    # elif opcode == 0x1DE:
-    #     return SET_1DE(cpu)
-    # elif opcode == 0x1DF:
-    #     return SET_1DF(cpu)
-    # elif opcode == 0x1E0:
-    #     return SET_1E0(cpu)
-    # elif opcode == 0x1E1:
-    #     return SET_1E1(cpu)
-    # elif opcode == 0x1E2:
-    #     return SET_1E2(cpu)
-    # elif opcode == 0x1E3:
-    #     return SET_1E3(cpu)
-    # elif opcode == 0x1E4:
-    #     return SET_1E4(cpu)
-    # elif opcode == 0x1E5:
-    #     return SET_1E5(cpu)
-    # elif opcode == 0x1E6:
-    #     return SET_1E6(cpu)
-    # elif opcode == 0x1E7:
-    #     return SET_1E7(cpu)
-    # elif opcode == 0x1E8:
-    #     return SET_1E8(cpu)
-    # elif opcode == 0x1E9:
-    #     return SET_1E9(cpu)
-    # elif opcode == 0x1EA:
-    #     return SET_1EA(cpu)
-    # elif opcode == 0x1EB:
-    #     return SET_1EB(cpu)
-    # elif opcode == 0x1EC:
-    #     return SET_1EC(cpu)
-    # elif opcode == 0x1ED:
-    #     return SET_1ED(cpu)
-    # elif opcode == 0x1EE:
-    #     return SET_1EE(cpu)
-    # elif opcode == 0x1EF:
-    #     return SET_1EF(cpu)
-    # elif opcode == 0x1F0:
-    #     return SET_1F0(cpu)
-    # elif opcode == 0x1F1:
-    #     return SET_1F1(cpu)
-    # elif opcode == 0x1F2:
-    #     return SET_1F2(cpu)
-    # elif opcode == 0x1F3:
-    #     return SET_1F3(cpu)
-    # elif opcode == 0x1F4:
-    #     return SET_1F4(cpu)
-    # elif opcode == 0x1F5:
-    #     return SET_1F5(cpu)
-    # elif opcode == 0x1F6:
-    #     return SET_1F6(cpu)
-    # elif opcode == 0x1F7:
-    #     return SET_1F7(cpu)
-    # elif opcode == 0x1F8:
-    #     return SET_1F8(cpu)
-    # elif opcode == 0x1F9:
-    #     return SET_1F9(cpu)
-    # elif opcode == 0x1FA:
-    #     return SET_1FA(cpu)
-    # elif opcode == 0x1FB:
-    #     return SET_1FB(cpu)
-    # elif opcode == 0x1FC:
-    #     return SET_1FC(cpu)
-    # elif opcode == 0x1FD:
-    #     return SET_1FD(cpu)
-    # elif opcode == 0x1FE:
-    #     return SET_1FE(cpu)
-    # elif opcode == 0x1FF:
-    #     return SET_1FF(cpu)
+def execute_opcode(cpu, opcode, v):
+    # The immediate value, v, has already been read by the CPU's decoder
+    if not cythonmode:
+        # A dict lookup is faster than the if-chain in pure Python. Cython compiles the if-chain into a switch.
+        if opcode_length(opcode) > 1:
+            return opcodeDict[opcode](cpu, v)
+        else:
+            return opcodeDict[opcode](cpu)
+
+    if opcode == 0x00:
+        return NOP_00(cpu)
+    elif opcode == 0x01:
+        return LD_01(cpu, v)
+    elif opcode == 0x02:
+        return LD_02(cpu)
+    elif opcode == 0x03:
+        return INC_03(cpu)
+    elif opcode == 0x04:
+        return INC_04(cpu)
+    elif opcode == 0x05:
+        return DEC_05(cpu)
+    elif opcode == 0x06:
+        return LD_06(cpu, v)
+    elif opcode == 0x07:
+        return RLCA_07(cpu)
+    elif opcode == 0x08:
+        return LD_08(cpu, v)
+    elif opcode == 0x09:
+        return ADD_09(cpu)
+    elif opcode == 0x0A:
+        return LD_0A(cpu)
+    elif opcode == 0x0B:
+        return DEC_0B(cpu)
+    elif opcode == 0x0C:
+        return INC_0C(cpu)
+    elif opcode == 0x0D:
+        return DEC_0D(cpu)
+    elif opcode == 0x0E:
+        return LD_0E(cpu, v)
+    elif opcode == 0x0F:
+        return RRCA_0F(cpu)
+    elif opcode == 0x10:
+        return STOP_10(cpu, v)
+    elif opcode == 0x11:
+        return LD_11(cpu, v)
+    elif opcode == 0x12:
+        return LD_12(cpu)
+    elif opcode == 0x13:
+        return INC_13(cpu)
+    elif opcode == 0x14:
+        return INC_14(cpu)
+    elif opcode == 0x15:
+        return DEC_15(cpu)
+    elif opcode == 0x16:
+        return LD_16(cpu, v)
+    elif opcode == 0x17:
+        return RLA_17(cpu)
+    elif opcode == 0x18:
+        return JR_18(cpu, v)
+    elif opcode == 0x19:
+        return ADD_19(cpu)
+    elif opcode == 0x1A:
+        return LD_1A(cpu)
+    elif opcode == 0x1B:
+        return DEC_1B(cpu)
+    elif opcode == 0x1C:
+        return INC_1C(cpu)
+    elif opcode == 0x1D:
+        return DEC_1D(cpu)
+    elif opcode == 0x1E:
+        return LD_1E(cpu, v)
+    elif opcode == 0x1F:
+        return RRA_1F(cpu)
+    elif opcode == 0x20:
+        return JR_20(cpu, v)
+    elif opcode == 0x21:
+        return LD_21(cpu, v)
+    elif opcode == 0x22:
+        return LD_22(cpu)
+    elif opcode == 0x23:
+        return INC_23(cpu)
+    elif opcode == 0x24:
+        return INC_24(cpu)
+    elif opcode == 0x25:
+        return DEC_25(cpu)
+    elif opcode == 0x26:
+        return LD_26(cpu, v)
+    elif opcode == 0x27:
+        return DAA_27(cpu)
+    elif opcode == 0x28:
+        return JR_28(cpu, v)
+    elif opcode == 0x29:
+        return ADD_29(cpu)
+    elif opcode == 0x2A:
+        return LD_2A(cpu)
+    elif opcode == 0x2B:
+        return DEC_2B(cpu)
+    elif opcode == 0x2C:
+        return INC_2C(cpu)
+    elif opcode == 0x2D:
+        return DEC_2D(cpu)
+    elif opcode == 0x2E:
+        return LD_2E(cpu, v)
+    elif opcode == 0x2F:
+        return CPL_2F(cpu)
+    elif opcode == 0x30:
+        return JR_30(cpu, v)
+    elif opcode == 0x31:
+        return LD_31(cpu, v)
+    elif opcode == 0x32:
+        return LD_32(cpu)
+    elif opcode == 0x33:
+        return INC_33(cpu)
+    elif opcode == 0x34:
+        return INC_34(cpu)
+    elif opcode == 0x35:
+        return DEC_35(cpu)
+    elif opcode == 0x36:
+        return LD_36(cpu, v)
+    elif opcode == 0x37:
+        return SCF_37(cpu)
+    elif opcode == 0x38:
+        return JR_38(cpu, v)
+    elif opcode == 0x39:
+        return ADD_39(cpu)
+    elif opcode == 0x3A:
+        return LD_3A(cpu)
+    elif opcode == 0x3B:
+        return DEC_3B(cpu)
+    elif opcode == 0x3C:
+        return INC_3C(cpu)
+    elif opcode == 0x3D:
+        return DEC_3D(cpu)
+    elif opcode == 0x3E:
+        return LD_3E(cpu, v)
+    elif opcode == 0x3F:
+        return CCF_3F(cpu)
+    elif opcode == 0x40:
+        return LD_40(cpu)
+    elif opcode == 0x41:
+        return LD_41(cpu)
+    elif opcode == 0x42:
+        return LD_42(cpu)
+    elif opcode == 0x43:
+        return LD_43(cpu)
+    elif opcode == 0x44:
+        return LD_44(cpu)
+    elif opcode == 0x45:
+        return LD_45(cpu)
+    elif opcode == 0x46:
+        return LD_46(cpu)
+    elif opcode == 0x47:
+        return LD_47(cpu)
+    elif opcode == 0x48:
+        return LD_48(cpu)
+    elif opcode == 0x49:
+        return LD_49(cpu)
+    elif opcode == 0x4A:
+        return LD_4A(cpu)
+    elif opcode == 0x4B:
+        return LD_4B(cpu)
+    elif opcode == 0x4C:
+        return LD_4C(cpu)
+    elif opcode == 0x4D:
+        return LD_4D(cpu)
+    elif opcode == 0x4E:
+        return LD_4E(cpu)
+    elif opcode == 0x4F:
+        return LD_4F(cpu)
+    elif opcode == 0x50:
+        return LD_50(cpu)
+    elif opcode == 0x51:
+        return LD_51(cpu)
+    elif opcode == 0x52:
+        return LD_52(cpu)
+    elif opcode == 0x53:
+        return LD_53(cpu)
+    elif opcode == 0x54:
+        return LD_54(cpu)
+    elif opcode == 0x55:
+        return LD_55(cpu)
+    elif opcode == 0x56:
+        return LD_56(cpu)
+    elif opcode == 0x57:
+        return LD_57(cpu)
+    elif opcode == 0x58:
+        return LD_58(cpu)
+    elif opcode == 0x59:
+        return LD_59(cpu)
+    elif opcode == 0x5A:
+        return LD_5A(cpu)
+    elif opcode == 0x5B:
+        return LD_5B(cpu)
+    elif opcode == 0x5C:
+        return LD_5C(cpu)
+    elif opcode == 0x5D:
+        return LD_5D(cpu)
+    elif opcode == 0x5E:
+        return LD_5E(cpu)
+    elif opcode == 0x5F:
+        return LD_5F(cpu)
+    elif opcode == 0x60:
+        return LD_60(cpu)
+    elif opcode == 0x61:
+        return LD_61(cpu)
+    elif opcode == 0x62:
+        return LD_62(cpu)
+    elif opcode == 0x63:
+        return LD_63(cpu)
+    elif opcode == 0x64:
+        return LD_64(cpu)
+    elif opcode == 0x65:
+        return LD_65(cpu)
+    elif opcode == 0x66:
+        return LD_66(cpu)
+    elif opcode == 0x67:
+        return LD_67(cpu)
+    elif opcode == 0x68:
+        return LD_68(cpu)
+    elif opcode == 0x69:
+        return LD_69(cpu)
+    elif opcode == 0x6A:
+        return LD_6A(cpu)
+    elif opcode == 0x6B:
+        return LD_6B(cpu)
+    elif opcode == 0x6C:
+        return LD_6C(cpu)
+    elif opcode == 0x6D:
+        return LD_6D(cpu)
+    elif opcode == 0x6E:
+        return LD_6E(cpu)
+    elif opcode == 0x6F:
+        return LD_6F(cpu)
+    elif opcode == 0x70:
+        return LD_70(cpu)
+    elif opcode == 0x71:
+        return LD_71(cpu)
+    elif opcode == 0x72:
+        return LD_72(cpu)
+    elif opcode == 0x73:
+        return LD_73(cpu)
+    elif opcode == 0x74:
+        return LD_74(cpu)
+    elif opcode == 0x75:
+        return LD_75(cpu)
+    elif opcode == 0x76:
+        return HALT_76(cpu)
+    elif opcode == 0x77:
+        return LD_77(cpu)
+    elif opcode == 0x78:
+        return LD_78(cpu)
+    elif opcode == 0x79:
+        return LD_79(cpu)
+    elif opcode == 0x7A:
+        return LD_7A(cpu)
+    elif opcode == 0x7B:
+        return LD_7B(cpu)
+    elif opcode == 0x7C:
+        return LD_7C(cpu)
+    elif opcode == 0x7D:
+        return LD_7D(cpu)
+    elif opcode == 0x7E:
+        return LD_7E(cpu)
+    elif opcode == 0x7F:
+        return LD_7F(cpu)
+    elif opcode == 0x80:
+        return ADD_80(cpu)
+    elif opcode == 0x81:
+        return ADD_81(cpu)
+    elif opcode == 0x82:
+        return ADD_82(cpu)
+    elif opcode == 0x83:
+        return ADD_83(cpu)
+    elif opcode == 0x84:
+        return ADD_84(cpu)
+    elif opcode == 0x85:
+        return ADD_85(cpu)
+    elif opcode == 0x86:
+        return ADD_86(cpu)
+    elif opcode == 0x87:
+        return ADD_87(cpu)
+    elif opcode == 0x88:
+        return ADC_88(cpu)
+    elif opcode == 0x89:
+        return ADC_89(cpu)
+    elif opcode == 0x8A:
+        return ADC_8A(cpu)
+    elif opcode == 0x8B:
+        return ADC_8B(cpu)
+    elif opcode == 0x8C:
+        return ADC_8C(cpu)
+    elif opcode == 0x8D:
+        return ADC_8D(cpu)
+    elif opcode == 0x8E:
+        return ADC_8E(cpu)
+    elif opcode == 0x8F:
+        return ADC_8F(cpu)
+    elif opcode == 0x90:
+        return SUB_90(cpu)
+    elif opcode == 0x91:
+        return SUB_91(cpu)
+    elif opcode == 0x92:
+        return SUB_92(cpu)
+    elif opcode == 0x93:
+        return SUB_93(cpu)
+    elif opcode == 0x94:
+        return SUB_94(cpu)
+    elif opcode == 0x95:
+        return SUB_95(cpu)
+    elif opcode == 0x96:
+        return SUB_96(cpu)
+    elif opcode == 0x97:
+        return SUB_97(cpu)
+    elif opcode == 0x98:
+        return SBC_98(cpu)
+    elif opcode == 0x99:
+        return SBC_99(cpu)
+    elif opcode == 0x9A:
+        return SBC_9A(cpu)
+    elif opcode == 0x9B:
+        return SBC_9B(cpu)
+    elif opcode == 0x9C:
+        return SBC_9C(cpu)
+    elif opcode == 0x9D:
+        return SBC_9D(cpu)
+    elif opcode == 0x9E:
+        return SBC_9E(cpu)
+    elif opcode == 0x9F:
+        return SBC_9F(cpu)
+    elif opcode == 0xA0:
+        return AND_A0(cpu)
+    elif opcode == 0xA1:
+        return AND_A1(cpu)
+    elif opcode == 0xA2:
+        return AND_A2(cpu)
+    elif opcode == 0xA3:
+        return AND_A3(cpu)
+    elif opcode == 0xA4:
+        return AND_A4(cpu)
+    elif opcode == 0xA5:
+        return AND_A5(cpu)
+    elif opcode == 0xA6:
+        return AND_A6(cpu)
+    elif opcode == 0xA7:
+        return AND_A7(cpu)
+    elif opcode == 0xA8:
+        return XOR_A8(cpu)
+    elif opcode == 0xA9:
+        return XOR_A9(cpu)
+    elif opcode == 0xAA:
+        return XOR_AA(cpu)
+    elif opcode == 0xAB:
+        return XOR_AB(cpu)
+    elif opcode == 0xAC:
+        return XOR_AC(cpu)
+    elif opcode == 0xAD:
+        return XOR_AD(cpu)
+    elif opcode == 0xAE:
+        return XOR_AE(cpu)
+    elif opcode == 0xAF:
+        return XOR_AF(cpu)
+    elif opcode == 0xB0:
+        return OR_B0(cpu)
+    elif opcode == 0xB1:
+        return OR_B1(cpu)
+    elif opcode == 0xB2:
+        return OR_B2(cpu)
+    elif opcode == 0xB3:
+        return OR_B3(cpu)
+    elif opcode == 0xB4:
+        return OR_B4(cpu)
+    elif opcode == 0xB5:
+        return OR_B5(cpu)
+    elif opcode == 0xB6:
+        return OR_B6(cpu)
+    elif opcode == 0xB7:
+        return OR_B7(cpu)
+    elif opcode == 0xB8:
+        return CP_B8(cpu)
+    elif opcode == 0xB9:
+        return CP_B9(cpu)
+    elif opcode == 0xBA:
+        return CP_BA(cpu)
+    elif opcode == 0xBB:
+        return CP_BB(cpu)
+    elif opcode == 0xBC:
+        return CP_BC(cpu)
+    elif opcode == 0xBD:
+        return CP_BD(cpu)
+    elif opcode == 0xBE:
+        return CP_BE(cpu)
+    elif opcode == 0xBF:
+        return CP_BF(cpu)
+    elif opcode == 0xC0:
+        return RET_C0(cpu)
+    elif opcode == 0xC1:
+        return POP_C1(cpu)
+    elif opcode == 0xC2:
+        return JP_C2(cpu, v)
+    elif opcode == 0xC3:
+        return JP_C3(cpu, v)
+    elif opcode == 0xC4:
+        return CALL_C4(cpu, v)
+    elif opcode == 0xC5:
+        return PUSH_C5(cpu)
+    elif opcode == 0xC6:
+        return ADD_C6(cpu, v)
+    elif opcode == 0xC7:
+        return RST_C7(cpu)
+    elif opcode == 0xC8:
+        return RET_C8(cpu)
+    elif opcode == 0xC9:
+        return RET_C9(cpu)
+    elif opcode == 0xCA:
+        return JP_CA(cpu, v)
+    elif opcode == 0xCB:
+        return PREFIX_CB(cpu)
+    elif opcode == 0xCC:
+        return CALL_CC(cpu, v)
+    elif opcode == 0xCD:
+        return CALL_CD(cpu, v)
+    elif opcode == 0xCE:
+        return ADC_CE(cpu, v)
+    elif opcode == 0xCF:
+        return RST_CF(cpu)
+    elif opcode == 0xD0:
+        return RET_D0(cpu)
+    elif opcode == 0xD1:
+        return POP_D1(cpu)
+    elif opcode == 0xD2:
+        return JP_D2(cpu, v)
+    elif opcode == 0xD3:
+        return no_opcode(cpu)
+    elif opcode == 0xD4:
+        return CALL_D4(cpu, v)
+    elif opcode == 0xD5:
+        return PUSH_D5(cpu)
+    elif opcode == 0xD6:
+        return SUB_D6(cpu, v)
+    elif opcode == 0xD7:
+        return RST_D7(cpu)
+    elif opcode == 0xD8:
+        return RET_D8(cpu)
+    elif opcode == 0xD9:
+        return RETI_D9(cpu)
+    elif opcode == 0xDA:
+        return JP_DA(cpu, v)
+    elif opcode == 0xDB:
+        return no_opcode(cpu)
+    elif opcode == 0xDC:
+        return CALL_DC(cpu, v)
+    elif opcode == 0xDD:
+        return no_opcode(cpu)
+    elif opcode == 0xDE:
+        return SBC_DE(cpu, v)
+    elif opcode == 0xDF:
+        return RST_DF(cpu)
+    elif opcode == 0xE0:
+        return LDH_E0(cpu, v)
+    elif opcode == 0xE1:
+        return POP_E1(cpu)
+    elif opcode == 0xE2:
+        return LD_E2(cpu)
+    elif opcode == 0xE3:
+        return no_opcode(cpu)
+    elif opcode == 0xE4:
+        return no_opcode(cpu)
+    elif opcode == 0xE5:
+        return PUSH_E5(cpu)
+    elif opcode == 0xE6:
+        return AND_E6(cpu, v)
+    elif opcode == 0xE7:
+        return RST_E7(cpu)
+    elif opcode == 0xE8:
+        return ADD_E8(cpu, v)
+    elif opcode == 0xE9:
+        return JP_E9(cpu)
+    elif opcode == 0xEA:
+        return LD_EA(cpu, v)
+    elif opcode == 0xEB:
+        return no_opcode(cpu)
+    elif opcode == 0xEC:
+        return no_opcode(cpu)
+    elif opcode == 0xED:
+        return no_opcode(cpu)
+    elif opcode == 0xEE:
+        return XOR_EE(cpu, v)
+    elif opcode == 0xEF:
+        return RST_EF(cpu)
+    elif opcode == 0xF0:
+        return LDH_F0(cpu, v)
+    elif opcode == 0xF1:
+        return POP_F1(cpu)
+    elif opcode == 0xF2:
+        return LD_F2(cpu)
+    elif opcode == 0xF3:
+        return DI_F3(cpu)
+    elif opcode == 0xF4:
+        return no_opcode(cpu)
+    elif opcode == 0xF5:
+        return PUSH_F5(cpu)
+    elif opcode == 0xF6:
+        return OR_F6(cpu, v)
+    elif opcode == 0xF7:
+        return RST_F7(cpu)
+    elif opcode == 0xF8:
+        return LD_F8(cpu, v)
+    elif opcode == 0xF9:
+        return LD_F9(cpu)
+    elif opcode == 0xFA:
+        return LD_FA(cpu, v)
+    elif opcode == 0xFB:
+        return EI_FB(cpu)
+    elif opcode == 0xFC:
+        return no_opcode(cpu)
+    elif opcode == 0xFD:
+        return no_opcode(cpu)
+    elif opcode == 0xFE:
+        return CP_FE(cpu, v)
+    elif opcode == 0xFF:
+        return RST_FF(cpu)
+    elif opcode == 0x100:
+        return RLC_100(cpu)
+    elif opcode == 0x101:
+        return RLC_101(cpu)
+    elif opcode == 0x102:
+        return RLC_102(cpu)
+    elif opcode == 0x103:
+        return RLC_103(cpu)
+    elif opcode == 0x104:
+        return RLC_104(cpu)
+    elif opcode == 0x105:
+        return RLC_105(cpu)
+    elif opcode == 0x106:
+        return RLC_106(cpu)
+    elif opcode == 0x107:
+        return RLC_107(cpu)
+    elif opcode == 0x108:
+        return RRC_108(cpu)
+    elif opcode == 0x109:
+        return RRC_109(cpu)
+    elif opcode == 0x10A:
+        return RRC_10A(cpu)
+    elif opcode == 0x10B:
+        return RRC_10B(cpu)
+    elif opcode == 0x10C:
+        return RRC_10C(cpu)
+    elif opcode == 0x10D:
+        return RRC_10D(cpu)
+    elif opcode == 0x10E:
+        return RRC_10E(cpu)
+    elif opcode == 0x10F:
+        return RRC_10F(cpu)
+    elif opcode == 0x110:
+        return RL_110(cpu)
+    elif opcode == 0x111:
+        return RL_111(cpu)
+    elif opcode == 0x112:
+        return RL_112(cpu)
+    elif opcode == 0x113:
+        return RL_113(cpu)
+    elif opcode == 0x114:
+        return RL_114(cpu)
+    elif opcode == 0x115:
+        return RL_115(cpu)
+    elif opcode == 0x116:
+        return RL_116(cpu)
+    elif opcode == 0x117:
+        return RL_117(cpu)
+    elif opcode == 0x118:
+        return RR_118(cpu)
+    elif opcode == 0x119:
+        return RR_119(cpu)
+    elif opcode == 0x11A:
+        return RR_11A(cpu)
+    elif opcode == 0x11B:
+        return RR_11B(cpu)
+    elif opcode == 0x11C:
+        return RR_11C(cpu)
+    elif opcode == 0x11D:
+        return RR_11D(cpu)
+    elif opcode == 0x11E:
+        return RR_11E(cpu)
+    elif opcode == 0x11F:
+        return RR_11F(cpu)
+    elif opcode == 0x120:
+        return SLA_120(cpu)
+    elif opcode == 0x121:
+        return SLA_121(cpu)
+    elif opcode == 0x122:
+        return SLA_122(cpu)
+    elif opcode == 0x123:
+        return SLA_123(cpu)
+    elif opcode == 0x124:
+        return SLA_124(cpu)
+    elif opcode == 0x125:
+        return SLA_125(cpu)
+    elif opcode == 0x126:
+        return SLA_126(cpu)
+    elif opcode == 0x127:
+        return SLA_127(cpu)
+    elif opcode == 0x128:
+        return SRA_128(cpu)
+    elif opcode == 0x129:
+        return SRA_129(cpu)
+    elif opcode == 0x12A:
+        return SRA_12A(cpu)
+    elif opcode == 0x12B:
+        return SRA_12B(cpu)
+    elif opcode == 0x12C:
+        return SRA_12C(cpu)
+    elif opcode == 0x12D:
+        return SRA_12D(cpu)
+    elif opcode == 0x12E:
+        return SRA_12E(cpu)
+    elif opcode == 0x12F:
+        return SRA_12F(cpu)
+    elif opcode == 0x130:
+        return SWAP_130(cpu)
+    elif opcode == 0x131:
+        return SWAP_131(cpu)
+    elif opcode == 0x132:
+        return SWAP_132(cpu)
+    elif opcode == 0x133:
+        return SWAP_133(cpu)
+    elif opcode == 0x134:
+        return SWAP_134(cpu)
+    elif opcode == 0x135:
+        return SWAP_135(cpu)
+    elif opcode == 0x136:
+        return SWAP_136(cpu)
+    elif opcode == 0x137:
+        return SWAP_137(cpu)
+    elif opcode == 0x138:
+        return SRL_138(cpu)
+    elif opcode == 0x139:
+        return SRL_139(cpu)
+    elif opcode == 0x13A:
+        return SRL_13A(cpu)
+    elif opcode == 0x13B:
+        return SRL_13B(cpu)
+    elif opcode == 0x13C:
+        return SRL_13C(cpu)
+    elif opcode == 0x13D:
+        return SRL_13D(cpu)
+    elif opcode == 0x13E:
+        return SRL_13E(cpu)
+    elif opcode == 0x13F:
+        return SRL_13F(cpu)
+    elif opcode == 0x140:
+        return BIT_140(cpu)
+    elif opcode == 0x141:
+        return BIT_141(cpu)
+    elif opcode == 0x142:
+        return BIT_142(cpu)
+    elif opcode == 0x143:
+        return BIT_143(cpu)
+    elif opcode == 0x144:
+        return BIT_144(cpu)
+    elif opcode == 0x145:
+        return BIT_145(cpu)
+    elif opcode == 0x146:
+        return BIT_146(cpu)
+    elif opcode == 0x147:
+        return BIT_147(cpu)
+    elif opcode == 0x148:
+        return BIT_148(cpu)
+    elif opcode == 0x149:
+        return BIT_149(cpu)
+    elif opcode == 0x14A:
+        return BIT_14A(cpu)
+    elif opcode == 0x14B:
+        return BIT_14B(cpu)
+    elif opcode == 0x14C:
+        return BIT_14C(cpu)
+    elif opcode == 0x14D:
+        return BIT_14D(cpu)
+    elif opcode == 0x14E:
+        return BIT_14E(cpu)
+    elif opcode == 0x14F:
+        return BIT_14F(cpu)
+    elif opcode == 0x150:
+        return BIT_150(cpu)
+    elif opcode == 0x151:
+        return BIT_151(cpu)
+    elif opcode == 0x152:
+        return BIT_152(cpu)
+    elif opcode == 0x153:
+        return BIT_153(cpu)
+    elif opcode == 0x154:
+        return BIT_154(cpu)
+    elif opcode == 0x155:
+        return BIT_155(cpu)
+    elif opcode == 0x156:
+        return BIT_156(cpu)
+    elif opcode == 0x157:
+        return BIT_157(cpu)
+    elif opcode == 0x158:
+        return BIT_158(cpu)
+    elif opcode == 0x159:
+        return BIT_159(cpu)
+    elif opcode == 0x15A:
+        return BIT_15A(cpu)
+    elif opcode == 0x15B:
+        return BIT_15B(cpu)
+    elif opcode == 0x15C:
+        return BIT_15C(cpu)
+    elif opcode == 0x15D:
+        return BIT_15D(cpu)
+    elif opcode == 0x15E:
+        return BIT_15E(cpu)
+    elif opcode == 0x15F:
+        return BIT_15F(cpu)
+    elif opcode == 0x160:
+        return BIT_160(cpu)
+    elif opcode == 0x161:
+        return BIT_161(cpu)
+    elif opcode == 0x162:
+        return BIT_162(cpu)
+    elif opcode == 0x163:
+        return BIT_163(cpu)
+    elif opcode == 0x164:
+        return BIT_164(cpu)
+    elif opcode == 0x165:
+        return BIT_165(cpu)
+    elif opcode == 0x166:
+        return BIT_166(cpu)
+    elif opcode == 0x167:
+        return BIT_167(cpu)
+    elif opcode == 0x168:
+        return BIT_168(cpu)
+    elif opcode == 0x169:
+        return BIT_169(cpu)
+    elif opcode == 0x16A:
+        return BIT_16A(cpu)
+    elif opcode == 0x16B:
+        return BIT_16B(cpu)
+    elif opcode == 0x16C:
+        return BIT_16C(cpu)
+    elif opcode == 0x16D:
+        return BIT_16D(cpu)
+    elif opcode == 0x16E:
+        return BIT_16E(cpu)
+    elif opcode == 0x16F:
+        return BIT_16F(cpu)
+    elif opcode == 0x170:
+        return BIT_170(cpu)
+    elif opcode == 0x171:
+        return BIT_171(cpu)
+    elif opcode == 0x172:
+        return BIT_172(cpu)
+    elif opcode == 0x173:
+        return BIT_173(cpu)
+    elif opcode == 0x174:
+        return BIT_174(cpu)
+    elif opcode == 0x175:
+        return BIT_175(cpu)
+    elif opcode == 0x176:
+        return BIT_176(cpu)
+    elif opcode == 0x177:
+        return BIT_177(cpu)
+    elif opcode == 0x178:
+        return BIT_178(cpu)
+    elif opcode == 0x179:
+        return BIT_179(cpu)
+    elif opcode == 0x17A:
+        return BIT_17A(cpu)
+    elif opcode == 0x17B:
+        return BIT_17B(cpu)
+    elif opcode == 0x17C:
+        return BIT_17C(cpu)
+    elif opcode == 0x17D:
+        return BIT_17D(cpu)
+    elif opcode == 0x17E:
+        return BIT_17E(cpu)
+    elif opcode == 0x17F:
+        return BIT_17F(cpu)
+    elif opcode == 0x180:
+        return RES_180(cpu)
+    elif opcode == 0x181:
+        return RES_181(cpu)
+    elif opcode == 0x182:
+        return RES_182(cpu)
+    elif opcode == 0x183:
+        return RES_183(cpu)
+    elif opcode == 0x184:
+        return RES_184(cpu)
+    elif opcode == 0x185:
+        return RES_185(cpu)
+    elif opcode == 0x186:
+        return RES_186(cpu)
+    elif opcode == 0x187:
+        return RES_187(cpu)
+    elif opcode == 0x188:
+        return RES_188(cpu)
+    elif opcode == 0x189:
+        return RES_189(cpu)
+    elif opcode == 0x18A:
+        return RES_18A(cpu)
+    elif opcode == 0x18B:
+        return RES_18B(cpu)
+    elif opcode == 0x18C:
+        return RES_18C(cpu)
+    elif opcode == 0x18D:
+        return RES_18D(cpu)
+    elif opcode == 0x18E:
+        return RES_18E(cpu)
+    elif opcode == 0x18F:
+        return RES_18F(cpu)
+    elif opcode == 0x190:
+        return RES_190(cpu)
+    elif opcode == 0x191:
+        return RES_191(cpu)
+    elif opcode == 0x192:
+        return RES_192(cpu)
+    elif opcode == 0x193:
+        return RES_193(cpu)
+    elif opcode == 0x194:
+        return RES_194(cpu)
+    elif opcode == 0x195:
+        return RES_195(cpu)
+    elif opcode == 0x196:
+        return RES_196(cpu)
+    elif opcode == 0x197:
+        return RES_197(cpu)
+    elif opcode == 0x198:
+        return RES_198(cpu)
+    elif opcode == 0x199:
+        return RES_199(cpu)
+    elif opcode == 0x19A:
+        return RES_19A(cpu)
+    elif opcode == 0x19B:
+        return RES_19B(cpu)
+    elif opcode == 0x19C:
+        return RES_19C(cpu)
+    elif opcode == 0x19D:
+        return RES_19D(cpu)
+    elif opcode == 0x19E:
+        return RES_19E(cpu)
+    elif opcode == 0x19F:
+        return RES_19F(cpu)
+    elif opcode == 0x1A0:
+        return RES_1A0(cpu)
+    elif opcode == 0x1A1:
+        return RES_1A1(cpu)
+    elif opcode == 0x1A2:
+        return RES_1A2(cpu)
+    elif opcode == 0x1A3:
+        return RES_1A3(cpu)
+    elif opcode == 0x1A4:
+        return RES_1A4(cpu)
+    elif opcode == 0x1A5:
+        return RES_1A5(cpu)
+    elif opcode == 0x1A6:
+        return RES_1A6(cpu)
+    elif opcode == 0x1A7:
+        return RES_1A7(cpu)
+    elif opcode == 0x1A8:
+        return RES_1A8(cpu)
+    elif opcode == 0x1A9:
+        return RES_1A9(cpu)
+    elif opcode == 0x1AA:
+        return RES_1AA(cpu)
+    elif opcode == 0x1AB:
+        return RES_1AB(cpu)
+    elif opcode == 0x1AC:
+        return RES_1AC(cpu)
+    elif opcode == 0x1AD:
+        return RES_1AD(cpu)
+    elif opcode == 0x1AE:
+        return RES_1AE(cpu)
+    elif opcode == 0x1AF:
+        return RES_1AF(cpu)
+    elif opcode == 0x1B0:
+        return RES_1B0(cpu)
+    elif opcode == 0x1B1:
+        return RES_1B1(cpu)
+    elif opcode == 0x1B2:
+        return RES_1B2(cpu)
+    elif opcode == 0x1B3:
+        return RES_1B3(cpu)
+    elif opcode == 0x1B4:
+        return RES_1B4(cpu)
+    elif opcode == 0x1B5:
+        return RES_1B5(cpu)
+    elif opcode == 0x1B6:
+        return RES_1B6(cpu)
+    elif opcode == 0x1B7:
+        return RES_1B7(cpu)
+    elif opcode == 0x1B8:
+        return RES_1B8(cpu)
+    elif opcode == 0x1B9:
+        return RES_1B9(cpu)
+    elif opcode == 0x1BA:
+        return RES_1BA(cpu)
+    elif opcode == 0x1BB:
+        return RES_1BB(cpu)
+    elif opcode == 0x1BC:
+        return RES_1BC(cpu)
+    elif opcode == 0x1BD:
+        return RES_1BD(cpu)
+    elif opcode == 0x1BE:
+        return RES_1BE(cpu)
+    elif opcode == 0x1BF:
+        return RES_1BF(cpu)
+    elif opcode == 0x1C0:
+        return SET_1C0(cpu)
+    elif opcode == 0x1C1:
+        return SET_1C1(cpu)
+    elif opcode == 0x1C2:
+        return SET_1C2(cpu)
+    elif opcode == 0x1C3:
+        return SET_1C3(cpu)
+    elif opcode == 0x1C4:
+        return SET_1C4(cpu)
+    elif opcode == 0x1C5:
+        return SET_1C5(cpu)
+    elif opcode == 0x1C6:
+        return SET_1C6(cpu)
+    elif opcode == 0x1C7:
+        return SET_1C7(cpu)
+    elif opcode == 0x1C8:
+        return SET_1C8(cpu)
+    elif opcode == 0x1C9:
+        return SET_1C9(cpu)
+    elif opcode == 0x1CA:
+        return SET_1CA(cpu)
+    elif opcode == 0x1CB:
+        return SET_1CB(cpu)
+    elif opcode == 0x1CC:
+        return SET_1CC(cpu)
+    elif opcode == 0x1CD:
+        return SET_1CD(cpu)
+    elif opcode == 0x1CE:
+        return SET_1CE(cpu)
+    elif opcode == 0x1CF:
+        return SET_1CF(cpu)
+    elif opcode == 0x1D0:
+        return SET_1D0(cpu)
+    elif opcode == 0x1D1:
+        return SET_1D1(cpu)
+    elif opcode == 0x1D2:
+        return SET_1D2(cpu)
+    elif opcode == 0x1D3:
+        return SET_1D3(cpu)
+    elif opcode == 0x1D4:
+        return SET_1D4(cpu)
+    elif opcode == 0x1D5:
+        return SET_1D5(cpu)
+    elif opcode == 0x1D6:
+        return SET_1D6(cpu)
+    elif opcode == 0x1D7:
+        return SET_1D7(cpu)
+    elif opcode == 0x1D8:
+        return SET_1D8(cpu)
+    elif opcode == 0x1D9:
+        return SET_1D9(cpu)
+    elif opcode == 0x1DA:
+        return SET_1DA(cpu)
+    elif opcode == 0x1DB:
+        return SET_1DB(cpu)
+    elif opcode == 0x1DC:
+        return SET_1DC(cpu)
+    elif opcode == 0x1DD:
+        return SET_1DD(cpu)
+    elif opcode == 0x1DE:
+        return SET_1DE(cpu)
+    elif opcode == 0x1DF:
+        return SET_1DF(cpu)
+    elif opcode == 0x1E0:
+        return SET_1E0(cpu)
+    elif opcode == 0x1E1:
+        return SET_1E1(cpu)
+    elif opcode == 0x1E2:
+        return SET_1E2(cpu)
+    elif opcode == 0x1E3:
+        return SET_1E3(cpu)
+    elif opcode == 0x1E4:
+        return SET_1E4(cpu)
+    elif opcode == 0x1E5:
+        return SET_1E5(cpu)
+    elif opcode == 0x1E6:
+        return SET_1E6(cpu)
+    elif opcode == 0x1E7:
+        return SET_1E7(cpu)
+    elif opcode == 0x1E8:
+        return SET_1E8(cpu)
+    elif opcode == 0x1E9:
+        return SET_1E9(cpu)
+    elif opcode == 0x1EA:
+        return SET_1EA(cpu)
+    elif opcode == 0x1EB:
+        return SET_1EB(cpu)
+    elif opcode == 0x1EC:
+        return SET_1EC(cpu)
+    elif opcode == 0x1ED:
+        return SET_1ED(cpu)
+    elif opcode == 0x1EE:
+        return SET_1EE(cpu)
+    elif opcode == 0x1EF:
+        return SET_1EF(cpu)
+    elif opcode == 0x1F0:
+        return SET_1F0(cpu)
+    elif opcode == 0x1F1:
+        return SET_1F1(cpu)
+    elif opcode == 0x1F2:
+        return SET_1F2(cpu)
+    elif opcode == 0x1F3:
+        return SET_1F3(cpu)
+    elif opcode == 0x1F4:
+        return SET_1F4(cpu)
+    elif opcode == 0x1F5:
+        return SET_1F5(cpu)
+    elif opcode == 0x1F6:
+        return SET_1F6(cpu)
+    elif opcode == 0x1F7:
+        return SET_1F7(cpu)
+    elif opcode == 0x1F8:
+        return SET_1F8(cpu)
+    elif opcode == 0x1F9:
+        return SET_1F9(cpu)
+    elif opcode == 0x1FA:
+        return SET_1FA(cpu)
+    elif opcode == 0x1FB:
+        return SET_1FB(cpu)
+    elif opcode == 0x1FC:
+        return SET_1FC(cpu)
+    elif opcode == 0x1FD:
+        return SET_1FD(cpu)
+    elif opcode == 0x1FE:
+        return SET_1FE(cpu)
+    elif opcode == 0x1FF:
+        return SET_1FF(cpu)
 
 
 OPCODE_LENGTHS = array.array("B", [
@@ -6836,520 +6827,13 @@ CPU_COMMANDS = [
     ]
 
 
-opcodeDict = {
-    0x00: NOP_00,
-    0x01: LD_01,
-    0x02: LD_02,
-    0x03: INC_03,
-    0x04: INC_04,
-    0x05: DEC_05,
-    0x06: LD_06,
-    0x07: RLCA_07,
-    0x08: LD_08,
-    0x09: ADD_09,
-    0x0A: LD_0A,
-    0x0B: DEC_0B,
-    0x0C: INC_0C,
-    0x0D: DEC_0D,
-    0x0E: LD_0E,
-    0x0F: RRCA_0F,
-    0x10: STOP_10,
-    0x11: LD_11,
-    0x12: LD_12,
-    0x13: INC_13,
-    0x14: INC_14,
-    0x15: DEC_15,
-    0x16: LD_16,
-    0x17: RLA_17,
-    0x18: JR_18,
-    0x19: ADD_19,
-    0x1A: LD_1A,
-    0x1B: DEC_1B,
-    0x1C: INC_1C,
-    0x1D: DEC_1D,
-    0x1E: LD_1E,
-    0x1F: RRA_1F,
-    0x20: JR_20,
-    0x21: LD_21,
-    0x22: LD_22,
-    0x23: INC_23,
-    0x24: INC_24,
-    0x25: DEC_25,
-    0x26: LD_26,
-    0x27: DAA_27,
-    0x28: JR_28,
-    0x29: ADD_29,
-    0x2A: LD_2A,
-    0x2B: DEC_2B,
-    0x2C: INC_2C,
-    0x2D: DEC_2D,
-    0x2E: LD_2E,
-    0x2F: CPL_2F,
-    0x30: JR_30,
-    0x31: LD_31,
-    0x32: LD_32,
-    0x33: INC_33,
-    0x34: INC_34,
-    0x35: DEC_35,
-    0x36: LD_36,
-    0x37: SCF_37,
-    0x38: JR_38,
-    0x39: ADD_39,
-    0x3A: LD_3A,
-    0x3B: DEC_3B,
-    0x3C: INC_3C,
-    0x3D: DEC_3D,
-    0x3E: LD_3E,
-    0x3F: CCF_3F,
-    0x40: LD_40,
-    0x41: LD_41,
-    0x42: LD_42,
-    0x43: LD_43,
-    0x44: LD_44,
-    0x45: LD_45,
-    0x46: LD_46,
-    0x47: LD_47,
-    0x48: LD_48,
-    0x49: LD_49,
-    0x4A: LD_4A,
-    0x4B: LD_4B,
-    0x4C: LD_4C,
-    0x4D: LD_4D,
-    0x4E: LD_4E,
-    0x4F: LD_4F,
-    0x50: LD_50,
-    0x51: LD_51,
-    0x52: LD_52,
-    0x53: LD_53,
-    0x54: LD_54,
-    0x55: LD_55,
-    0x56: LD_56,
-    0x57: LD_57,
-    0x58: LD_58,
-    0x59: LD_59,
-    0x5A: LD_5A,
-    0x5B: LD_5B,
-    0x5C: LD_5C,
-    0x5D: LD_5D,
-    0x5E: LD_5E,
-    0x5F: LD_5F,
-    0x60: LD_60,
-    0x61: LD_61,
-    0x62: LD_62,
-    0x63: LD_63,
-    0x64: LD_64,
-    0x65: LD_65,
-    0x66: LD_66,
-    0x67: LD_67,
-    0x68: LD_68,
-    0x69: LD_69,
-    0x6A: LD_6A,
-    0x6B: LD_6B,
-    0x6C: LD_6C,
-    0x6D: LD_6D,
-    0x6E: LD_6E,
-    0x6F: LD_6F,
-    0x70: LD_70,
-    0x71: LD_71,
-    0x72: LD_72,
-    0x73: LD_73,
-    0x74: LD_74,
-    0x75: LD_75,
-    0x76: HALT_76,
-    0x77: LD_77,
-    0x78: LD_78,
-    0x79: LD_79,
-    0x7A: LD_7A,
-    0x7B: LD_7B,
-    0x7C: LD_7C,
-    0x7D: LD_7D,
-    0x7E: LD_7E,
-    0x7F: LD_7F,
-    0x80: ADD_80,
-    0x81: ADD_81,
-    0x82: ADD_82,
-    0x83: ADD_83,
-    0x84: ADD_84,
-    0x85: ADD_85,
-    0x86: ADD_86,
-    0x87: ADD_87,
-    0x88: ADC_88,
-    0x89: ADC_89,
-    0x8A: ADC_8A,
-    0x8B: ADC_8B,
-    0x8C: ADC_8C,
-    0x8D: ADC_8D,
-    0x8E: ADC_8E,
-    0x8F: ADC_8F,
-    0x90: SUB_90,
-    0x91: SUB_91,
-    0x92: SUB_92,
-    0x93: SUB_93,
-    0x94: SUB_94,
-    0x95: SUB_95,
-    0x96: SUB_96,
-    0x97: SUB_97,
-    0x98: SBC_98,
-    0x99: SBC_99,
-    0x9A: SBC_9A,
-    0x9B: SBC_9B,
-    0x9C: SBC_9C,
-    0x9D: SBC_9D,
-    0x9E: SBC_9E,
-    0x9F: SBC_9F,
-    0xA0: AND_A0,
-    0xA1: AND_A1,
-    0xA2: AND_A2,
-    0xA3: AND_A3,
-    0xA4: AND_A4,
-    0xA5: AND_A5,
-    0xA6: AND_A6,
-    0xA7: AND_A7,
-    0xA8: XOR_A8,
-    0xA9: XOR_A9,
-    0xAA: XOR_AA,
-    0xAB: XOR_AB,
-    0xAC: XOR_AC,
-    0xAD: XOR_AD,
-    0xAE: XOR_AE,
-    0xAF: XOR_AF,
-    0xB0: OR_B0,
-    0xB1: OR_B1,
-    0xB2: OR_B2,
-    0xB3: OR_B3,
-    0xB4: OR_B4,
-    0xB5: OR_B5,
-    0xB6: OR_B6,
-    0xB7: OR_B7,
-    0xB8: CP_B8,
-    0xB9: CP_B9,
-    0xBA: CP_BA,
-    0xBB: CP_BB,
-    0xBC: CP_BC,
-    0xBD: CP_BD,
-    0xBE: CP_BE,
-    0xBF: CP_BF,
-    0xC0: RET_C0,
-    0xC1: POP_C1,
-    0xC2: JP_C2,
-    0xC3: JP_C3,
-    0xC4: CALL_C4,
-    0xC5: PUSH_C5,
-    0xC6: ADD_C6,
-    0xC7: RST_C7,
-    0xC8: RET_C8,
-    0xC9: RET_C9,
-    0xCA: JP_CA,
-    0xCB: PREFIX_CB,
-    0xCC: CALL_CC,
-    0xCD: CALL_CD,
-    0xCE: ADC_CE,
-    0xCF: RST_CF,
-    0xD0: RET_D0,
-    0xD1: POP_D1,
-    0xD2: JP_D2,
-    0xD3: no_opcode,
-    0xD4: CALL_D4,
-    0xD5: PUSH_D5,
-    0xD6: SUB_D6,
-    0xD7: RST_D7,
-    0xD8: RET_D8,
-    0xD9: RETI_D9,
-    0xDA: JP_DA,
-    0xDB: no_opcode,
-    0xDC: CALL_DC,
-    0xDD: no_opcode,
-    0xDE: SBC_DE,
-    0xDF: RST_DF,
-    0xE0: LDH_E0,
-    0xE1: POP_E1,
-    0xE2: LD_E2,
-    0xE3: no_opcode,
-    0xE4: no_opcode,
-    0xE5: PUSH_E5,
-    0xE6: AND_E6,
-    0xE7: RST_E7,
-    0xE8: ADD_E8,
-    0xE9: JP_E9,
-    0xEA: LD_EA,
-    0xEB: no_opcode,
-    0xEC: no_opcode,
-    0xED: no_opcode,
-    0xEE: XOR_EE,
-    0xEF: RST_EF,
-    0xF0: LDH_F0,
-    0xF1: POP_F1,
-    0xF2: LD_F2,
-    0xF3: DI_F3,
-    0xF4: no_opcode,
-    0xF5: PUSH_F5,
-    0xF6: OR_F6,
-    0xF7: RST_F7,
-    0xF8: LD_F8,
-    0xF9: LD_F9,
-    0xFA: LD_FA,
-    0xFB: EI_FB,
-    0xFC: no_opcode,
-    0xFD: no_opcode,
-    0xFE: CP_FE,
-    0xFF: RST_FF,
-    0x100: RLC_100,
-    0x101: RLC_101,
-    0x102: RLC_102,
-    0x103: RLC_103,
-    0x104: RLC_104,
-    0x105: RLC_105,
-    0x106: RLC_106,
-    0x107: RLC_107,
-    0x108: RRC_108,
-    0x109: RRC_109,
-    0x10A: RRC_10A,
-    0x10B: RRC_10B,
-    0x10C: RRC_10C,
-    0x10D: RRC_10D,
-    0x10E: RRC_10E,
-    0x10F: RRC_10F,
-    0x110: RL_110,
-    0x111: RL_111,
-    0x112: RL_112,
-    0x113: RL_113,
-    0x114: RL_114,
-    0x115: RL_115,
-    0x116: RL_116,
-    0x117: RL_117,
-    0x118: RR_118,
-    0x119: RR_119,
-    0x11A: RR_11A,
-    0x11B: RR_11B,
-    0x11C: RR_11C,
-    0x11D: RR_11D,
-    0x11E: RR_11E,
-    0x11F: RR_11F,
-    0x120: SLA_120,
-    0x121: SLA_121,
-    0x122: SLA_122,
-    0x123: SLA_123,
-    0x124: SLA_124,
-    0x125: SLA_125,
-    0x126: SLA_126,
-    0x127: SLA_127,
-    0x128: SRA_128,
-    0x129: SRA_129,
-    0x12A: SRA_12A,
-    0x12B: SRA_12B,
-    0x12C: SRA_12C,
-    0x12D: SRA_12D,
-    0x12E: SRA_12E,
-    0x12F: SRA_12F,
-    0x130: SWAP_130,
-    0x131: SWAP_131,
-    0x132: SWAP_132,
-    0x133: SWAP_133,
-    0x134: SWAP_134,
-    0x135: SWAP_135,
-    0x136: SWAP_136,
-    0x137: SWAP_137,
-    0x138: SRL_138,
-    0x139: SRL_139,
-    0x13A: SRL_13A,
-    0x13B: SRL_13B,
-    0x13C: SRL_13C,
-    0x13D: SRL_13D,
-    0x13E: SRL_13E,
-    0x13F: SRL_13F,
-    0x140: BIT_140,
-    0x141: BIT_141,
-    0x142: BIT_142,
-    0x143: BIT_143,
-    0x144: BIT_144,
-    0x145: BIT_145,
-    0x146: BIT_146,
-    0x147: BIT_147,
-    0x148: BIT_148,
-    0x149: BIT_149,
-    0x14A: BIT_14A,
-    0x14B: BIT_14B,
-    0x14C: BIT_14C,
-    0x14D: BIT_14D,
-    0x14E: BIT_14E,
-    0x14F: BIT_14F,
-    0x150: BIT_150,
-    0x151: BIT_151,
-    0x152: BIT_152,
-    0x153: BIT_153,
-    0x154: BIT_154,
-    0x155: BIT_155,
-    0x156: BIT_156,
-    0x157: BIT_157,
-    0x158: BIT_158,
-    0x159: BIT_159,
-    0x15A: BIT_15A,
-    0x15B: BIT_15B,
-    0x15C: BIT_15C,
-    0x15D: BIT_15D,
-    0x15E: BIT_15E,
-    0x15F: BIT_15F,
-    0x160: BIT_160,
-    0x161: BIT_161,
-    0x162: BIT_162,
-    0x163: BIT_163,
-    0x164: BIT_164,
-    0x165: BIT_165,
-    0x166: BIT_166,
-    0x167: BIT_167,
-    0x168: BIT_168,
-    0x169: BIT_169,
-    0x16A: BIT_16A,
-    0x16B: BIT_16B,
-    0x16C: BIT_16C,
-    0x16D: BIT_16D,
-    0x16E: BIT_16E,
-    0x16F: BIT_16F,
-    0x170: BIT_170,
-    0x171: BIT_171,
-    0x172: BIT_172,
-    0x173: BIT_173,
-    0x174: BIT_174,
-    0x175: BIT_175,
-    0x176: BIT_176,
-    0x177: BIT_177,
-    0x178: BIT_178,
-    0x179: BIT_179,
-    0x17A: BIT_17A,
-    0x17B: BIT_17B,
-    0x17C: BIT_17C,
-    0x17D: BIT_17D,
-    0x17E: BIT_17E,
-    0x17F: BIT_17F,
-    0x180: RES_180,
-    0x181: RES_181,
-    0x182: RES_182,
-    0x183: RES_183,
-    0x184: RES_184,
-    0x185: RES_185,
-    0x186: RES_186,
-    0x187: RES_187,
-    0x188: RES_188,
-    0x189: RES_189,
-    0x18A: RES_18A,
-    0x18B: RES_18B,
-    0x18C: RES_18C,
-    0x18D: RES_18D,
-    0x18E: RES_18E,
-    0x18F: RES_18F,
-    0x190: RES_190,
-    0x191: RES_191,
-    0x192: RES_192,
-    0x193: RES_193,
-    0x194: RES_194,
-    0x195: RES_195,
-    0x196: RES_196,
-    0x197: RES_197,
-    0x198: RES_198,
-    0x199: RES_199,
-    0x19A: RES_19A,
-    0x19B: RES_19B,
-    0x19C: RES_19C,
-    0x19D: RES_19D,
-    0x19E: RES_19E,
-    0x19F: RES_19F,
-    0x1A0: RES_1A0,
-    0x1A1: RES_1A1,
-    0x1A2: RES_1A2,
-    0x1A3: RES_1A3,
-    0x1A4: RES_1A4,
-    0x1A5: RES_1A5,
-    0x1A6: RES_1A6,
-    0x1A7: RES_1A7,
-    0x1A8: RES_1A8,
-    0x1A9: RES_1A9,
-    0x1AA: RES_1AA,
-    0x1AB: RES_1AB,
-    0x1AC: RES_1AC,
-    0x1AD: RES_1AD,
-    0x1AE: RES_1AE,
-    0x1AF: RES_1AF,
-    0x1B0: RES_1B0,
-    0x1B1: RES_1B1,
-    0x1B2: RES_1B2,
-    0x1B3: RES_1B3,
-    0x1B4: RES_1B4,
-    0x1B5: RES_1B5,
-    0x1B6: RES_1B6,
-    0x1B7: RES_1B7,
-    0x1B8: RES_1B8,
-    0x1B9: RES_1B9,
-    0x1BA: RES_1BA,
-    0x1BB: RES_1BB,
-    0x1BC: RES_1BC,
-    0x1BD: RES_1BD,
-    0x1BE: RES_1BE,
-    0x1BF: RES_1BF,
-    0x1C0: SET_1C0,
-    0x1C1: SET_1C1,
-    0x1C2: SET_1C2,
-    0x1C3: SET_1C3,
-    0x1C4: SET_1C4,
-    0x1C5: SET_1C5,
-    0x1C6: SET_1C6,
-    0x1C7: SET_1C7,
-    0x1C8: SET_1C8,
-    0x1C9: SET_1C9,
-    0x1CA: SET_1CA,
-    0x1CB: SET_1CB,
-    0x1CC: SET_1CC,
-    0x1CD: SET_1CD,
-    0x1CE: SET_1CE,
-    0x1CF: SET_1CF,
-    0x1D0: SET_1D0,
-    0x1D1: SET_1D1,
-    0x1D2: SET_1D2,
-    0x1D3: SET_1D3,
-    0x1D4: SET_1D4,
-    0x1D5: SET_1D5,
-    0x1D6: SET_1D6,
-    0x1D7: SET_1D7,
-    0x1D8: SET_1D8,
-    0x1D9: SET_1D9,
-    0x1DA: SET_1DA,
-    0x1DB: SET_1DB,
-    0x1DC: SET_1DC,
-    0x1DD: SET_1DD,
-    0x1DE: SET_1DE,
-    0x1DF: SET_1DF,
-    0x1E0: SET_1E0,
-    0x1E1: SET_1E1,
-    0x1E2: SET_1E2,
-    0x1E3: SET_1E3,
-    0x1E4: SET_1E4,
-    0x1E5: SET_1E5,
-    0x1E6: SET_1E6,
-    0x1E7: SET_1E7,
-    0x1E8: SET_1E8,
-    0x1E9: SET_1E9,
-    0x1EA: SET_1EA,
-    0x1EB: SET_1EB,
-    0x1EC: SET_1EC,
-    0x1ED: SET_1ED,
-    0x1EE: SET_1EE,
-    0x1EF: SET_1EF,
-    0x1F0: SET_1F0,
-    0x1F1: SET_1F1,
-    0x1F2: SET_1F2,
-    0x1F3: SET_1F3,
-    0x1F4: SET_1F4,
-    0x1F5: SET_1F5,
-    0x1F6: SET_1F6,
-    0x1F7: SET_1F7,
-    0x1F8: SET_1F8,
-    0x1F9: SET_1F9,
-    0x1FA: SET_1FA,
-    0x1FB: SET_1FB,
-    0x1FC: SET_1FC,
-    0x1FD: SET_1FD,
-    0x1FE: SET_1FE,
-    0x1FF: SET_1FF
-}
+if not cythonmode:
+    # Cython can't put its C functions in a dict, so the table is only built in pure Python
+    opcodeDict = {}
+    for opcode, command in enumerate(CPU_COMMANDS):
+        name = "%s_%0.2X" % (command.split()[0], opcode) if command else "no_opcode"
+        opcodeDict[opcode] = globals()[name]
+
 
 writeOpCodes = [
     0x01,
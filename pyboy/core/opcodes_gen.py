@@ -19,6 +19,12 @@ warning = """
 imports = """
 import array
 
+try:
+    from cython import compiled
+    cythonmode = compiled
+except ImportError:
+    cythonmode = False
+
 FLAGC, FLAGH, FLAGN, FLAGZ = range(4, 8)
 
 
@@ -33,8 +39,7 @@ from libc.stdint cimport uint8_t, uint16_t, uint32_t
 cdef uint16_t FLAGC, FLAGH, FLAGN, FLAGZ
 cdef uint8_t[512] OPCODE_LENGTHS
 cdef uint16_t opcode_length(uint16_t)
-@cython.locals(v=cython.int, a=cython.int, b=cython.int, pc=cython.ushort)
-cdef int execute_opcode(cpu.CPU, uint16_t)
+cdef int execute_opcode(cpu.CPU, uint16_t, int)
 
 cdef uint8_t no_opcode(cpu.CPU) except -1
 """
@@ -469,8 +474,11 @@ class OpcodeData:
 
     def STOP(self):
         code = Code(self.name.split()[0], self.opcode, self.name, True, self.length, self.cycles)
-        code.addline("pass")
-        # code.addLine("raise Exception('STOP not implemented!')")
+        code.addlines([
+            "if cpu.mb.is_cgb:",
+            "\tcpu.mb.mem_manager.switch_speed()",
+            "\tcpu.mb.mem_manager.set_io(0xFF04, 0)",
+        ])
         return code.getcode()
 
     def DAA(self):
@@ -1199,19 +1207,14 @@ def update():
         f.write("def opcode_length(opcode):\n    return OPCODE_LENGTHS[opcode]\n\n")
         f.write(
             """
-def execute_opcode(cpu, opcode):
-    oplen = opcode_length(opcode)
-    v = 0
-    pc = cpu.PC
-    if oplen == 2:
-        # 8-bit immediate
-        v = cpu.mb.getitem(pc+1)
-    elif oplen == 3:
-        # 16-bit immediate
-        # Flips order of values due to big-endian
-        a = cpu.mb.getitem(pc+2)
-        b = cpu.mb.getitem(pc+1)
-        v = (a << 8) + b
+def execute_opcode(cpu, opcode, v):
+    # The immediate value, v, has already been read by the CPU's decoder
+    if not cythonmode:
+        # A dict lookup is faster than the if-chain in pure Python. Cython compiles the if-chain into a switch.
+        if opcode_length(opcode) > 1:
+            return opcodeDict[opcode](cpu, v)
+        else:
+            return opcodeDict[opcode](cpu)
 
 """
         )
@@ -1244,6 +1247,18 @@ def execute_opcode(cpu, opcode):
 
         f.write("]\n")
 
+        f.write(
+            """
+
+if not cythonmode:
+    # Cython can't put its C functions in a dict, so the table is only built in pure Python
+    opcodeDict = {}
+    for opcode, command in enumerate(CPU_COMMANDS):
+        name = "%s_%0.2X" % (command.split()[0], opcode) if command else "no_opcode"
+        opcodeDict[opcode] = globals()[name]
+"""
+        )
+
 
 def load():
     # if os.path.exists(destination):
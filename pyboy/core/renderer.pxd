@@ -0,0 +1,105 @@
+#
+# License: See LICENSE.md file
+# GitHub: https://github.com/Baekalfen/PyBoy
+#
+
+import cython
+from cpython.array cimport array
+from libc.stdint cimport uint8_t, uint16_t, uint32_t
+from pyboy.core.lcd cimport LCD
+from pyboy.utils cimport IntIOInterface
+
+cdef int ROWS, COLS
+
+
+cdef class Renderer:
+    cdef uint8_t alphamask
+    cdef uint32_t[4] color_palette
+    cdef uint32_t[4] obj0_palette
+    cdef uint32_t[4] obj1_palette
+    cdef uint32_t[:] _bg_rgba, _obj_rgba
+    cdef uint8_t[:] _color_code_low, _color_code_high
+    cdef str color_format
+    cdef tuple buffer_dims
+    cdef bint clearcache
+    cdef bint palettes_changed
+    cdef set tiles_changed0
+    cdef set tiles_changed1
+
+    cdef array _screenbuffer_raw
+    cdef array _tilecache_raw
+    cdef uint32_t[:,:] _screenbuffer
+    cdef uint8_t[:,:] _tilecache
+
+    cdef int[144][9] _scanlineparameters
+    cdef int[144][10] _sprites
+    cdef int[144] _sprite_count
+    cdef object numpy_backend
+
+    @cython.locals(bx=int, by=int, wx=int, wy=int)
+    cpdef void scanline(self, int, LCD)
+
+    @cython.locals(
+        y=int,
+        x=int,
+        wmap=int,
+        background_offset=int,
+        bx=int,
+        by=int,
+        wx=int,
+        wy=int,
+        tile_data_select=int,
+        bgmap_select=int,
+        wmap_select=int,
+        window_enable=int,
+        bg_enable=int,
+        wt=int,
+        bt=int,
+        offset=int,
+    )
+    cpdef void render_screen(self, LCD)
+
+    @cython.locals(n=int, y=int, yy=int)
+    cdef void scan_sprites(self, LCD, int)
+
+    @cython.locals(
+        y=int,
+        x=int,
+        bgpkey=uint32_t,
+        spriteheight=int,
+        i=int,
+        n=int,
+        tileindex=int,
+        attributes=int,
+        xflip=bint,
+        yflip=bint,
+        spritepriority=bint,
+        palette=int,
+        dx=int,
+        yy=int,
+        xx=int,
+        pixel=uint32_t,
+    )
+    cdef void render_sprites(self, LCD, uint32_t[:,:], bint)
+
+    @cython.locals(
+        x=int,
+        t=int,
+        k=int,
+        y=int,
+        n=int,
+        byte1=int,
+        byte2=int,
+    )
+    cdef void update_cache(self, LCD)
+
+    @cython.locals(colorcode=int)
+    cdef void update_palettes(self, LCD)
+
+    @cython.locals(y=int, x=int, color=uint32_t)
+    cdef void blank_screen(self)
+
+    @cython.locals(y=int)
+    cdef void save_state(self, IntIOInterface)
+    @cython.locals(y=int)
+    cdef void load_state(self, IntIOInterface, int)
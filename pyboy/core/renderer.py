@@ -1,7 +1,9 @@
-from pyboy.utils import color_code
+from pyboy.utils import COLOR_CODE_HIGH, COLOR_CODE_LOW
 from array import array
 from ctypes import c_void_p
 
+from . import numpy_renderer
+
 ROWS, COLS = 144, 160
 
 try:
@@ -15,40 +17,52 @@ class Renderer:
         self.alphamask = 0xFF
 
         self.color_palette = [(c << 8) | self.alphamask for c in color_palette]
-        self.obj0_palette = [(c << 8) | self.alphamask for c in obj0_palette] if obj0_palette else self.color_palette
-        self.obj1_palette = [(c << 8) | self.alphamask for c in obj0_palette] if obj1_palette else self.color_palette
+        self.obj0_palette = [(c << 8) | self.alphamask for c in (obj0_palette or color_palette)]
+        self.obj1_palette = [(c << 8) | self.alphamask for c in (obj1_palette or color_palette)]
         self.color_format = "RGBA"
 
         self.buffer_dims = (ROWS, COLS)
 
+        # RGBA colors of the 4 color codes in BGP, and in OBP0 followed by OBP1. The tiles are cached as color codes, and
+        # the palettes are applied, when the screen is rendered. Sprites are transparent for color code 0.
+        self._bg_rgba = array("I", [0] * 4)
+        self._obj_rgba = array("I", [0] * 8)
+        self._color_code_low = COLOR_CODE_LOW
+        self._color_code_high = COLOR_CODE_HIGH
+
         self.clearcache = False
+        self.palettes_changed = True
         self.tiles_changed0 = set([])
+        # VRAM bank 1 only exists on CGB, and is only rendered by the CGB renderer
+        self.tiles_changed1 = set([])
 
         tiles = 384
         
         # Init buffers as white
         self._screenbuffer_raw = array("B", [0xFF] * (ROWS*COLS*4))
-        self._tilecache_raw = array("B", [0xFF] * (tiles*8*8*4))
-        self._spritecache0_raw = array("B", [0xFF] * (tiles*8*8*4))
-        self._spritecache1_raw = array("B", [0xFF] * (tiles*8*8*4))
+        self._tilecache_raw = array("B", [0] * (tiles*8*8))
 
         if cythonmode:
             self._screenbuffer = memoryview(self._screenbuffer_raw).cast("I", shape=(ROWS, COLS))
-            self._tilecache = memoryview(self._tilecache_raw).cast("I", shape=(tiles * 8, 8))
-            self._spritecache0 = memoryview(self._spritecache0_raw).cast("I", shape=(tiles * 8, 8))
-            self._spritecache1 = memoryview(self._spritecache1_raw).cast("I", shape=(tiles * 8, 8))
+            self._tilecache = memoryview(self._tilecache_raw).cast("B", shape=(tiles * 8, 8))
         else:
             v = memoryview(self._screenbuffer_raw).cast("I")
             self._screenbuffer = [v[i:i + COLS] for i in range(0, COLS * ROWS, COLS)]
-            v = memoryview(self._tilecache_raw).cast("I")
+            v = memoryview(self._tilecache_raw)
             self._tilecache = [v[i:i + 8] for i in range(0, tiles * 8 * 8, 8)]
-            v = memoryview(self._spritecache0_raw).cast("I")
-            self._spritecache0 = [v[i:i + 8] for i in range(0, tiles * 8 * 8, 8)]
-            v = memoryview(self._spritecache1_raw).cast("I")
-            self._spritecache1 = [v[i:i + 8] for i in range(0, tiles * 8 * 8, 8)]
             self._screenbuffer_ptr = c_void_p(self._screenbuffer_raw.buffer_info()[0])
 
-        self._scanlineparameters = [[0, 0, 0, 0, 0, 0, 0, 0, 0] for _ in range(ROWS)]
+        # Without Cython, the screen is rendered with NumPy instead, if it's available
+        self.numpy_backend = None
+        if not cythonmode and numpy_renderer.numpy_enabled:
+            self.numpy_backend = numpy_renderer.NumpyRenderer(self, tiles)
+
+        # The parameters of each scanline, and the OAM addresses of the sprites shown on it in OAM order. Cython starts
+        # these C arrays zeroed, and assigning lists of two shapes in one function makes it reuse a too small temporary.
+        if not cythonmode:
+            self._scanlineparameters = [[0, 0, 0, 0, 0, 0, 0, 0, 0] for _ in range(ROWS)]
+            self._sprites = [[0 for _ in range(10)] for _ in range(ROWS)]
+            self._sprite_count = [0 for _ in range(ROWS)]
 
     def scanline(self, y, lcd):
         bx, by = lcd.getviewport()
@@ -65,6 +79,10 @@ class Renderer:
 
     def render_screen(self, lcd):
         self.update_cache(lcd)
+        if self.numpy_backend is not None:
+            self.numpy_backend.render_screen(lcd)
+            return
+
         # All VRAM addresses are offset by 0x8000
         # Following addresses are 0x9800 and 0x9C00
 
@@ -84,7 +102,7 @@ class Renderer:
                         # (x ^ 0x80 - 128) to convert to signed, then
                         # add 256 for offset (reduces to + 128)
                         wt = (wt ^ 0x80) + 128
-                    self._screenbuffer[y][x] = self._tilecache[8*wt + (y-wy) % 8][(x-wx) % 8]
+                    self._screenbuffer[y][x] = self._bg_rgba[self._tilecache[8*wt + (y-wy) % 8][(x-wx) % 8]]
                 elif bg_enable:
                     bt = lcd.getVRAM(background_offset + (y+by) // 8 * 32 % 0x400 + (x+bx) // 8 % 32, False)
                     # If using signed tile indices, modify index
@@ -92,7 +110,7 @@ class Renderer:
                         # (x ^ 0x80 - 128) to convert to signed, then
                         # add 256 for offset (reduces to + 128)
                         bt = (bt ^ 0x80) + 128
-                    self._screenbuffer[y][x] = self._tilecache[8*bt + (y+by) % 8][(x+offset) % 8]
+                    self._screenbuffer[y][x] = self._bg_rgba[self._tilecache[8*bt + (y+by) % 8][(x+offset) % 8]]
                 else:
                     # If background is disabled, it becomes white
                     self._screenbuffer[y][x] = self.color_palette[0]
@@ -100,44 +118,61 @@ class Renderer:
         if lcd.LCDC.sprite_enable:
             self.render_sprites(lcd, self._screenbuffer, False)
 
+    def scan_sprites(self, lcd, spriteheight):
+        # Like the OAM scan of the Game Boy, only the first 10 sprites in OAM are picked for each scanline. Sprites
+        # outside the screen horizontally still count towards the limit.
+        for y in range(ROWS):
+            self._sprite_count[y] = 0
+
+        for n in range(0x00, 0xA0, 4):
+            y = lcd.OAM[n] - 16 # Documentation states the y coordinate needs to be subtracted by 16
+            for yy in range(max(y, 0), min(y + spriteheight, ROWS)):
+                if self._sprite_count[yy] < 10:
+                    self._sprites[yy][self._sprite_count[yy]] = n
+                    self._sprite_count[yy] += 1
+
     def render_sprites(self, lcd, buffer, ignore_priority):
         # Render sprites
-        # - Doesn't restrict 10 sprites per scan line
+        # - Only the first 10 sprites in OAM are shown on each scan line
         # - Prioritizes sprite in inverted order
         spriteheight = 16 if lcd.LCDC.sprite_height else 8
         bgpkey = self.color_palette[lcd.BGP.getcolor(0)]
-        
-        for n in range(0x00, 0xA0, 4):
-            y = lcd.OAM[n] - 16 # Documentation states the y coordinate needs to be subtracted by 16
-            x = lcd.OAM[n + 1] - 8 # Documentation states the x coordinate needs to be subtracted by 8
-            tileindex = lcd.OAM[n + 2]
-            attributes = lcd.OAM[n + 3]
-            xflip = attributes & 0b00100000
-            yflip = attributes & 0b01000000
-            spritepriority = (attributes & 0b10000000) and not ignore_priority
-            spritecache = (self._spritecache1 if attributes & 0b10000 else self._spritecache0)
-
-            for dy in range(spriteheight):
-                yy = spriteheight - dy - 1 if yflip else dy
-                if 0 <= y < ROWS:
-                    for dx in range(8):
-                        xx = 7 - dx if xflip else dx
-                        pixel = spritecache[8*tileindex + yy][xx]
-                        if 0 <= x < COLS:
-                            # import pdb; pdb.set_trace()
-                            # TODO: Checking `buffer[y][x] == bgpkey` is a bit of a hack
-                            if (spritepriority and not buffer[y][x] == bgpkey):
-                                # Add a fake alphachannel to the sprite for BG pixels. We can't just merge this
-                                # with the next 'if', as sprites can have an alpha channel in other ways
-                                pixel &= ~self.alphamask
-
-                            if pixel & self.alphamask:
-                                buffer[y][x] = pixel
-                        x += 1
-                    x -= 8
-                y += 1
+        self.scan_sprites(lcd, spriteheight)
+
+        for y in range(ROWS):
+            for i in range(self._sprite_count[y]):
+                n = self._sprites[y][i]
+                x = lcd.OAM[n + 1] - 8 # Documentation states the x coordinate needs to be subtracted by 8
+                if x <= -8 or x >= COLS:
+                    continue
+                tileindex = lcd.OAM[n + 2]
+                attributes = lcd.OAM[n + 3]
+                xflip = attributes & 0b00100000
+                yflip = attributes & 0b01000000
+                spritepriority = (attributes & 0b10000000) and not ignore_priority
+                # bit 4 selects OBP1, which follows OBP0 in the sprite colors
+                palette = 4 if attributes & 0b10000 else 0
+
+                yy = y - (lcd.OAM[n] - 16)
+                if yflip:
+                    yy = spriteheight - yy - 1
+
+                # Only the part of the sprite on the screen is drawn
+                for dx in range(max(-x, 0), min(8, COLS - x)):
+                    xx = 7 - dx if xflip else dx
+                    pixel = self._obj_rgba[palette + self._tilecache[8*tileindex + yy][xx]]
+                    # TODO: Checking `buffer[y][x] == bgpkey` is a bit of a hack
+                    if (spritepriority and not buffer[y][x + dx] == bgpkey):
+                        # Add a fake alphachannel to the sprite for BG pixels. We can't just merge this
+                        # with the next 'if', as sprites can have an alpha channel in other ways
+                        pixel &= ~self.alphamask
+
+                    if pixel & self.alphamask:
+                        buffer[y][x + dx] = pixel
 
     def update_cache(self, lcd):
+        if self.palettes_changed or self.clearcache:
+            self.update_palettes(lcd)
         if self.clearcache:
             self.tiles_changed0.clear()
             for x in range(0x8000, 0x9800, 16):
@@ -146,22 +181,25 @@ class Renderer:
 
         for t in self.tiles_changed0:
             for k in range(0, 16, 2): # 2 bytes for each line
-                byte1 = lcd.getVRAM(t + k)
-                byte2 = lcd.getVRAM(t + k + 1)
+                byte1 = lcd.getVRAM(t + k) * 8
+                byte2 = lcd.getVRAM(t + k + 1) * 8
                 y = (t+k-0x8000) // 2
 
                 for x in range(8):
-                    colorcode = color_code(byte1, byte2, 7 - x)
-                    self._tilecache[y][x] = self.color_palette[lcd.BGP.getcolor(colorcode)]
-                    self._spritecache0[y][x] = self.obj0_palette[lcd.OBP0.getcolor(colorcode)]
-                    self._spritecache1[y][x] = self.obj1_palette[lcd.OBP1.getcolor(colorcode)]
-
-                    if colorcode == 0:
-                        self._spritecache0[y][x] &= ~self.alphamask
-                        self._spritecache1[y][x] &= ~self.alphamask
+                    self._tilecache[y][x] = self._color_code_low[byte1 + x] | self._color_code_high[byte2 + x]
 
         self.tiles_changed0.clear()
 
+    def update_palettes(self, lcd):
+        for colorcode in range(4):
+            self._bg_rgba[colorcode] = self.color_palette[lcd.BGP.getcolor(colorcode)]
+            self._obj_rgba[colorcode] = self.obj0_palette[lcd.OBP0.getcolor(colorcode)]
+            self._obj_rgba[4 + colorcode] = self.obj1_palette[lcd.OBP1.getcolor(colorcode)]
+        # first color transparent for sprites
+        self._obj_rgba[0] &= ~self.alphamask
+        self._obj_rgba[4] &= ~self.alphamask
+        self.palettes_changed = False
+
     def blank_screen(self):
         # If the screen is off, fill it with a color.
         color = self.color_palette[0]
@@ -177,6 +215,11 @@ class Renderer:
             f.write((self._scanlineparameters[y][2] + 7) & 0xFF)
             f.write(self._scanlineparameters[y][3])
             f.write(self._scanlineparameters[y][4])
+            # The maps and enable bits of LCDC as well, as a snapshot can be taken in the middle of a frame
+            f.write(self._scanlineparameters[y][5])
+            f.write(self._scanlineparameters[y][6])
+            f.write(self._scanlineparameters[y][7])
+            f.write(self._scanlineparameters[y][8])
 
     def load_state(self, f, state_version):
         for y in range(ROWS):
@@ -186,4 +229,9 @@ class Renderer:
             self._scanlineparameters[y][2] = (f.read() - 7) & 0xFF
             self._scanlineparameters[y][3] = f.read()
             if state_version > 3:
-                self._scanlineparameters[y][4] = f.read()
\ No newline at end of file
+                self._scanlineparameters[y][4] = f.read()
+            if state_version > 5:
+                self._scanlineparameters[y][5] = f.read()
+                self._scanlineparameters[y][6] = f.read()
+                self._scanlineparameters[y][7] = f.read()
+                self._scanlineparameters[y][8] = f.read()
\ No newline at end of file
@@ -4,11 +4,9 @@
 #
 
 cimport cython
-# cimport sdl2
 from libc.stdint cimport uint8_t, uint16_t, uint64_t
 from pyboy.utils cimport IntIOInterface
 
-cdef int SOUND_DESYNC_THRESHOLD
 cdef int CPU_FREQ
 
 cdef class Sound:
@@ -22,13 +20,12 @@ cdef class Sound:
     cdef void save_state(self, IntIOInterface)
     cdef void load_state(self, IntIOInterface, int)
 
-    cdef int device
+    cdef object sink
 
     cdef int sample_rate
     cdef int sampleclocks
     # cdef uint8_t[4096] audiobuffer
     cdef object audiobuffer
-    cdef object audiobuffer_p
 
     cdef int clock
 
@@ -40,7 +37,7 @@ cdef class Sound:
     cdef uint8_t get(self, uint8_t)
     cdef void set(self, uint8_t, uint8_t)
 
-    @cython.locals(nsamples=int, i=int, queued_time=int, )
+    @cython.locals(nsamples=int, i=int)
     cdef void sync(self)
 
 
@@ -8,28 +8,20 @@
 # http://www.devrs.com/gb/files/hosted/GBSOUND.txt
 
 from array import array
-from ctypes import c_void_p
 
-import sdl2
+from .sound_sink import SAMPLE_RATE
 
-SOUND_DESYNC_THRESHOLD = 5
 CPU_FREQ = 4213440 # hz
 
 
 class Sound:
-    def __init__(self):
-        # Initialization is handled in the windows, otherwise we'd need this
-        sdl2.SDL_Init(sdl2.SDL_INIT_AUDIO)
-
-        # Open audio device
-        spec_want = sdl2.SDL_AudioSpec(32768, sdl2.AUDIO_S8, 2, 64)
-        spec_have = sdl2.SDL_AudioSpec(0, 0, 0, 0)
-        self.device = sdl2.SDL_OpenAudioDevice(None, 0, spec_want, spec_have, 0)
-
-        self.sample_rate = spec_have.freq
-        self.sampleclocks = CPU_FREQ / self.sample_rate
+    def __init__(self, sink):
+        # The samples are handed to the sink, which plays or keeps them
+        self.sink = sink
+        self.sample_rate = sink.open(SAMPLE_RATE)
+        # The channels run for whole clock cycles, so a sample is taken every whole number of cycles
+        self.sampleclocks = CPU_FREQ // self.sample_rate
         self.audiobuffer = array("b", [0] * 4096) # Over 2 frames
-        self.audiobuffer_p = c_void_p(self.audiobuffer.buffer_info()[0])
 
         self.clock = 0
 
@@ -38,9 +30,6 @@ class Sound:
         self.wavechannel = WaveChannel()
         self.noisechannel = NoiseChannel()
 
-        # Start playback (move out of __init__ if needed, maybe for headless)
-        sdl2.SDL_PauseAudioDevice(self.device, 0)
-
     def get(self, offset):
         self.sync()
         if offset < 20:
@@ -93,9 +82,10 @@ class Sound:
 
     def sync(self):
         """Run the audio for the number of clock cycles stored in self.clock"""
-        nsamples = int(self.clock / self.sampleclocks)
+        # The buffer holds 2048 stereo samples. Anything beyond is dropped.
+        nsamples = min(2048, self.clock // self.sampleclocks)
 
-        for i in range(min(2048, nsamples)):
+        for i in range(nsamples):
             self.sweepchannel.run(self.sampleclocks)
             self.tonechannel.run(self.sampleclocks)
             self.wavechannel.run(self.sampleclocks)
@@ -110,17 +100,11 @@ class Sound:
             self.audiobuffer[2*i + 1] = sample
             self.clock -= self.sampleclocks
 
-        # Clear queue, if we are behind
-        queued_time = sdl2.SDL_GetQueuedAudioSize(self.device)
-        samples_per_frame = (self.sample_rate / 60) * 2 # Data of 1 frame's worth (60) in stereo (2)
-        if queued_time > samples_per_frame * SOUND_DESYNC_THRESHOLD:
-            sdl2.SDL_ClearQueuedAudio(self.device)
-
-        sdl2.SDL_QueueAudio(self.device, self.audiobuffer_p, 2 * nsamples)
+        self.sink.write(self.audiobuffer, 2 * nsamples)
         self.clock %= self.sampleclocks
 
     def stop(self):
-        sdl2.SDL_CloseAudioDevice(self.device)
+        self.sink.stop()
 
     def save_state(self, file):
         pass
@@ -0,0 +1,162 @@
+#
+# License: See LICENSE file
+# GitHub: https://github.com/Baekalfen/PyBoy
+#
+"""
+The sinks receive the samples produced by `pyboy.core.sound.Sound`. One of them can be given to PyBoy with the `sound`
+argument. The samples are interleaved stereo, signed 8-bit.
+"""
+
+import logging
+import wave
+from ctypes import c_void_p
+
+logger = logging.getLogger(__name__)
+
+SAMPLE_RATE = 32768 # hz
+SOUND_DESYNC_THRESHOLD = 5
+
+# 8-bit WAV files store unsigned samples
+SIGNED_TO_UNSIGNED = bytes((i+128) & 0xFF for i in range(256))
+
+
+class AudioSink:
+    def open(self, sample_rate):
+        """
+        Called once by the sound controller before any samples are written.
+
+        Args:
+            sample_rate (int): The requested sample rate
+
+        Returns
+        -------
+        int:
+            The sample rate, which the samples will be produced at
+        """
+        return sample_rate
+
+    def write(self, buffer, length):
+        """
+        Receives the samples produced since the last call.
+
+        Args:
+            buffer (array): Interleaved stereo samples. Only the first `length` bytes are valid
+            length (int): Number of bytes to read from `buffer`
+        """
+        pass
+
+    def stop(self):
+        pass
+
+
+class NullSink(AudioSink):
+    """Emulates the sound controller, but discards the samples"""
+    pass
+
+
+class SDL2Sink(AudioSink):
+    """Plays the samples on the default audio device"""
+    def __init__(self):
+        self.sdl2 = None
+        self.device = 0
+
+    def open(self, sample_rate):
+        # Imported here, so SDL2 is only loaded, when it is used for sound
+        import sdl2
+        self.sdl2 = sdl2
+
+        sdl2.SDL_InitSubSystem(sdl2.SDL_INIT_AUDIO)
+        spec_want = sdl2.SDL_AudioSpec(sample_rate, sdl2.AUDIO_S8, 2, 64)
+        spec_have = sdl2.SDL_AudioSpec(0, 0, 0, 0)
+        self.device = sdl2.SDL_OpenAudioDevice(None, 0, spec_want, spec_have, 0)
+        if self.device == 0:
+            logger.warning(f"Failed to open the audio device: {sdl2.SDL_GetError().decode()}")
+            return sample_rate
+
+        self.sample_rate = spec_have.freq
+        sdl2.SDL_PauseAudioDevice(self.device, 0)
+        return self.sample_rate
+
+    def write(self, buffer, length):
+        if self.device == 0:
+            return
+
+        # Clear queue, if we are behind
+        queued_time = self.sdl2.SDL_GetQueuedAudioSize(self.device)
+        samples_per_frame = (self.sample_rate / 60) * 2 # Data of 1 frame's worth (60) in stereo (2)
+        if queued_time > samples_per_frame * SOUND_DESYNC_THRESHOLD:
+            self.sdl2.SDL_ClearQueuedAudio(self.device)
+
+        self.sdl2.SDL_QueueAudio(self.device, c_void_p(buffer.buffer_info()[0]), length)
+
+    def stop(self):
+        # PyBoy might be stopped more than once
+        if self.sdl2 is None:
+            return
+        if self.device != 0:
+            self.sdl2.SDL_CloseAudioDevice(self.device)
+            self.device = 0
+        self.sdl2.SDL_QuitSubSystem(self.sdl2.SDL_INIT_AUDIO)
+        self.sdl2 = None
+
+
+class RingBufferSink(AudioSink):
+    """Keeps the latest samples in a NumPy array"""
+    def __init__(self, length=SAMPLE_RATE):
+        """
+        Args:
+            length (int): Number of stereo samples to keep
+        """
+        # Imported here, so NumPy is only loaded, when the samples are kept
+        import numpy as np
+        self.np = np
+
+        self.buffer = np.zeros((length, 2), dtype=np.int8)
+        self.position = 0 # Number of samples written in total
+
+    def write(self, buffer, length):
+        size = len(self.buffer)
+        samples = self.np.frombuffer(buffer, dtype=self.np.int8, count=length).reshape(-1, 2)
+        # Samples, which would be overwritten in the same call, are skipped
+        start = (self.position + max(len(samples) - size, 0)) % size
+        self.position += len(samples)
+        samples = samples[-size:]
+
+        first = min(len(samples), size - start)
+        self.buffer[start:start + first] = samples[:first]
+        self.buffer[:len(samples) - first] = samples[first:]
+
+    def samples(self):
+        """
+        Returns
+        -------
+        numpy.ndarray:
+            The kept samples from oldest to newest, shaped (samples, 2)
+        """
+        size = len(self.buffer)
+        if self.position < size:
+            return self.buffer[:self.position].copy()
+        return self.np.roll(self.buffer, -(self.position % size), axis=0)
+
+
+class WaveFileSink(AudioSink):
+    """Writes the samples to a WAV file"""
+    def __init__(self, filename):
+        """
+        Args:
+            filename (str): Path of the WAV file to write. It's overwritten, if it exists
+        """
+        self.filename = filename
+
+    def open(self, sample_rate):
+        self.file = wave.open(self.filename, "wb")
+        self.file.setnchannels(2)
+        self.file.setsampwidth(1)
+        self.file.setframerate(sample_rate)
+        return sample_rate
+
+    def write(self, buffer, length):
+        self.file.writeframes(memoryview(buffer).cast("B")[:length].tobytes().translate(SIGNED_TO_UNSIGNED))
+
+    def stop(self):
+        self.file.close()
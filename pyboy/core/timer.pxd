@@ -13,7 +13,7 @@ cdef class Timer:
     cdef uint16_t DIV_counter, TIMA_counter
     cdef uint64_t[4] dividers
 
-    @cython.locals(divider=cython.int)
+    @cython.locals(divider=cython.int, DIV_counter=uint64_t, TIMA_counter=uint64_t, overflow=bint)
     cdef bint tick(self, uint64_t)
     @cython.locals(divider=cython.int, cyclesleft=cython.uint)
     cdef uint64_t cyclestointerrupt(self)
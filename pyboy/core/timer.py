@@ -28,31 +28,32 @@ class Timer:
         self.dividers = [1024, 16, 64, 256]
 
     def tick(self, cycles):
-        self.DIV_counter += cycles
-        self.DIV += (self.DIV_counter >> 8) # Add overflown bits to DIV
-        self.DIV_counter &= 0xFF # Remove the overflown bits
+        # The Motherboard only brings the timer up to date when it is accessed or overflows, so 'cycles' can span
+        # many increments of DIV and TIMA
+        DIV_counter = self.DIV_counter + cycles
+        self.DIV += (DIV_counter >> 8) # Add overflown bits to DIV
+        self.DIV_counter = DIV_counter & 0xFF # Remove the overflown bits
         self.DIV &= 0xFF
 
         if self.TAC & 0b100 == 0: # Check if timer is not enabled
             return False
 
-        self.TIMA_counter += cycles
+        TIMA_counter = self.TIMA_counter + cycles
         divider = self.dividers[self.TAC & 0b11]
 
-        if self.TIMA_counter >= divider:
-            self.TIMA_counter -= divider # Keeps possible remainder
-            self.TIMA += 1
+        self.TIMA += TIMA_counter // divider
+        self.TIMA_counter = TIMA_counter % divider # Keeps possible remainder
 
-            if self.TIMA > 0xFF:
-                self.TIMA = self.TMA
-                self.TIMA &= 0xFF
-                return True
-
-        return False
+        overflow = False
+        while self.TIMA > 0xFF:
+            # Reload from TMA, and count on with whatever has passed since the overflow
+            self.TIMA = self.TMA + self.TIMA - 0x100
+            overflow = True
+        return overflow
 
     def cyclestointerrupt(self):
         if self.TAC & 0b100 == 0: # Check if timer is not enabled
-            # Large enough, that 'calculate_cycles' will choose 'x'
+            # Large enough, that the timer never becomes the next event
             return 1 << 16
 
         divider = self.dividers[self.TAC & 0b11]
@@ -8,7 +8,7 @@ from libc.stdint cimport uint8_t, uint32_t
 cimport cython
 from pyboy.botsupport.tilemap cimport TileMap
 from pyboy.core.mb cimport Motherboard
-from pyboy.core.lcd cimport Renderer
+from pyboy.core.renderer cimport Renderer
 from pyboy.utils cimport WindowEvent
 
 cdef int ROWS, COLS
@@ -11,7 +11,6 @@ __pdoc__ = {
     "PyBoyGameWrapper.argv": False,
 }
 
-import io
 import logging
 import random
 from array import array
@@ -109,7 +108,7 @@ class PyBoyGameWrapper(PyBoyPlugin):
         height = self.game_area_section[3] - self.game_area_section[1]
         self._cached_game_area_tiles_raw = array("B", [0xFF] * (width*height*4))
 
-        self.saved_state = io.BytesIO()
+        self.saved_state = None
 
         if cythonmode:
             self._cached_game_area_tiles = memoryview(self._cached_game_area_tiles_raw).cast("I", shape=(width, height))
@@ -157,8 +156,7 @@ class PyBoyGameWrapper(PyBoyPlugin):
         """
 
         if self.game_has_started:
-            self.saved_state.seek(0)
-            self.pyboy.load_state(self.saved_state)
+            self.pyboy.restore(self.saved_state)
             self.post_tick()
         else:
             logger.error("Tried to reset game, but it hasn't been started yet!")
@@ -55,7 +55,7 @@ cdef class BaseDebugWindow(PyBoyWindowPlugin):
     cdef object buf_p
 
     @cython.locals(y=int, x=int)
-    cdef void copy_tile(self, uint32_t[:,:], int, int, int, uint32_t[:,:])
+    cdef void copy_tile(self, uint8_t[:,:], int, int, int, uint32_t[:,:])
 
     @cython.locals(i=int, tw=int, th=int, xx=int, yy=int)
     cdef void mark_tile(self, int, int, uint32_t, int, int, bint)
@@ -234,9 +234,10 @@ class BaseDebugWindow(PyBoyWindowPlugin):
     ##########################
     # Internal functions
     def copy_tile(self, tile_cache0, t, xx, yy, to_buffer):
+        # The tiles are cached as color codes, which are shown with the background palette
         for y in range(8):
             for x in range(8):
-                to_buffer[yy + y][xx + x] = tile_cache0[y + t*8][x]
+                to_buffer[yy + y][xx + x] = self.renderer._bg_rgba[tile_cache0[y + t*8][x]]
 
     def mark_tile(self, x, y, color, height, width, grid):
         tw = width # Tile width
@@ -279,7 +280,7 @@ class TileViewWindow(BaseDebugWindow):
         # Updating screen buffer by copying tiles from cache
         mem_offset = self.tilemap.map_offset - constants.VRAM_OFFSET
         for n in range(mem_offset, mem_offset + 0x400):
-            tile_index = self.mb.lcd.VRAM[n]
+            tile_index = self.mb.lcd.VRAM0[n]
 
             # Check the tile source and add offset
             # http://problemkaputt.de/pandocs.htm#lcdcontrolregister
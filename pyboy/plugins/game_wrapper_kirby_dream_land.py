@@ -102,8 +102,7 @@ class GameWrapperKirbyDreamLand(PyBoyGameWrapper):
 
         self.game_has_started = True
 
-        self.saved_state.seek(0)
-        self.pyboy.save_state(self.saved_state)
+        self.saved_state = self.pyboy.snapshot()
 
     def reset_game(self, timer_div=None):
         """
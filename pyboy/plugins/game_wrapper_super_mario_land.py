@@ -252,15 +252,14 @@ class GameWrapperSuperMarioLand(PyBoyGameWrapper):
                 self.game_has_started = True
                 break
 
-        self.saved_state.seek(0)
-        self.pyboy.save_state(self.saved_state)
+        self.saved_state = self.pyboy.snapshot()
 
     def reset_game(self, timer_div=None):
         """
         After calling `start_game`, use this method to reset Mario to the beginning of world 1-1.
 
         If you want to reset to later parts of the game -- for example world 1-2 or 3-1 -- use the methods
-        `pyboy.PyBoy.save_state` and `pyboy.PyBoy.load_state`.
+        `pyboy.PyBoy.save_state` and `pyboy.PyBoy.load_state`, or `pyboy.PyBoy.snapshot` and `pyboy.PyBoy.restore`.
 
         Kwargs:
             timer_div (int): Replace timer's DIV register with this value. Use `None` to randomize.
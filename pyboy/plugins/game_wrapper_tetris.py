@@ -135,8 +135,7 @@ class GameWrapperTetris(PyBoyGameWrapper):
         for i in range(3):
             if i == 2:
                 PyBoyGameWrapper._set_timer_div(self, timer_div)
-                self.saved_state.seek(0)
-                self.pyboy.save_state(self.saved_state)
+                self.saved_state = self.pyboy.snapshot()
             self.pyboy.send_input(WindowEvent.PRESS_BUTTON_START)
             self.pyboy.tick()
             self.pyboy.send_input(WindowEvent.RELEASE_BUTTON_START)
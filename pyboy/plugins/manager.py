@@ -3,39 +3,36 @@
 # GitHub: https://github.com/Baekalfen/PyBoy
 #
 
-# imports
-from pyboy.plugins.window_sdl2 import WindowSDL2 # isort:skip
-from pyboy.plugins.window_open_gl import WindowOpenGL # isort:skip
-from pyboy.plugins.window_headless import WindowHeadless # isort:skip
-from pyboy.plugins.window_dummy import WindowDummy # isort:skip
-from pyboy.plugins.debug import Debug # isort:skip
-from pyboy.plugins.disable_input import DisableInput # isort:skip
-from pyboy.plugins.auto_pause import AutoPause # isort:skip
-from pyboy.plugins.record_replay import RecordReplay # isort:skip
-from pyboy.plugins.rewind import Rewind # isort:skip
-from pyboy.plugins.screen_recorder import ScreenRecorder # isort:skip
-from pyboy.plugins.screenshot_recorder import ScreenshotRecorder # isort:skip
-from pyboy.plugins.game_wrapper_super_mario_land import GameWrapperSuperMarioLand # isort:skip
-from pyboy.plugins.game_wrapper_tetris import GameWrapperTetris # isort:skip
-from pyboy.plugins.game_wrapper_kirby_dream_land import GameWrapperKirbyDreamLand # isort:skip
-# imports end
-
 
 def parser_arguments():
     # yield_plugins
+    from pyboy.plugins.window_sdl2 import WindowSDL2 # isort:skip
     yield WindowSDL2.argv
+    from pyboy.plugins.window_open_gl import WindowOpenGL # isort:skip
     yield WindowOpenGL.argv
+    from pyboy.plugins.window_headless import WindowHeadless # isort:skip
     yield WindowHeadless.argv
+    from pyboy.plugins.window_dummy import WindowDummy # isort:skip
     yield WindowDummy.argv
+    from pyboy.plugins.debug import Debug # isort:skip
     yield Debug.argv
+    from pyboy.plugins.disable_input import DisableInput # isort:skip
     yield DisableInput.argv
+    from pyboy.plugins.auto_pause import AutoPause # isort:skip
     yield AutoPause.argv
+    from pyboy.plugins.record_replay import RecordReplay # isort:skip
     yield RecordReplay.argv
+    from pyboy.plugins.rewind import Rewind # isort:skip
     yield Rewind.argv
+    from pyboy.plugins.screen_recorder import ScreenRecorder # isort:skip
     yield ScreenRecorder.argv
+    from pyboy.plugins.screenshot_recorder import ScreenshotRecorder # isort:skip
     yield ScreenshotRecorder.argv
+    from pyboy.plugins.game_wrapper_super_mario_land import GameWrapperSuperMarioLand # isort:skip
     yield GameWrapperSuperMarioLand.argv
+    from pyboy.plugins.game_wrapper_tetris import GameWrapperTetris # isort:skip
     yield GameWrapperTetris.argv
+    from pyboy.plugins.game_wrapper_kirby_dream_land import GameWrapperKirbyDreamLand # isort:skip
     yield GameWrapperKirbyDreamLand.argv
     # yield_plugins end
     pass
@@ -45,35 +42,86 @@ class PluginManager:
     def __init__(self, pyboy, mb, pyboy_argv):
         self.pyboy = pyboy
 
+        # A plugin's module is only imported, if it can be enabled. See 'enabled_when' in manager_gen.py
         # plugins_enabled
-        self.window_sdl2 = WindowSDL2(pyboy, mb, pyboy_argv)
-        self.window_sdl2_enabled = self.window_sdl2.enabled()
-        self.window_open_gl = WindowOpenGL(pyboy, mb, pyboy_argv)
-        self.window_open_gl_enabled = self.window_open_gl.enabled()
-        self.window_headless = WindowHeadless(pyboy, mb, pyboy_argv)
-        self.window_headless_enabled = self.window_headless.enabled()
-        self.window_dummy = WindowDummy(pyboy, mb, pyboy_argv)
-        self.window_dummy_enabled = self.window_dummy.enabled()
-        self.debug = Debug(pyboy, mb, pyboy_argv)
-        self.debug_enabled = self.debug.enabled()
-        self.disable_input = DisableInput(pyboy, mb, pyboy_argv)
-        self.disable_input_enabled = self.disable_input.enabled()
-        self.auto_pause = AutoPause(pyboy, mb, pyboy_argv)
-        self.auto_pause_enabled = self.auto_pause.enabled()
-        self.record_replay = RecordReplay(pyboy, mb, pyboy_argv)
-        self.record_replay_enabled = self.record_replay.enabled()
-        self.rewind = Rewind(pyboy, mb, pyboy_argv)
-        self.rewind_enabled = self.rewind.enabled()
+        self.window_sdl2 = None
+        self.window_sdl2_enabled = False
+        if pyboy_argv.get("window_type") in ("SDL2", None):
+            from pyboy.plugins.window_sdl2 import WindowSDL2 # isort:skip
+            self.window_sdl2 = WindowSDL2(pyboy, mb, pyboy_argv)
+            self.window_sdl2_enabled = self.window_sdl2.enabled()
+        self.window_open_gl = None
+        self.window_open_gl_enabled = False
+        if pyboy_argv.get("window_type") == "OpenGL":
+            from pyboy.plugins.window_open_gl import WindowOpenGL # isort:skip
+            self.window_open_gl = WindowOpenGL(pyboy, mb, pyboy_argv)
+            self.window_open_gl_enabled = self.window_open_gl.enabled()
+        self.window_headless = None
+        self.window_headless_enabled = False
+        if pyboy_argv.get("window_type") == "headless":
+            from pyboy.plugins.window_headless import WindowHeadless # isort:skip
+            self.window_headless = WindowHeadless(pyboy, mb, pyboy_argv)
+            self.window_headless_enabled = self.window_headless.enabled()
+        self.window_dummy = None
+        self.window_dummy_enabled = False
+        if pyboy_argv.get("window_type") == "dummy":
+            from pyboy.plugins.window_dummy import WindowDummy # isort:skip
+            self.window_dummy = WindowDummy(pyboy, mb, pyboy_argv)
+            self.window_dummy_enabled = self.window_dummy.enabled()
+        self.debug = None
+        self.debug_enabled = False
+        if pyboy_argv.get("debug"):
+            from pyboy.plugins.debug import Debug # isort:skip
+            self.debug = Debug(pyboy, mb, pyboy_argv)
+            self.debug_enabled = self.debug.enabled()
+        self.disable_input = None
+        self.disable_input_enabled = False
+        if pyboy_argv.get("no_input"):
+            from pyboy.plugins.disable_input import DisableInput # isort:skip
+            self.disable_input = DisableInput(pyboy, mb, pyboy_argv)
+            self.disable_input_enabled = self.disable_input.enabled()
+        self.auto_pause = None
+        self.auto_pause_enabled = False
+        if pyboy_argv.get("autopause"):
+            from pyboy.plugins.auto_pause import AutoPause # isort:skip
+            self.auto_pause = AutoPause(pyboy, mb, pyboy_argv)
+            self.auto_pause_enabled = self.auto_pause.enabled()
+        self.record_replay = None
+        self.record_replay_enabled = False
+        if pyboy_argv.get("record_input"):
+            from pyboy.plugins.record_replay import RecordReplay # isort:skip
+            self.record_replay = RecordReplay(pyboy, mb, pyboy_argv)
+            self.record_replay_enabled = self.record_replay.enabled()
+        self.rewind = None
+        self.rewind_enabled = False
+        if pyboy_argv.get("rewind"):
+            from pyboy.plugins.rewind import Rewind # isort:skip
+            self.rewind = Rewind(pyboy, mb, pyboy_argv)
+            self.rewind_enabled = self.rewind.enabled()
+        from pyboy.plugins.screen_recorder import ScreenRecorder # isort:skip
         self.screen_recorder = ScreenRecorder(pyboy, mb, pyboy_argv)
         self.screen_recorder_enabled = self.screen_recorder.enabled()
+        from pyboy.plugins.screenshot_recorder import ScreenshotRecorder # isort:skip
         self.screenshot_recorder = ScreenshotRecorder(pyboy, mb, pyboy_argv)
         self.screenshot_recorder_enabled = self.screenshot_recorder.enabled()
-        self.game_wrapper_super_mario_land = GameWrapperSuperMarioLand(pyboy, mb, pyboy_argv)
-        self.game_wrapper_super_mario_land_enabled = self.game_wrapper_super_mario_land.enabled()
-        self.game_wrapper_tetris = GameWrapperTetris(pyboy, mb, pyboy_argv)
-        self.game_wrapper_tetris_enabled = self.game_wrapper_tetris.enabled()
-        self.game_wrapper_kirby_dream_land = GameWrapperKirbyDreamLand(pyboy, mb, pyboy_argv)
-        self.game_wrapper_kirby_dream_land_enabled = self.game_wrapper_kirby_dream_land.enabled()
+        self.game_wrapper_super_mario_land = None
+        self.game_wrapper_super_mario_land_enabled = False
+        if pyboy_argv.get("game_wrapper"):
+            from pyboy.plugins.game_wrapper_super_mario_land import GameWrapperSuperMarioLand # isort:skip
+            self.game_wrapper_super_mario_land = GameWrapperSuperMarioLand(pyboy, mb, pyboy_argv)
+            self.game_wrapper_super_mario_land_enabled = self.game_wrapper_super_mario_land.enabled()
+        self.game_wrapper_tetris = None
+        self.game_wrapper_tetris_enabled = False
+        if pyboy_argv.get("game_wrapper"):
+            from pyboy.plugins.game_wrapper_tetris import GameWrapperTetris # isort:skip
+            self.game_wrapper_tetris = GameWrapperTetris(pyboy, mb, pyboy_argv)
+            self.game_wrapper_tetris_enabled = self.game_wrapper_tetris.enabled()
+        self.game_wrapper_kirby_dream_land = None
+        self.game_wrapper_kirby_dream_land_enabled = False
+        if pyboy_argv.get("game_wrapper"):
+            from pyboy.plugins.game_wrapper_kirby_dream_land import GameWrapperKirbyDreamLand # isort:skip
+            self.game_wrapper_kirby_dream_land = GameWrapperKirbyDreamLand(pyboy, mb, pyboy_argv)
+            self.game_wrapper_kirby_dream_land_enabled = self.game_wrapper_kirby_dream_land.enabled()
         # plugins_enabled end
 
     def gamewrapper(self):
@@ -13,6 +13,33 @@ plugins = [
 ] + game_wrappers
 all_plugins = windows + plugins
 
+# When a plugin can be enabled, given the arguments to PyBoy. This is checked before the plugin's module is imported,
+# so the heavy dependencies (SDL2, OpenGL) are only loaded, when they are used. The plugin's own 'enabled' still decides
+# in the end, e.g. when a dependency is missing.
+enabled_when = {
+    "WindowSDL2": 'pyboy_argv.get("window_type") in ("SDL2", None)',
+    "WindowOpenGL": 'pyboy_argv.get("window_type") == "OpenGL"',
+    "WindowHeadless": 'pyboy_argv.get("window_type") == "headless"',
+    "WindowDummy": 'pyboy_argv.get("window_type") == "dummy"',
+    "Debug": 'pyboy_argv.get("debug")',
+    "DisableInput": 'pyboy_argv.get("no_input")',
+    "AutoPause": 'pyboy_argv.get("autopause")',
+    "RecordReplay": 'pyboy_argv.get("record_input")',
+    "Rewind": 'pyboy_argv.get("rewind")',
+    # The screen recorders are left out, as they can be triggered from the API at any time
+}
+for p in game_wrappers:
+    enabled_when[p] = 'pyboy_argv.get("game_wrapper")'
+
+# The type each plugin is kept as in the manager. Declaring the plugin's own type would import its module.
+base_classes = {}
+for p in windows:
+    base_classes[p] = "PyBoyWindowPlugin"
+for p in plugins:
+    base_classes[p] = "PyBoyPlugin"
+for p in game_wrappers:
+    base_classes[p] = "PyBoyGameWrapper"
+
 
 def to_snake_case(s):
     s1 = re.sub("(.)([A-Z][a-z]+)", r"\1_\2", s)
@@ -63,8 +90,16 @@ if __name__ == "__main__":
 
                 for p in all_plugins:
                     p_name = to_snake_case(p)
-                    lines.append(f"self.{p_name} = {p}(pyboy, mb, pyboy_argv)\n")
-                    lines.append(f"self.{p_name}_enabled = self.{p_name}.enabled()\n")
+                    if p in enabled_when:
+                        lines.append(f"self.{p_name} = None\n")
+                        lines.append(f"self.{p_name}_enabled = False\n")
+                        lines.append(f"if {enabled_when[p]}:\n")
+                        indent = "    "
+                    else:
+                        indent = ""
+                    lines.append(f"{indent}from pyboy.plugins.{p_name} import {p} # isort:skip\n")
+                    lines.append(f"{indent}self.{p_name} = {p}(pyboy, mb, pyboy_argv)\n")
+                    lines.append(f"{indent}self.{p_name}_enabled = self.{p_name}.enabled()\n")
 
                 lines.append("# plugins_enabled end\n")
                 out_lines.extend([indentation + l for l in lines])
@@ -77,23 +112,11 @@ if __name__ == "__main__":
 
                 for p in all_plugins:
                     p_name = to_snake_case(p)
+                    lines.append(f"from pyboy.plugins.{p_name} import {p} # isort:skip\n")
                     lines.append(f"yield {p}.argv\n")
 
                 lines.append("# yield_plugins end\n")
                 out_lines.extend([indentation + l for l in lines])
-            elif line.strip().startswith("# imports"):
-
-                lines = [line.strip() + "\n"]
-                indentation = " " * line.index("# imports")
-
-                skip_lines(line_iter, "# imports end")
-
-                for p in all_plugins:
-                    p_name = to_snake_case(p)
-                    lines.append(f"from pyboy.plugins.{p_name} import {p} # isort:skip\n")
-
-                lines.append("# imports end\n")
-                out_lines.extend([indentation + l for l in lines])
             elif line.strip().startswith("# gamewrapper"):
 
                 lines = [line.strip() + "\n"]
@@ -131,7 +154,7 @@ if __name__ == "__main__":
 
                 for p in all_plugins:
                     p_name = to_snake_case(p)
-                    lines.append(f"cdef public {p} {p_name}\n")
+                    lines.append(f"cdef public {base_classes[p]} {p_name}\n")
 
                 for p in all_plugins:
                     p_name = to_snake_case(p)
@@ -139,19 +162,6 @@ if __name__ == "__main__":
 
                 lines.append("# plugin_cdef end\n")
                 out_lines.extend([indentation + l for l in lines])
-            elif line.strip().startswith("# imports"):
-
-                lines = [line.strip() + "\n"]
-                indentation = " " * line.index("# imports")
-
-                skip_lines(line_iter, "# imports end")
-
-                for p in all_plugins:
-                    p_name = to_snake_case(p)
-                    lines.append(f"from pyboy.plugins.{p_name} cimport {p}\n")
-
-                lines.append("# imports end\n")
-                out_lines.extend([indentation + l for l in lines])
             else:
                 out_lines.append(line)
 
@@ -6,13 +6,14 @@
 
 from libc cimport time
 cimport cython
-from libc.stdint cimport uint64_t
+from libc.stdint cimport int64_t, uint64_t
 from pyboy.core.mb cimport Motherboard
 from pyboy.utils cimport IntIOWrapper, IntIOInterface
 from pyboy.plugins.manager cimport PluginManager
 
 
 cdef float SPF
+cdef int64_t BOOT_TIMEOUT
 
 cdef class PyBoy:
     cdef Motherboard mb
@@ -40,7 +41,8 @@ cdef class PyBoy:
     cdef list external_input
 
     @cython.locals(done=cython.bint, event=int, t_start=float, t_cpu=float, t_emu=float, secs=float)
-    cpdef bint tick(self)
+    cpdef bint tick(self, int frames=*, bint render_last_only=*)
     cpdef void stop(self, save=*)
+    cdef void _boot(self, str)
 
 
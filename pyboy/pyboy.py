@@ -6,13 +6,14 @@
 The core module of the emulator
 """
 
+import hashlib
 import os
 import time
 
 from pyboy.openai_gym import PyBoyGymEnv
 from pyboy.openai_gym import enabled as gym_enabled
 from pyboy.plugins.manager import PluginManager
-from pyboy.utils import IntIOWrapper, WindowEvent
+from pyboy.utils import STATE_VERSION, IntIOWrapper, WindowEvent
 
 from . import botsupport
 from .core.mb import Motherboard
@@ -20,6 +21,8 @@ from pyboy.logger import logger
 
 
 SPF = 1 / 60. # inverse FPS (frame-per-second)
+# Give up on a boot ROM, which hasn't handed over to the cartridge after 10 seconds
+BOOT_TIMEOUT = 600 * 70224
 
 defaults = {
     "color_palette": (0xFFFFFF, 0x999999, 0x555555, 0x000000),
@@ -30,7 +33,16 @@ defaults = {
 
 class PyBoy:
     def __init__(
-        self, gamerom_file, *, bootrom_file=None, profiling=False, disable_renderer=False, sound=False, dmg=False, **kwargs
+        self,
+        gamerom_file,
+        *,
+        bootrom_file=None,
+        profiling=False,
+        disable_renderer=False,
+        sound=False,
+        dmg=False,
+        boot_cache=None,
+        **kwargs
     ):
         """
         PyBoy is loadable as an object in Python. This means, it can be initialized from another script, and be
@@ -53,7 +65,12 @@ class PyBoy:
             bootrom_file (str): Filepath to a boot-ROM to use. If unsure, specify `None`.
             profiling (bool): Profile the emulator and report opcode usage (internal use).
             disable_renderer (bool): Can be used to optimize performance, by internally disable rendering of the screen.
+            sound (bool or AudioSink): Play the sound through SDL2, if `True`. A sink from `pyboy.core.sound_sink` can
+                be given instead, to keep the samples in a NumPy array, write them to a WAV file or discard them.
             color_palette (tuple): Specify the color palette to use for rendering.
+            boot_cache (str): Directory to keep the state after the boot ROM in. The boot ROM is only emulated the
+                first time a combination of game-ROM, boot-ROM and Game Boy model is started. Later starts load the
+                cached state after the boot ROM.
         """
 
         for k, v in defaults.items():
@@ -64,6 +81,13 @@ class PyBoy:
             raise FileNotFoundError(f"ROM file {gamerom_file} was not found!")
         self.gamerom_file = gamerom_file
 
+        if sound is True:
+            # Only imported, when sound is played, to keep the start of headless instances fast
+            from .core.sound_sink import SDL2Sink
+            sound = SDL2Sink()
+        elif sound is False:
+            sound = None
+
         self.mb = Motherboard(
             gamerom_file,
             bootrom_file,
@@ -73,6 +97,8 @@ class PyBoy:
             dmg,
             profiling=profiling,
         )
+        if boot_cache is not None:
+            self._boot(boot_cache)
 
         # Performance measures
         self.avg_pre = 0
@@ -94,38 +120,121 @@ class PyBoy:
 
         self.plugin_manager = PluginManager(self, self.mb, kwargs)
 
-    def tick(self):
+    def _boot(self, boot_cache):
+        # Runs the boot ROM until it hands over to the cartridge by writing to 0xFF50. The state at that point is only
+        # the same for the same ROMs and model, so they make up the name of the cached state.
+        key = hashlib.sha256()
+        with open(self.gamerom_file, "rb") as f:
+            key.update(f.read())
+        key.update(bytes(self.mb.bootrom.bootrom))
+        key.update(bytes([self.mb.is_cgb, STATE_VERSION]))
+        state_path = os.path.join(boot_cache, key.hexdigest() + ".state")
+
+        if os.path.isfile(state_path):
+            with open(state_path, "rb") as f:
+                self.mb.load_boot_state(IntIOWrapper(f))
+            return
+
+        while self.mb.bootrom_enabled:
+            if self.mb.run_until(-1, -1, 0xFF50, -1, BOOT_TIMEOUT, -1, False, False) == "cycles":
+                logger.warning("The boot ROM didn't hand over to the cartridge. The boot state isn't cached.")
+                return
+
+        os.makedirs(boot_cache, exist_ok=True)
+        # Written to a temporary file first, as other instances might be starting at the same time
+        tmp_path = f"{state_path}.{os.getpid()}"
+        with open(tmp_path, "wb") as f:
+            self.mb.save_boot_state(IntIOWrapper(f))
+        os.replace(tmp_path, state_path)
+
+    def tick(self, frames=1, render_last_only=True):
         """
-        Progresses the emulator ahead by one frame.
+        Progresses the emulator ahead by one frame, or by the given number of frames.
 
         To run the emulator in real-time, this will need to be called 60 times a second (for example in a while-loop).
         This function will block for roughly 16,67ms at a time, to not run faster than real-time, unless you specify
         otherwise with the `PyBoy.set_emulation_speed` method.
 
+        When progressing several frames, the events sent with `PyBoy.send_input` are handled before the first frame,
+        and the plugins and windows are only updated after the last frame. This is a lot faster than calling this
+        function for each frame, when fast-forwarding between the decisions of a bot.
+
         _Open an issue on GitHub if you need finer control, and we will take a look at it._
+
+        Args:
+            frames (int): Number of frames to progress.
+            render_last_only (bool): Only render the last of the frames, as the screen is only shown or read after it.
         """
+        if frames < 1:
+            raise ValueError("At least one frame has to be progressed")
 
         t_start = time.perf_counter() # Change to _ns when PyPy supports it
         self._handle_events(self.events)
         t_pre = time.perf_counter()
-        self.frame_count += 1
+        self.frame_count += frames
         if not self.paused:
-            self.mb.tickframe()
+            self.mb.tickframes(frames, render_last_only)
         t_tick = time.perf_counter()
-        self._post_tick()
+        self._post_tick(frames)
         t_post = time.perf_counter()
 
-        secs = t_pre - t_start
+        # The averages are per frame
+        secs = (t_pre-t_start) / frames
         self.avg_pre = 0.9 * self.avg_pre + 0.1*secs
 
-        secs = t_tick - t_pre
+        secs = (t_tick-t_pre) / frames
         self.avg_tick = 0.9 * self.avg_tick + 0.1*secs
 
-        secs = t_post - t_tick
+        secs = (t_post-t_tick) / frames
         self.avg_post = 0.9 * self.avg_post + 0.1*secs
 
         return self.done
 
+    def run_until(
+        self, *, pc=None, bank=None, address=None, value=None, cycles=None, scanline=None, vblank=False, serial=False
+    ):
+        """
+        Runs the emulator until one of the given conditions is met. The conditions are checked inside the emulation
+        loop, which is a lot faster than checking them from Python after each call to `PyBoy.tick`.
+
+        The emulator might stop in the middle of a frame, which is then finished by the next call to `PyBoy.tick` or
+        `PyBoy.run_until`. Events, plugins and windows are not handled, and `PyBoy.frame_count` isn't counted up.
+
+            # Run until the game reaches its main loop at 0x0150 in ROM bank 0, or give up after 60 frames
+            condition, cycles = pyboy.run_until(pc=0x0150, bank=0, cycles=60 * 70224)
+
+        Args:
+            pc (int): Stop when the program counter reaches this address.
+            bank (int): Only stop at `pc`, when this ROM bank is mapped at the address.
+            address (int): Stop when the memory value at this address changes.
+            value (int): Only stop at `address`, when the memory value changes to this value.
+            cycles (int): Stop when this number of cycles has passed.
+            scanline (int): Stop when the LY register reaches this scanline.
+            vblank (bool): Stop when the LCD enters V-blank.
+            serial (bool): Stop when a byte is written to the serial port.
+
+        Returns
+        -------
+        tuple:
+            The name of the argument, which stopped the emulator ("pc", "address", "cycles", "scanline", "vblank" or
+            "serial"), and the number of cycles run.
+        """
+        if pc is None and address is None and cycles is None and scanline is None and not vblank and not serial:
+            raise ValueError("At least one condition is needed")
+
+        cycles_start = self.mb.cycles
+        condition = self.mb.run_until(
+            -1 if pc is None else pc,
+            -1 if bank is None else bank,
+            -1 if address is None else address,
+            -1 if value is None else value,
+            -1 if cycles is None else cycles,
+            -1 if scanline is None else scanline,
+            vblank,
+            serial,
+        )
+        return condition, self.mb.cycles - cycles_start
+
     def _handle_events(self, events):
         # This feeds events into the tick-loop from the window. There might already be events in the list from the API.
         events = self.plugin_manager.handle_events(events)
@@ -179,11 +288,14 @@ class PyBoy:
         logger.info("Emulation unpaused!")
         self._update_window_title()
 
-    def _post_tick(self):
-        if self.frame_count % 60 == 0:
+    def _post_tick(self, frames):
+        if self.frame_count % 60 < frames:
             self._update_window_title()
         self.plugin_manager.post_tick()
-        self.plugin_manager.frame_limiter(self.target_emulationspeed)
+        if self.target_emulationspeed > 0:
+            # Wait for as long as the frames would have taken
+            for _ in range(frames):
+                self.plugin_manager.frame_limiter(self.target_emulationspeed)
 
         # Prepare an empty list, as the API might be used to send in events between ticks
         self.old_events = self.events
@@ -319,6 +431,8 @@ class PyBoy:
         __NOTE__: Any changes here are not saved or loaded to game states! Use this function with caution and reapply
         any overrides when reloading the ROM.
 
+        The ROM file itself is never changed, and other instances running the same ROM don't see the override.
+
         If you need to change a RAM address, see `pyboy.PyBoy.set_memory_value`.
 
         Args:
@@ -329,6 +443,7 @@ class PyBoy:
         # TODO: If you change a RAM value outside of the ROM banks above, the memory value will stay the same no matter
         # what the game writes to the address. This can be used so freeze the value for health, cash etc.
         self.mb.cartridge.overrideitem(rom_bank, addr, value)
+        self.mb.mem_manager.invalidate_rom(rom_bank, addr)
 
     def send_input(self, event):
         """
@@ -412,6 +527,33 @@ class PyBoy:
 
         self.mb.load_state(IntIOWrapper(file_like_object))
 
+    def snapshot(self):
+        """
+        Takes a snapshot of the complete state of the emulator in memory. It's a lot faster than `PyBoy.save_state`, as
+        nothing is serialized, but it can't be stored in a file. Use it to return to the same point of a game many
+        times.
+
+            snapshot = pyboy.snapshot()
+            ...
+            pyboy.restore(snapshot)
+
+        Returns
+        -------
+        object:
+            Opaque object to pass to `PyBoy.restore`
+        """
+        return self.mb.snapshot()
+
+    def restore(self, snapshot):
+        """
+        Restores the emulator to a snapshot taken with `PyBoy.snapshot`. The same snapshot can be restored any number
+        of times.
+
+        Args:
+            snapshot (object): A snapshot returned by `PyBoy.snapshot` on this instance of PyBoy
+        """
+        self.mb.restore(snapshot)
+
     def _serial(self):
         """
         Provides all data that has been sent over the serial port since last call to this function.
@@ -439,6 +581,25 @@ class PyBoy:
             logger.warning("The emulation speed might not be accurate when speed-target is higher than 5")
         self.target_emulationspeed = target_speed
 
+    def set_frameskip(self, frameskip, lazy=False):
+        """
+        Skip rendering of frames, when the screen doesn't have to be shown or read for every frame. The emulation
+        itself is unaffected, and windows keep showing the last rendered frame.
+
+        A skipped frame is rendered anyway, if the screen is read through `pyboy.botsupport.screen.Screen`, which is
+        also used for the observations of `pyboy.openai_gym.PyBoyGymEnv`. The tiles and sprites are then read as they
+        are at the time, which includes any changes made by the game after the frame was shown.
+
+        Args:
+            frameskip (int): Number of frames to skip after each rendered frame. `0` renders every frame.
+            lazy (bool): Only render frames, when the screen is read. `frameskip` has no effect.
+        """
+        if frameskip < 0:
+            raise ValueError("The frameskip cannot be negative")
+        self.mb.frameskip = frameskip
+        self.mb.lazy_rendering = lazy
+        self.mb.skipped_frames = 0
+
     def cartridge_title(self):
         """
         Get the title stored on the currently loaded cartridge ROM. The title is all upper-case ASCII and may
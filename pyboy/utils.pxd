@@ -5,22 +5,41 @@
 
 cimport cython
 
-from libc.stdint cimport uint8_t, int64_t
+from libc.stdint cimport uint8_t, int64_t, uint64_t
+
+cdef int64_t SNAPSHOT_PAGE_SIZE
 
 ##############################################################
 # Buffer classes
 
 cdef class IntIOInterface:
     cdef int64_t write(self, uint8_t)
+    @cython.locals(n=int64_t)
+    cdef void write_buffer(self, uint8_t[:])
     cdef uint8_t read(self)
+    @cython.locals(n=int64_t)
+    cdef void read_buffer(self, uint8_t[:])
     cdef void seek(self, int64_t)
     cdef void flush(self)
     cdef int read_16bit(self)
+    @cython.locals(n=int)
+    cdef void write_64bit(self, uint64_t)
+    @cython.locals(value=uint64_t)
+    cdef uint64_t read_64bit(self)
 
 
 cdef class IntIOWrapper(IntIOInterface):
     cdef object buffer
 
+
+cdef class Snapshot(IntIOInterface):
+    cdef bytearray data
+    cdef readonly list buffers
+    cdef Snapshot parent
+    cdef int64_t pos, buffer_pos
+    @cython.locals(data=bytes, size=int64_t, parent_pages=list, last=int64_t, pages=list, n=int64_t)
+    cdef void write_buffer(self, uint8_t[:])
+
 ##############################################################
 # Misc
 
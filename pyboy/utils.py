@@ -3,7 +3,11 @@
 # GitHub: https://github.com/Baekalfen/PyBoy
 #
 
-STATE_VERSION = 5
+from array import array
+
+STATE_VERSION = 6
+# Snapshots share unchanged memory in pages of this size
+SNAPSHOT_PAGE_SIZE = 0x100
 
 ##############################################################
 # Buffer classes
@@ -25,6 +29,25 @@ class IntIOInterface:
         b = self.read()
         return int(a | (b << 8))
 
+    def write_64bit(self, value):
+        for n in range(56, -8, -8):
+            self.write((value >> n) & 0xFF)
+
+    def read_64bit(self):
+        value = 0
+        for _ in range(8):
+            value = (value << 8) | self.read()
+        return value
+
+    def write_buffer(self, buf):
+        # Override with a single write, if the underlying buffer allows it
+        for n in range(len(buf)):
+            self.write(buf[n])
+
+    def read_buffer(self, buf):
+        for n in range(len(buf)):
+            buf[n] = self.read()
+
     def read(self):
         raise Exception("Not implemented!")
 
@@ -63,6 +86,14 @@ class IntIOWrapper(IntIOInterface):
         assert len(data) == 1, "No data"
         return ord(data)
 
+    def write_buffer(self, buf):
+        # The whole buffer is written at once, but with the same layout as writing each byte
+        self.buffer.write(buf)
+
+    def read_buffer(self, buf):
+        count = self.buffer.readinto(buf)
+        assert count == len(buf), "No data"
+
     def seek(self, pos):
         self.buffer.seek(pos)
 
@@ -70,14 +101,74 @@ class IntIOWrapper(IntIOInterface):
         self.buffer.flush()
 
 
+class Snapshot(IntIOInterface):
+    """
+    Keeps a state of the emulator in memory. Single bytes are collected in a bytearray, while buffers are kept as lists
+    of pages, which are copied straight back when restoring.
+
+    Pages are immutable, so a page, that is the same as in the parent snapshot, is shared instead of copied. Snapshots
+    branching off the same snapshot only keep the pages they changed.
+    """
+    def __init__(self, parent=None):
+        self.data = bytearray()
+        self.buffers = []
+        self.parent = parent
+        self.pos = 0
+        self.buffer_pos = 0
+
+    def write(self, byte):
+        self.data.append(byte)
+        return 1
+
+    def write_buffer(self, buf):
+        data = bytes(buf)
+        size = len(data)
+        parent_pages = None
+        if self.parent is not None and len(self.buffers) < len(self.parent.buffers):
+            parent_pages = self.parent.buffers[len(self.buffers)]
+            # Only a buffer of the same size can share pages
+            last = len(parent_pages) - 1
+            if last < 0 or last * SNAPSHOT_PAGE_SIZE + len(parent_pages[last]) != size:
+                parent_pages = None
+
+        pages = []
+        for n in range(0, size, SNAPSHOT_PAGE_SIZE):
+            # Comparing in place is a lot cheaper than slicing out a page, which is just thrown away again
+            if parent_pages is not None and data.startswith(parent_pages[len(pages)], n):
+                pages.append(parent_pages[len(pages)])
+            else:
+                pages.append(data[n:n + SNAPSHOT_PAGE_SIZE])
+        self.buffers.append(pages)
+
+    def read(self):
+        byte = self.data[self.pos]
+        self.pos += 1
+        return byte
+
+    def read_buffer(self, buf):
+        memoryview(buf)[:] = b"".join(self.buffers[self.buffer_pos])
+        self.buffer_pos += 1
+
+    def seek(self, pos):
+        assert pos == 0, "A snapshot can only be read from the beginning"
+        self.pos = 0
+        self.buffer_pos = 0
+
+    def flush(self):
+        pass
+
+
 ##############################################################
 # Misc
 
 
-# TODO: Would a lookup-table increase performance? For example a lookup table of each 4-bit nibble?
-# That's 16**2 = 256 values. Index calculated as: (byte1 & 0xF0) | ((byte2 & 0xF0) >> 4)
-# and then: (byte1 & 0x0F) | ((byte2 & 0x0F) >> 4)
-# Then could even be preloaded for each color palette
+# Each of the 2 bytes of a tile row holds 1 bit of the color code for all 8 pixels. Instead of shifting out the bits
+# for every pixel, they are looked up for each byte. The color code of pixel x is:
+# COLOR_CODE_LOW[byte1*8 + x] | COLOR_CODE_HIGH[byte2*8 + x]
+COLOR_CODE_LOW = array("B", [(byte >> (7-x)) & 1 for byte in range(256) for x in range(8)])
+COLOR_CODE_HIGH = array("B", [((byte >> (7-x)) & 1) << 1 for byte in range(256) for x in range(8)])
+
+
 def color_code(byte1, byte2, offset):
     """Convert 2 bytes into color code at a given offset.
 
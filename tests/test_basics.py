@@ -4,12 +4,16 @@
 #
 import base64
 import hashlib
+import io
 import os
+import subprocess
+import sys
 
 import pytest
 from pyboy import PyBoy, WindowEvent
 from pyboy import __main__ as main
 from pyboy.botsupport.tile import Tile
+from pyboy.utils import COLOR_CODE_HIGH, COLOR_CODE_LOW, color_code
 from tests.utils import boot_rom, default_rom, kirby_rom
 
 
@@ -82,6 +86,7 @@ def test_argv_parser(*args):
     for k, v in {
         "ROM": file_that_exists,
         "autopause": False,
+        "boot_cache": None,
         "bootrom": None,
         "debug": False,
         "loadstate": None,
@@ -117,6 +122,20 @@ def test_argv_parser(*args):
         assert flags[k] == v
 
 
+def test_lazy_plugins():
+    # Only the plugins, which can be enabled, are imported. A new interpreter is needed, as other tests import them.
+    code = (
+        "import sys; from pyboy import PyBoy; "
+        f"pyboy = PyBoy({default_rom!r}, window_type='headless'); "
+        "print(' '.join(m for m in sys.modules if m.startswith('pyboy.plugins.')))"
+    )
+    out = subprocess.run([sys.executable, "-c", code], capture_output=True, text=True, check=True).stdout
+    modules = out.splitlines()[-1].split()
+    assert "pyboy.plugins.window_headless" in modules
+    for plugin in ["window_sdl2", "window_open_gl", "debug", "rewind", "record_replay", "game_wrapper_tetris"]:
+        assert f"pyboy.plugins.{plugin}" not in modules
+
+
 @pytest.mark.skipif(not kirby_rom, reason="ROM not present")
 def test_tilemaps():
     pyboy = PyBoy(kirby_rom, window_type="dummy")
@@ -170,3 +189,49 @@ def test_tilemaps():
     assert isinstance(wdw_tilemap[0, 0], Tile)
 
     pyboy.stop(save=False)
+
+
+def test_color_code_tables():
+    for byte1 in range(0x100):
+        for byte2 in range(0x100):
+            for x in range(8):
+                assert COLOR_CODE_LOW[byte1*8 + x] | COLOR_CODE_HIGH[byte2*8 + x] == color_code(byte1, byte2, 7 - x)
+
+
+@pytest.mark.parametrize("render_last_only", [True, False])
+def test_tick_frames(render_last_only):
+    results = []
+    for frames in [1, 10]:
+        pyboy = PyBoy(default_rom, window_type="headless")
+        pyboy.set_emulation_speed(0)
+        for _ in range(60 // frames):
+            pyboy.tick(frames, render_last_only)
+        assert pyboy.frame_count == 60
+
+        state = io.BytesIO()
+        pyboy.save_state(state)
+        results.append((state.getvalue(), pyboy.botsupport_manager().screen().raw_screen_buffer()))
+        pyboy.stop(save=False)
+
+    assert results[0] == results[1], "Progressing several frames at once has to give the same result"
+
+
+@pytest.mark.parametrize("dmg", [True, False])
+def test_io_registers(dmg):
+    pyboy = PyBoy(default_rom, window_type="dummy", dmg=dmg)
+    # Plain registers are kept in the I/O RAM, the others by the component owning them
+    for addr, value in [(0xFF01, 0x42), (0xFF43, 0x12), (0xFF06, 0x34), (0xFF0F, 0x03), (0xFF4A, 0x56)]:
+        pyboy.set_memory_value(addr, value)
+        assert pyboy.get_memory_value(addr) == value
+
+    # WRAM banks can only be switched on CGB
+    pyboy.set_memory_value(0xD000, 0x11)
+    pyboy.set_memory_value(0xFF70, 2)
+    pyboy.set_memory_value(0xD000, 0x22)
+    pyboy.set_memory_value(0xFF70, 1)
+    assert pyboy.get_memory_value(0xD000) == (0x22 if dmg else 0x11)
+
+    # KEY1 is a CGB register, and plain memory on DMG
+    pyboy.set_memory_value(0xFF4D, 0x01)
+    assert pyboy.get_memory_value(0xFF4D) == 0x01
+    pyboy.stop(save=False)
@@ -0,0 +1,84 @@
+#
+# License: See LICENSE.md file
+# GitHub: https://github.com/Baekalfen/PyBoy
+#
+
+import os
+import time
+
+import pytest
+from pyboy import PyBoy
+from pyboy.core import cgb_lcd, cgb_renderer, lcd, mb, renderer
+from tests.utils import default_rom
+
+FRAMES = 1000
+ROUNDS = 5
+# Allow for a bit of noise from the rest of the system
+MARGIN = 1.1
+
+compiled = mb.__file__.endswith((".so", ".pyd"))
+# Timings are only comparable on an otherwise idle machine, so the benchmarks are not part of the default run
+benchmark = pytest.mark.skipif(
+    not compiled or not os.environ.get("TEST_BENCHMARK"),
+    reason="Benchmark only applies to the Cython build, and is enabled with TEST_BENCHMARK"
+)
+
+
+def best_of(run):
+    # The best of a few rounds is the least affected by noise
+    best = None
+    for _ in range(ROUNDS):
+        t0 = time.perf_counter()
+        run()
+        t = time.perf_counter() - t0
+        best = t if best is None else min(best, t)
+    return best
+
+
+def run_frames(dmg):
+    pyboy = PyBoy(default_rom, window_type="headless", dmg=dmg)
+    pyboy.set_emulation_speed(0)
+
+    def run():
+        for _ in range(FRAMES):
+            pyboy.tick()
+
+    t = best_of(run)
+    pyboy.stop(save=False)
+    return t
+
+
+def render_frames(cgb):
+    # The same fixed screen on both renderers: The background is shown on every line, and the sprites are scanned
+    if cgb:
+        _renderer = cgb_renderer.CGBRenderer()
+        _lcd = cgb_lcd.cgbLCD(_renderer)
+    else:
+        _renderer = renderer.Renderer((0xFFFFFF, 0x999999, 0x555555, 0x000000))
+        _lcd = lcd.LCD(_renderer)
+    _lcd.LCDC.lcd_enable = True
+    _lcd.LCDC.background_enable = True
+    _lcd.LCDC.sprite_enable = True
+    for y in range(144):
+        _renderer.scanline(y, _lcd)
+
+    def run():
+        for _ in range(FRAMES):
+            _renderer.render_screen(_lcd)
+
+    return best_of(run)
+
+
+@benchmark
+def test_cgb_core_benchmark():
+    # Same ROM on both models, so the CPU runs the same instructions on the DMG and CGB LCD, RAM and MemoryManager
+    dmg_time = run_frames(True)
+    cgb_time = run_frames(False)
+    assert cgb_time <= dmg_time * MARGIN, f"The compiled CGB core takes {cgb_time/dmg_time:.2f} times as long as DMG"
+
+
+@benchmark
+def test_cgb_renderer_benchmark():
+    dmg_time = render_frames(False)
+    cgb_time = render_frames(True)
+    assert cgb_time <= dmg_time * MARGIN, f"The compiled CGB renderer takes {cgb_time/dmg_time:.2f} times as long as DMG"
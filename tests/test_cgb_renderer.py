@@ -0,0 +1,25 @@
+#
+# License: See LICENSE.md file
+# GitHub: https://github.com/Baekalfen/PyBoy
+#
+
+from pyboy import PyBoy
+from tests.utils import make_rom
+
+PROGRAM = [0x18, 0xFE] # JR -2
+
+
+def test_palette_writes(tmp_path):
+    # VRAM is empty, so the whole screen shows color 0 of background palette 0
+    pyboy = PyBoy(make_rom(tmp_path, PROGRAM, cgb=True), window_type="headless")
+    pyboy.set_emulation_speed(0)
+    pyboy.tick()
+
+    for color, pixel in [(0x001F, [0, 0, 248]), (0x03E0, [0, 248, 0]), (0x7C00, [248, 0, 0])]:
+        pyboy.set_memory_value(0xFF68, 0x80) # BCPS: Index 0 with auto-increment
+        pyboy.set_memory_value(0xFF69, color & 0xFF)
+        pyboy.set_memory_value(0xFF69, color >> 8)
+        pyboy.tick()
+        screen = pyboy.botsupport_manager().screen().screen_ndarray()
+        assert (screen == pixel).all(), "The new palette has to be applied to the cached tiles"
+    pyboy.stop(save=False)
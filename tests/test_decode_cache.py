@@ -0,0 +1,45 @@
+#
+# License: See LICENSE.md file
+# GitHub: https://github.com/Baekalfen/PyBoy
+#
+
+from pyboy import PyBoy
+from tests.utils import make_rom
+
+# Copies a subroutine into WRAM, runs it, patches its immediate value and runs it again. Then it loops forever,
+# storing an immediate value from ROM.
+PROGRAM = [
+    0x21, 0x00, 0xC1, # LD HL,0xC100
+    0x36, 0x3E, 0x23, # LD (HL),0x3E ; INC HL   - LD A,0x22
+    0x36, 0x22, 0x23, # LD (HL),0x22 ; INC HL
+    0x36, 0xEA, 0x23, # LD (HL),0xEA ; INC HL   - LD (0xC001),A
+    0x36, 0x01, 0x23, # LD (HL),0x01 ; INC HL
+    0x36, 0xC0, 0x23, # LD (HL),0xC0 ; INC HL
+    0x36, 0xC9, #       LD (HL),0xC9            - RET
+    0xCD, 0x00, 0xC1, # CALL 0xC100
+    0xFA, 0x01, 0xC0, # LD A,(0xC001)
+    0xEA, 0x02, 0xC0, # LD (0xC002),A
+    0x3E, 0x33, #       LD A,0x33
+    0xEA, 0x01, 0xC1, # LD (0xC101),A
+    0xCD, 0x00, 0xC1, # CALL 0xC100
+    0x3E, 0x44, #       LD A,0x44               - loop at 0x0175
+    0xEA, 0x03, 0xC0, # LD (0xC003),A
+    0x18, 0xF9, #       JR loop
+]
+LOOP_IMMEDIATE = 0x0176
+
+
+def test_self_modifying_code(tmp_path):
+    pyboy = PyBoy(make_rom(tmp_path, PROGRAM), window_type="dummy")
+    pyboy.set_emulation_speed(0)
+    for _ in range(5):
+        pyboy.tick()
+
+    assert pyboy.get_memory_value(0xC002) == 0x22, "First run of the subroutine in WRAM"
+    assert pyboy.get_memory_value(0xC001) == 0x33, "The patched subroutine has to be decoded again"
+    assert pyboy.get_memory_value(0xC003) == 0x44
+
+    pyboy.override_memory_value(0, LOOP_IMMEDIATE, 0x55)
+    pyboy.tick()
+    assert pyboy.get_memory_value(0xC003) == 0x55, "Overriding ROM has to invalidate the decoded loop"
+    pyboy.stop(save=False)
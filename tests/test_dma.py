@@ -0,0 +1,43 @@
+#
+# License: See LICENSE.md file
+# GitHub: https://github.com/Baekalfen/PyBoy
+#
+
+import pytest
+from pyboy import PyBoy
+from tests.utils import default_rom
+
+
+@pytest.mark.parametrize("dmg", [True, False])
+def test_oam_dma(dmg):
+    pyboy = PyBoy(default_rom, window_type="dummy", dmg=dmg)
+    for n in range(0xA0):
+        pyboy.set_memory_value(0xC100 + n, n ^ 0x5A)
+    pyboy.set_memory_value(0xFF46, 0xC1)
+    assert [pyboy.get_memory_value(0xFE00 + n) for n in range(0xA0)] == [n ^ 0x5A for n in range(0xA0)]
+
+    # From ROM
+    pyboy.set_memory_value(0xFF46, 0x01)
+    rom = [pyboy.get_memory_value(0x0100 + n) for n in range(0xA0)]
+    assert [pyboy.get_memory_value(0xFE00 + n) for n in range(0xA0)] == rom
+    pyboy.stop(save=False)
+
+
+@pytest.mark.parametrize("bank", [0, 1])
+def test_general_purpose_dma(bank):
+    pyboy = PyBoy(default_rom, window_type="dummy", dmg=False)
+    data = [(n * 7) & 0xFF for n in range(0x300)]
+    for n, value in enumerate(data):
+        pyboy.set_memory_value(0xC0F0 + n, value)
+    pyboy.set_memory_value(0xFF4F, bank)
+    pyboy.set_memory_value(0xFF51, 0xC0) # Source 0xC0F0, crossing pages
+    pyboy.set_memory_value(0xFF52, 0xF0)
+    pyboy.set_memory_value(0xFF53, 0x17) # Destination 0x97C0, crossing into the tile maps
+    pyboy.set_memory_value(0xFF54, 0xC0)
+    pyboy.set_memory_value(0xFF55, 0x2F) # 48 blocks of 16 bytes
+    assert pyboy.get_memory_value(0xFF55) == 0xFF
+
+    assert [pyboy.get_memory_value(0x97C0 + n) for n in range(0x300)] == data
+    pyboy.set_memory_value(0xFF4F, bank ^ 1)
+    assert [pyboy.get_memory_value(0x97C0 + n) for n in range(0x300)] == [0] * 0x300
+    pyboy.stop(save=False)
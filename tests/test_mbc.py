@@ -0,0 +1,80 @@
+#
+# License: See LICENSE.md file
+# GitHub: https://github.com/Baekalfen/PyBoy
+#
+
+import io
+
+import pytest
+from pyboy import PyBoy
+from tests.utils import save_rom
+
+ROM_BANKS = 8
+
+
+def make_rom(path, carttype):
+    # Each ROM bank starts with its own number. 8 ROM banks and 4 RAM banks.
+    rom = bytearray(ROM_BANKS * 0x4000)
+    for bank in range(ROM_BANKS):
+        rom[bank * 0x4000] = bank
+    rom[0x100:0x104] = bytes([0x00, 0xC3, 0x50, 0x01]) # NOP ; JP 0x0150
+    rom[0x147] = carttype
+    rom[0x148] = 0x02
+    rom[0x149] = 0x03
+    return save_rom(path, rom)
+
+
+@pytest.mark.parametrize("carttype", [0x03, 0x13, 0x1B]) # MBC1, MBC3, MBC5 with RAM and battery
+def test_bank_switching(tmp_path, carttype):
+    pyboy = PyBoy(make_rom(tmp_path, carttype), window_type="dummy")
+    pyboy.set_memory_value(0xFF50, 1) # Disable the boot ROM
+    assert pyboy.get_memory_value(0x0000) == 0
+    assert pyboy.get_memory_value(0x4000) == 1
+
+    for bank in range(1, ROM_BANKS):
+        pyboy.set_memory_value(0x2000, bank)
+        assert pyboy.get_memory_value(0x4000) == bank
+        assert pyboy.get_memory_value(0x0000) == 0
+
+    assert pyboy.get_memory_value(0xA000) == 0xFF, "RAM is disabled"
+    pyboy.set_memory_value(0x0000, 0x0A)
+    if carttype == 0x03:
+        pyboy.set_memory_value(0x6000, 1) # RAM banking mode
+    for bank in range(4):
+        pyboy.set_memory_value(0x4000, bank)
+        pyboy.set_memory_value(0xA000, 0x10 + bank)
+    for bank in range(4):
+        pyboy.set_memory_value(0x4000, bank)
+        assert pyboy.get_memory_value(0xA000) == 0x10 + bank
+
+    state = io.BytesIO()
+    pyboy.save_state(state)
+    pyboy.set_memory_value(0x2000, 1)
+    pyboy.set_memory_value(0x4000, 0)
+    state.seek(0)
+    pyboy.load_state(state)
+    assert pyboy.get_memory_value(0x4000) == ROM_BANKS - 1
+    assert pyboy.get_memory_value(0xA000) == 0x13
+
+    pyboy.set_memory_value(0x0000, 0x00)
+    assert pyboy.get_memory_value(0xA000) == 0xFF, "RAM is disabled"
+    pyboy.stop(save=False)
+
+
+def test_override_is_private(tmp_path):
+    rom_file = make_rom(tmp_path, 0x03)
+    with open(rom_file, "rb") as f:
+        rom = f.read()
+    pyboy1 = PyBoy(rom_file, window_type="dummy")
+    pyboy2 = PyBoy(rom_file, window_type="dummy")
+    pyboy1.set_memory_value(0xFF50, 1)
+    pyboy2.set_memory_value(0xFF50, 1)
+
+    pyboy1.override_memory_value(0, 0x0000, 0xAB)
+    assert pyboy1.get_memory_value(0x0000) == 0xAB
+    assert pyboy2.get_memory_value(0x0000) == 0x00, "Overrides are not shared between instances"
+    with open(rom_file, "rb") as f:
+        assert f.read() == rom, "The ROM file is never written"
+
+    pyboy1.stop(save=False)
+    pyboy2.stop(save=False)
@@ -0,0 +1,32 @@
+#
+# License: See LICENSE.md file
+# GitHub: https://github.com/Baekalfen/PyBoy
+#
+
+import pytest
+from pyboy import PyBoy
+from pyboy.core import mb, numpy_renderer
+from tests.utils import default_rom
+
+compiled = mb.__file__.endswith((".so", ".pyd"))
+
+
+@pytest.mark.skipif(compiled or not numpy_renderer.numpy_enabled, reason="NumPy is only used without Cython")
+@pytest.mark.parametrize("dmg", [True, False])
+def test_numpy_renderer(dmg):
+    screens = []
+    for use_numpy in [True, False]:
+        pyboy = PyBoy(default_rom, window_type="headless", dmg=dmg)
+        pyboy.set_emulation_speed(0)
+        assert pyboy.mb.renderer.numpy_backend is not None
+        if not use_numpy:
+            pyboy.mb.renderer.numpy_backend = None
+
+        frames = []
+        for _ in range(60):
+            pyboy.tick()
+            frames.append(bytes(pyboy.botsupport_manager().screen().raw_screen_buffer()))
+        screens.append(frames)
+        pyboy.stop(save=False)
+
+    assert screens[0] == screens[1], "The NumPy renderer has to be pixel for pixel the same"
@@ -0,0 +1,79 @@
+#
+# License: See LICENSE.md file
+# GitHub: https://github.com/Baekalfen/PyBoy
+#
+
+import pytest
+from pyboy import PyBoy
+from tests.utils import default_rom, make_rom
+
+
+def test_palette_writes():
+    pyboy = PyBoy(default_rom, window_type="headless", dmg=True)
+    pyboy.set_emulation_speed(0)
+    for _ in range(60):
+        pyboy.tick()
+
+    for palette, pixel in [(0xFF, [0, 0, 0]), (0x00, [255, 255, 255])]:
+        # All four color codes of BGP, OBP0 and OBP1 map to the same shade
+        for address in [0xFF47, 0xFF48, 0xFF49]:
+            pyboy.set_memory_value(address, palette)
+        pyboy.tick()
+        screen = pyboy.botsupport_manager().screen().screen_ndarray()
+        assert (screen == pixel).all(), "The new palette has to be applied to the cached tiles"
+    pyboy.stop(save=False)
+
+
+PROGRAM = [0x18, 0xFE] # JR -2
+
+
+@pytest.mark.parametrize("cgb", [False, True])
+def test_sprites_per_line(tmp_path, cgb):
+    pyboy = PyBoy(make_rom(tmp_path, PROGRAM, cgb), window_type="headless")
+    pyboy.set_emulation_speed(0)
+    pyboy.tick()
+
+    if cgb:
+        # Make the background white, to tell it apart from the sprites
+        pyboy.set_memory_value(0xFF68, 0x80) # BCPS: Index 0 with auto-increment
+        pyboy.set_memory_value(0xFF69, 0xFF)
+        pyboy.set_memory_value(0xFF69, 0x7F)
+
+    # Tile 1 is filled with color code 3, and 12 sprites are placed next to each other on the first 8 scanlines
+    for i in range(16):
+        pyboy.set_memory_value(0x8010 + i, 0xFF)
+    for n in range(12):
+        for i, value in enumerate([16, 8 + 12*n, 1, 0]):
+            pyboy.set_memory_value(0xFE00 + 4*n + i, value)
+    pyboy.set_memory_value(0xFF40, pyboy.get_memory_value(0xFF40) | 0b10) # Enable sprites
+    pyboy.tick()
+
+    screen = pyboy.botsupport_manager().screen().screen_ndarray()
+    # The background is blank, so anything else is a sprite
+    sprites = (screen != screen[-1, -1]).any(axis=2)
+    assert (sprites[:8].sum(axis=1) == 10 * 8).all(), "Only the first 10 sprites are shown on each scanline"
+    assert not sprites[:8, 10 * 12:].any()
+    assert not sprites[8:].any()
+    pyboy.stop(save=False)
+
+
+@pytest.mark.parametrize("frameskip, lazy", [(3, False), (0, True)])
+def test_frameskip(frameskip, lazy):
+    screens = []
+    for skip in [False, True]:
+        pyboy = PyBoy(default_rom, window_type="headless", dmg=True)
+        pyboy.set_emulation_speed(0)
+        if skip:
+            pyboy.set_frameskip(frameskip, lazy)
+
+        frames = []
+        for frame in range(120):
+            pyboy.tick()
+            # Read the screen only every fourth frame, which is the last of the skipped frames
+            if frame % 4 == 3:
+                frames.append(pyboy.botsupport_manager().screen().raw_screen_buffer())
+        screens.append(frames)
+        pyboy.stop(save=False)
+
+    assert len(set(screens[0])) > 1
+    assert screens[0] == screens[1], "Skipped frames have to be rendered, when the screen is read"
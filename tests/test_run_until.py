@@ -0,0 +1,172 @@
+#
+# License: See LICENSE.md file
+# GitHub: https://github.com/Baekalfen/PyBoy
+#
+
+import io
+
+import pytest
+from pyboy import PyBoy
+from tests.utils import default_rom, make_rom
+
+# Stores a value in WRAM, writes a byte to the serial port and loops forever
+PROGRAM = [
+    0x3E, 0x42, #       LD A,0x42
+    0xEA, 0x00, 0xC0, # LD (0xC000),A
+    0x3E, 0x50, #       LD A,'P'
+    0xE0, 0x01, #       LDH (0x01),A            - serial data
+    0x18, 0xFE, #       JR -2                   - loop at 0x0159
+]
+LOOP = 0x0159
+
+
+@pytest.mark.parametrize("dmg", [True, False])
+def test_conditions(tmp_path, dmg):
+    pyboy = PyBoy(make_rom(tmp_path, PROGRAM), window_type="dummy", dmg=dmg)
+    pyboy.set_emulation_speed(0)
+
+    assert pyboy.run_until(pc=0x0150, bank=0)[0] == "pc", "The boot ROM has to hand over to the game"
+    assert pyboy.run_until(address=0xC000)[0] == "address"
+    assert pyboy.get_memory_value(0xC000) == 0x42
+    assert pyboy.run_until(serial=True)[0] == "serial"
+    assert pyboy._serial() == "P"
+    assert pyboy.run_until(pc=LOOP)[0] == "pc"
+
+    condition, cycles = pyboy.run_until(cycles=1000)
+    assert condition == "cycles"
+    assert 1000 <= cycles < 1100
+
+    assert pyboy.run_until(scanline=100)[0] == "scanline"
+    assert pyboy.get_memory_value(0xFF44) == 100
+    assert pyboy.run_until(vblank=True)[0] == "vblank"
+    assert pyboy.get_memory_value(0xFF44) == 144
+    assert pyboy.run_until(scanline=0)[0] == "scanline"
+    assert pyboy.get_memory_value(0xFF44) == 0
+    assert pyboy.run_until(address=0xC000, value=0x00, cycles=70224) == ("cycles", 70224)
+    pyboy.stop(save=False)
+
+
+def test_resume_frame():
+    # Stopping in the middle of a frame must not change the emulation
+    results = []
+    for stop in [False, True]:
+        pyboy = PyBoy(default_rom, window_type="headless")
+        pyboy.set_emulation_speed(0)
+        for _ in range(30):
+            pyboy.tick()
+        if stop:
+            pyboy.run_until(scanline=50)
+            pyboy.run_until(cycles=1234)
+        for _ in range(30):
+            pyboy.tick()
+
+        state = io.BytesIO()
+        pyboy.save_state(state)
+        results.append((state.getvalue(), pyboy.botsupport_manager().screen().raw_screen_buffer()))
+        pyboy.stop(save=False)
+
+    assert results[0] == results[1]
+
+
+def test_snapshot_mid_frame():
+    # A snapshot taken in the middle of a frame has to continue from the same position in the frame
+    pyboy = PyBoy(default_rom, window_type="headless")
+    pyboy.set_emulation_speed(0)
+    for _ in range(30):
+        pyboy.tick()
+    assert pyboy.run_until(scanline=70)[0] == "scanline"
+    snapshot = pyboy.snapshot()
+
+    results = []
+    for _ in range(2):
+        for _ in range(20):
+            pyboy.tick()
+        state = io.BytesIO()
+        pyboy.save_state(state)
+        results.append((state.getvalue(), pyboy.botsupport_manager().screen().raw_screen_buffer()))
+        pyboy.restore(snapshot)
+    pyboy.stop(save=False)
+
+    assert results[0] == results[1]
+
+
+def test_snapshot_mid_frame_lcdc(tmp_path):
+    # The lines already drawn in a snapshot have to keep the LCDC of when they were drawn, also in another instance
+    rom = make_rom(tmp_path, [0x18, 0xFE]) # JR -2
+    pyboy = PyBoy(rom, window_type="headless")
+    pyboy.set_emulation_speed(0)
+    pyboy.tick()
+    for addr in range(0x8010, 0x8020):
+        pyboy.set_memory_value(addr, 0xFF) # Tile 1 is black
+    for addr in range(0x9800, 0x9C00):
+        pyboy.set_memory_value(addr, 0)
+        pyboy.set_memory_value(addr + 0x400, 1)
+
+    lcdc = pyboy.get_memory_value(0xFF40)
+    pyboy.set_memory_value(0xFF40, lcdc | 0x08) # Background map at 0x9C00
+    assert pyboy.run_until(scanline=0)[0] == "scanline"
+    assert pyboy.run_until(scanline=72)[0] == "scanline"
+    pyboy.set_memory_value(0xFF40, lcdc & ~0x08) # Background map at 0x9800 for the rest of the frame
+    snapshot = pyboy.snapshot()
+    pyboy.tick()
+    expected = bytes(pyboy.botsupport_manager().screen().raw_screen_buffer())
+    pyboy.stop(save=False)
+
+    pyboy = PyBoy(rom, window_type="headless")
+    pyboy.set_emulation_speed(0)
+    pyboy.tick()
+    pyboy.restore(snapshot)
+    pyboy.tick()
+    assert bytes(pyboy.botsupport_manager().screen().raw_screen_buffer()) == expected
+    pyboy.stop(save=False)
+
+
+# Counts frames by polling LY
+LY_PROGRAM = [
+    0x21, 0x00, 0xC0, # LD HL,0xC000
+    0xF0, 0x44, #       LDH A,(0x44)            - wait for LY 144 at 0x0153
+    0xFE, 0x90, #       CP 0x90
+    0x20, 0xFA, #       JR NZ,-6
+    0x34, #             INC (HL)
+    0xF0, 0x44, #       LDH A,(0x44)            - wait for LY to leave 144
+    0xFE, 0x90, #       CP 0x90
+    0x28, 0xFA, #       JR Z,-6
+    0x18, 0xF1, #       JR -15
+]
+
+# Turns off the LCD, and counts overflows of DIV by polling it
+DIV_PROGRAM = [
+    0xAF, #             XOR A
+    0xE0, 0x40, #       LDH (0x40),A
+    0x21, 0x00, 0xC0, # LD HL,0xC000
+    0xF0, 0x04, #       LDH A,(0x04)            - wait for DIV 0x80 at 0x0156
+    0xFE, 0x80, #       CP 0x80
+    0x20, 0xFA, #       JR NZ,-6
+    0x34, #             INC (HL)
+    0xF0, 0x04, #       LDH A,(0x04)            - wait for DIV to leave 0x80
+    0xFE, 0x80, #       CP 0x80
+    0x28, 0xFA, #       JR Z,-6
+    0x18, 0xF1, #       JR -15
+]
+
+
+@pytest.mark.parametrize("program", [LY_PROGRAM, DIV_PROGRAM])
+def test_idle_loops(tmp_path, program):
+    # Polling loops are skipped, when running to the next event. Stepping through every instruction has to give the
+    # same result.
+    rom_file = make_rom(tmp_path, program)
+    results = []
+    for step in [False, True]:
+        pyboy = PyBoy(rom_file, window_type="dummy")
+        pyboy.set_emulation_speed(0)
+        pyboy.run_until(pc=0x0150)
+        # Stepping is forced by watching the serial port, which the program never writes
+        assert pyboy.run_until(cycles=20 * 70224, serial=step)[0] == "cycles"
+        assert pyboy.get_memory_value(0xC000) > 5
+
+        state = io.BytesIO()
+        pyboy.save_state(state)
+        results.append(state.getvalue())
+        pyboy.stop(save=False)
+
+    assert results[0] == results[1]
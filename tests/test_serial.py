@@ -0,0 +1,35 @@
+#
+# License: See LICENSE.md file
+# GitHub: https://github.com/Baekalfen/PyBoy
+#
+
+from pyboy import PyBoy
+from tests.utils import make_rom
+
+# Sends a byte with the internal clock, and waits for the transfer to complete
+PROGRAM = [
+    0x3E, 0x42, #       LD A,0x42
+    0xE0, 0x01, #       LDH (SB),A
+    0x3E, 0x81, #       LD A,0x81
+    0xE0, 0x02, #       LDH (SC),A
+    0xF0, 0x02, #       LDH A,(SC)              - wait at 0x0158
+    0xE6, 0x80, #       AND 0x80
+    0x20, 0xFA, #       JR NZ,wait
+    0xF0, 0x01, #       LDH A,(SB)
+    0xEA, 0x00, 0xC0, # LD (0xC000),A
+    0xF0, 0x0F, #       LDH A,(IF)
+    0xEA, 0x01, 0xC0, # LD (0xC001),A
+    0x18, 0xFE, #       JR $
+]
+
+
+def test_serial_transfer(tmp_path):
+    pyboy = PyBoy(make_rom(tmp_path, PROGRAM), window_type="dummy")
+    pyboy.set_emulation_speed(0)
+    for _ in range(5):
+        pyboy.tick()
+
+    assert pyboy._serial() == "B"
+    assert pyboy.get_memory_value(0xC000) == 0xFF, "Nothing is connected, so only 1's are received"
+    assert pyboy.get_memory_value(0xC001) & 0b1000, "Serial interrupt has to be requested"
+    pyboy.stop(save=False)
@@ -0,0 +1,63 @@
+#
+# License: See LICENSE.md file
+# GitHub: https://github.com/Baekalfen/PyBoy
+#
+
+import subprocess
+import sys
+import wave
+
+import numpy as np
+from pyboy import PyBoy
+from pyboy.core.sound_sink import SAMPLE_RATE, RingBufferSink, WaveFileSink
+
+from tests.utils import default_rom
+
+FRAMES = 60
+
+
+def test_no_sound():
+    # SDL2 isn't loaded, when sound is disabled. A new interpreter is needed, as other tests import SDL2.
+    code = (
+        "import sys; from pyboy import PyBoy; "
+        f"pyboy = PyBoy({default_rom!r}, window_type='headless'); "
+        "[pyboy.tick() for _ in range(60)]; "
+        "print('sdl2' in sys.modules)"
+    )
+    out = subprocess.run([sys.executable, "-c", code], capture_output=True, text=True, check=True).stdout
+    assert out.splitlines()[-1] == "False"
+
+
+def test_ring_buffer_sink():
+    sink = RingBufferSink(length=1000)
+    pyboy = PyBoy(default_rom, window_type="dummy", sound=sink)
+    pyboy.set_emulation_speed(0)
+    for _ in range(FRAMES):
+        pyboy.tick()
+    pyboy.stop(save=False)
+
+    # A frame is 1/60 of a second. The first frame might be partial.
+    assert abs(sink.position - SAMPLE_RATE) < SAMPLE_RATE // 30
+    assert sink.samples().shape == (1000, 2)
+
+    # Wrapping around the end of the buffer
+    sink = RingBufferSink(length=4)
+    sink.write(np.arange(6, dtype=np.int8).tobytes(), 6)
+    sink.write(np.arange(6, 12, dtype=np.int8).tobytes(), 6)
+    assert sink.position == 6
+    assert sink.samples().tolist() == [[4, 5], [6, 7], [8, 9], [10, 11]]
+
+
+def test_wave_file_sink(tmp_path):
+    filename = str(tmp_path / "sound.wav")
+    pyboy = PyBoy(default_rom, window_type="dummy", sound=WaveFileSink(filename))
+    pyboy.set_emulation_speed(0)
+    for _ in range(FRAMES):
+        pyboy.tick()
+    pyboy.stop(save=False)
+
+    with wave.open(filename, "rb") as f:
+        assert f.getnchannels() == 2
+        assert f.getsampwidth() == 1
+        assert f.getframerate() == SAMPLE_RATE
+        assert abs(f.getnframes() - SAMPLE_RATE) < SAMPLE_RATE // 30
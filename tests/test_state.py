@@ -0,0 +1,189 @@
+#
+# License: See LICENSE.md file
+# GitHub: https://github.com/Baekalfen/PyBoy
+#
+
+import io
+import os
+
+import pytest
+from pyboy import PyBoy
+from tests.utils import default_rom, make_rom
+
+
+def memory(pyboy):
+    # HDMA1-HDMA4 can't be read on CGB
+    return [pyboy.get_memory_value(addr) for addr in range(0x8000, 0x10000) if not 0xFF51 <= addr <= 0xFF54]
+
+
+@pytest.mark.parametrize("dmg", [True, False])
+def test_state_roundtrip(dmg):
+    pyboy = PyBoy(default_rom, window_type="headless", dmg=dmg)
+    pyboy.set_emulation_speed(0)
+    for _ in range(60):
+        pyboy.tick()
+
+    state = io.BytesIO()
+    pyboy.save_state(state)
+    before = memory(pyboy)
+
+    for _ in range(60):
+        pyboy.tick()
+    state.seek(0)
+    pyboy.load_state(state)
+    assert state.tell() == len(state.getvalue()), "The whole state has to be read back"
+    assert memory(pyboy) == before
+
+    resaved = io.BytesIO()
+    pyboy.save_state(resaved)
+    assert resaved.getvalue() == state.getvalue()
+    pyboy.stop(save=False)
+
+
+def test_interrupt_registers():
+    # IF and IE are held by the CPU, but are part of the memory map and the saved state
+    pyboy = PyBoy(default_rom, window_type="dummy")
+    pyboy.set_memory_value(0xFF0F, 0x0A)
+    pyboy.set_memory_value(0xFFFF, 0x15)
+    assert pyboy.get_memory_value(0xFF0F) == 0x0A
+    assert pyboy.get_memory_value(0xFFFF) == 0x15
+
+    state = io.BytesIO()
+    pyboy.save_state(state)
+    pyboy.set_memory_value(0xFF0F, 0x00)
+    pyboy.set_memory_value(0xFFFF, 0x00)
+    state.seek(0)
+    pyboy.load_state(state)
+    assert pyboy.get_memory_value(0xFF0F) == 0x0A
+    assert pyboy.get_memory_value(0xFFFF) == 0x15
+    pyboy.stop(save=False)
+
+
+def test_wram_banks():
+    # The switchable WRAM bank is selected by SVBK on CGB and is restored with the state
+    pyboy = PyBoy(default_rom, window_type="dummy", dmg=False)
+    for bank in range(1, 8):
+        pyboy.set_memory_value(0xFF70, bank)
+        pyboy.set_memory_value(0xD010, bank * 0x10)
+    pyboy.set_memory_value(0xFF70, 0)
+    assert pyboy.get_memory_value(0xD010) == 0x10
+    pyboy.set_memory_value(0xFF70, 5)
+    assert pyboy.get_memory_value(0xD010) == 0x50
+    assert pyboy.get_memory_value(0xF010) == 0x50, "Echo RAM follows the active bank"
+
+    state = io.BytesIO()
+    pyboy.save_state(state)
+    pyboy.set_memory_value(0xFF70, 2)
+    assert pyboy.get_memory_value(0xD010) == 0x20
+    state.seek(0)
+    pyboy.load_state(state)
+    assert pyboy.get_memory_value(0xD010) == 0x50
+    pyboy.stop(save=False)
+
+
+def trajectory(pyboy, frames):
+    screens = []
+    for _ in range(frames):
+        pyboy.tick()
+        screens.append(bytes(pyboy.botsupport_manager().screen().raw_screen_buffer()))
+    return screens, memory(pyboy)
+
+
+@pytest.mark.parametrize("dmg", [True, False])
+def test_snapshot_restore(dmg):
+    pyboy = PyBoy(default_rom, window_type="headless", dmg=dmg)
+    pyboy.set_emulation_speed(0)
+    for _ in range(30):
+        pyboy.tick()
+
+    snapshot = pyboy.snapshot()
+    screen = bytes(pyboy.botsupport_manager().screen().raw_screen_buffer())
+    expected = trajectory(pyboy, 20)
+
+    # The same snapshot can be restored many times, and continues exactly like the first time
+    for _ in range(2):
+        pyboy.restore(snapshot)
+        assert bytes(pyboy.botsupport_manager().screen().raw_screen_buffer()) == screen
+        assert trajectory(pyboy, 20) == expected
+    pyboy.stop(save=False)
+
+
+def test_cgb_snapshot_restore(tmp_path):
+    # VRAM bank 1, the color palettes and the CGB registers are part of the snapshot
+    pyboy = PyBoy(make_rom(tmp_path, [0x18, 0xFE], cgb=True), window_type="headless") # JR -2
+    pyboy.set_emulation_speed(0)
+    pyboy.tick()
+
+    pyboy.set_memory_value(0xFF4F, 1) # VBK
+    pyboy.set_memory_value(0x8000, 0xAA)
+    pyboy.set_memory_value(0xFF68, 0x80) # BCPS: Index 0 with auto-increment
+    pyboy.set_memory_value(0xFF69, 0x12)
+    pyboy.set_memory_value(0xFF4D, 0x01) # KEY1: Prepare speed switch
+    snapshot = pyboy.snapshot()
+
+    pyboy.set_memory_value(0x8000, 0x55)
+    pyboy.set_memory_value(0xFF68, 0x80)
+    pyboy.set_memory_value(0xFF69, 0x34)
+    pyboy.set_memory_value(0xFF4F, 0)
+    pyboy.set_memory_value(0xFF4D, 0x00)
+    pyboy.tick()
+
+    pyboy.restore(snapshot)
+    assert pyboy.get_memory_value(0xFF4F) == 0xFF
+    assert pyboy.get_memory_value(0x8000) == 0xAA
+    assert pyboy.get_memory_value(0xFF68) == 0xC1, "BCPS has auto-incremented to the high byte"
+    pyboy.set_memory_value(0xFF68, 0x00)
+    assert pyboy.get_memory_value(0xFF69) == 0x12
+    assert pyboy.get_memory_value(0xFF4D) == 0x01
+    pyboy.stop(save=False)
+
+
+def pages(snapshot):
+    return [page for buf in snapshot.buffers for page in buf]
+
+
+@pytest.mark.parametrize("dmg", [True, False])
+def test_snapshot_shares_pages(dmg):
+    pyboy = PyBoy(default_rom, window_type="headless", dmg=dmg)
+    pyboy.set_emulation_speed(0)
+    for _ in range(30):
+        pyboy.tick()
+    root = pyboy.snapshot()
+
+    # Nothing has changed, so every page is shared
+    assert all(a is b for a, b in zip(pages(pyboy.snapshot()), pages(root)))
+
+    # Siblings branching off the root only keep the pages, that are different from the root
+    siblings = []
+    for frames in (1, 10):
+        pyboy.restore(root)
+        for _ in range(frames):
+            pyboy.tick()
+        pyboy.set_memory_value(0xC000, frames)
+        siblings.append(pyboy.snapshot())
+
+    for sibling in siblings:
+        assert len(pages(sibling)) == len(pages(root))
+        for a, b in zip(pages(sibling), pages(root)):
+            assert (a is b) == (a == b)
+        assert any(a is not b for a, b in zip(pages(sibling), pages(root)))
+        pyboy.restore(sibling)
+        assert pyboy.snapshot().buffers == sibling.buffers
+    pyboy.stop(save=False)
+
+
+@pytest.mark.parametrize("dmg", [True, False])
+def test_boot_cache(tmp_path, dmg):
+    # The first start runs the boot ROM and caches the state after it. The second one restores it instead.
+    states = []
+    for _ in range(2):
+        pyboy = PyBoy(default_rom, window_type="dummy", dmg=dmg, boot_cache=str(tmp_path))
+        pyboy.set_emulation_speed(0)
+        assert pyboy.get_memory_value(0xFF50) != 0, "The boot ROM has handed over to the cartridge"
+        assert len(os.listdir(tmp_path)) == 1
+        pyboy.tick(60)
+        state = io.BytesIO()
+        pyboy.save_state(state)
+        states.append(state.getvalue())
+        pyboy.stop(save=False)
+    assert states[0] == states[1]
@@ -45,6 +45,27 @@ def locate_roms(path="ROMs/"):
     return entries
 
 
+def save_rom(path, rom, cgb=False):
+    # Sets the CGB flag and the header checksum, which the boot ROM checks before handing over to the cartridge
+    rom[0x143] = 0x80 if cgb else 0x00
+    checksum = 0
+    for i in range(0x134, 0x14D):
+        checksum = (checksum - rom[i] - 1) & 0xFF
+    rom[0x14D] = checksum
+    rom_file = str(path / ("test.gbc" if cgb else "test.gb"))
+    with open(rom_file, "wb") as f:
+        f.write(rom)
+    return rom_file
+
+
+def make_rom(path, program, cgb=False):
+    # A cartridge, which runs the program from 0x0150
+    rom = bytearray(0x8000)
+    rom[0x100:0x104] = bytes([0x00, 0xC3, 0x50, 0x01]) # NOP ; JP 0x0150
+    rom[0x150:0x150 + len(program)] = bytes(program)
+    return save_rom(path, rom, cgb)
+
+
 def locate_sha256(entries, digest):
     digest_bytes = bytes.fromhex(digest.decode("ASCII"))
     return next(filter(lambda kv: kv[1] == digest_bytes, entries.items()), [None])[0]